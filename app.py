@@ -3,14 +3,257 @@ CareerCompass: SHPE Opportunity Analyzer
 Fully integrated Streamlit app with backend ML/scraping functionality
 """
 
+import os
+import threading
+import time
+
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
-from collections import Counter
 
 # Import your backend functions
-from src.scraper import scrape_all_job_data
-from src.nlp_processor import get_skill_counts, compare_skills, read_pdf_text, extract_skills
+from src.scraper import iter_job_data
+from src.nlp_processor import iter_extracted, SkillAggregator
+from src.analysis_cache import analyze_resume, match_resume
+from src.job_store import JobStore
+from src.job_index import JobIndex
+from src.job_collection import JobCollection
+from src.snapshot import load_latest_snapshot
+from src.refresher import SnapshotRefresher
+from src.skill_trends import SkillTrends, WINDOWS
+from src.skill_taxonomy import get_default_taxonomy
+from src.instrumentation import span, profile, is_enabled, write_metrics, serve_prometheus
+
+# Shared by every user session; the "Refresh data" button clears them early
+CACHE_TTL_SECONDS = 30 * 60
+
+# Rebuild the data in a background thread (every CACHE_TTL_SECONDS, with jitter) instead of
+# scraping inside page renders. CAREERCOMPASS_BACKGROUND_REFRESH=0 turns it off.
+BACKGROUND_REFRESH = os.environ.get('CAREERCOMPASS_BACKGROUND_REFRESH', '1') != '0'
+
+# Instrumentation (only used when CAREERCOMPASS_METRICS=1)
+METRICS_FILE = os.environ.get('CAREERCOMPASS_METRICS_FILE', os.path.join('data', 'metrics.json'))
+METRICS_PORT = os.environ.get('CAREERCOMPASS_METRICS_PORT')
+
+
+@st.cache_resource
+def start_metrics_server(port):
+    """Prometheus endpoint, started once per server process."""
+    return serve_prometheus(port)
+
+
+@st.cache_resource
+def get_job_store():
+    """One JobStore (SQLite connection) for the whole server."""
+    return JobStore()
+
+
+@st.cache_resource
+def get_refresher():
+    """The background refresher, started once for the whole server."""
+    return SnapshotRefresher(interval_seconds=CACHE_TTL_SECONDS).start()
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def load_snapshot():
+    """The latest precomputed snapshot on disk (written by `python -m src.snapshot`), memory-mapped."""
+    return load_latest_snapshot()
+
+
+def get_snapshot():
+    """
+    The snapshot page renders read: the background refresher's latest one
+    (or, with background refresh off, the newest on disk).
+    None if there is none yet; without background refresh, postings are then
+    scraped and analyzed here instead.
+    """
+    if BACKGROUND_REFRESH:
+        return get_refresher().snapshot
+    return load_snapshot()
+
+
+def data_ready():
+    """False (after telling the user why) while the first background refresh is still running."""
+    if not BACKGROUND_REFRESH or get_snapshot() is not None:
+        return True
+    st.info("⏳ Job postings are being collected in the background. "
+            "This only happens on the first start - try again in a minute.")
+    if get_refresher().last_error:
+        st.warning(f"The last refresh failed ({get_refresher().last_error}); retrying on schedule.")
+    return False
+
+
+@st.cache_resource
+def get_job_feed():
+    """
+    The current job postings, shared by every session (scraped at most once per TTL).
+    Every session reads the same compact JobCollection instead of its own copy.
+    """
+    return {'jobs': None, 'loaded_at': 0.0, 'lock': threading.Lock()}
+
+
+def jobs_are_cached():
+    if get_snapshot() is not None:
+        return True
+    feed = get_job_feed()
+    return feed['jobs'] is not None and time.time() - feed['loaded_at'] < CACHE_TTL_SECONDS
+
+
+def stream_jobs():
+    """
+    Yields the current postings: from the shared cache, or straight from the
+    scrapers as they are parsed (filling the cache for everyone else).
+    """
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        yield from snapshot.jobs
+        return
+    
+    feed = get_job_feed()
+    if not jobs_are_cached():
+        with feed['lock']:  # only one session scrapes; the others wait for its result
+            if not jobs_are_cached():
+                jobs = []
+                for job in iter_job_data(use_test_data=True):
+                    jobs.append(job)
+                    yield job
+                feed['jobs'], feed['loaded_at'] = JobCollection.from_records(jobs), time.time()
+                return
+    yield from feed['jobs']
+
+
+def load_jobs():
+    """The current job postings (a JobCollection)."""
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        return snapshot.jobs
+    if not jobs_are_cached():
+        for _ in stream_jobs():
+            pass
+    return get_job_feed()['jobs']
+
+
+def get_job_index():
+    """Skills of every current posting, indexed once so any resume can be ranked against all of them."""
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        return snapshot.job_index()  # built once per snapshot
+    return build_job_index()
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def build_job_index():
+    return JobIndex(load_jobs())
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def refresh_job_store():
+    """Adds the current postings to the store (only new ones get analyzed)."""
+    return get_job_store().ingest(load_jobs())
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def load_skill_aggregates(store_version, feed_loaded_at):
+    """
+    Global and per-company skill counts of the current postings (the same ones
+    the page says it analyzed), read from the store without re-extracting.
+    The store version and feed time are the cache key, so new, expired or
+    reopened postings and a new scrape invalidate it.
+    """
+    store = get_job_store()
+    jobs = load_jobs()
+    return store.skill_counts(postings=jobs), store.company_skill_counts(postings=jobs)
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def load_skill_trends(store_version):
+    """Day/company skill buckets from the store (`store_version` is part of the cache key)."""
+    return SkillTrends.from_store(get_job_store())
+
+
+def get_skill_trends():
+    """Makes sure the store is up to date (unless a snapshot did that), then returns the trends."""
+    if get_snapshot() is None:
+        refresh_job_store()
+    return load_skill_trends(get_job_store().version)
+
+
+def refresh_data():
+    """
+    With background refresh: ask the refresher for a new snapshot (this render doesn't wait for it).
+    Without: drop every cached result so the next render reloads (or scrapes and analyzes) again.
+    """
+    if BACKGROUND_REFRESH:
+        get_refresher().request_refresh()
+        return
+    load_snapshot.clear()
+    load_skill_trends.clear()
+    get_job_feed()['jobs'] = None
+    build_job_index.clear()
+    refresh_job_store.clear()
+    load_skill_aggregates.clear()
+
+
+def get_skill_aggregates():
+    """Makes sure the store is up to date, then returns the (cached) aggregates."""
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        return snapshot.skill_counts(), snapshot.company_skill_counts()
+    refresh_job_store()
+    return load_skill_aggregates(get_job_store().version, get_job_feed()['loaded_at'])
+
+
+def stream_analysis(every=25):
+    """
+    Scrape -> extract -> aggregate as a stream, storing postings as they come.
+    Yields the running SkillAggregator every `every` jobs so the page can show
+    partial results while the scrapers are still going.
+    """
+    store = get_job_store()
+    aggregator = SkillAggregator()
+    pending = []
+    
+    def extracted():
+        for job, skills in iter_extracted(stream_jobs()):
+            pending.append((job, skills))
+            yield job, skills
+    
+    for partial_result in aggregator.consume(extracted(), every=every):
+        store.ingest([job for job, _ in pending], [skills for _, skills in pending])
+        pending.clear()
+        yield partial_result
+
+
+def skills_chart(top_skills, top_n):
+    """Horizontal bar chart of (skill, count) pairs, highest at the top."""
+    skills = [s[0].title() for s in top_skills]
+    counts = [s[1] for s in top_skills]
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            y=skills[::-1],  # Reverse to show highest at top
+            x=counts[::-1],
+            orientation='h',
+            marker=dict(
+                color=counts[::-1],
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title="Count")
+            ),
+            text=counts[::-1],
+            textposition='auto',
+        )
+    ])
+    
+    fig.update_layout(
+        title=f"Top {top_n} In-Demand Skills Across SHPE Sponsor Companies",
+        xaxis_title="Number of Job Postings Mentioning Skill",
+        yaxis_title="Technical Skill",
+        height=600,
+        showlegend=False,
+        hovermode='y'
+    )
+    return fig
+
 
 def main():
     """Main function to run the Streamlit app."""
@@ -39,9 +282,37 @@ def main():
         "**CareerCompass** helps SHPE members understand what skills "
         "are in demand and how their resume matches job opportunities."
     )
+    
+    if st.sidebar.button("🔄 Refresh data", help=f"Job data is refreshed every {CACHE_TTL_SECONDS // 60} minutes"):
+        refresh_data()
+        if BACKGROUND_REFRESH:
+            st.sidebar.success("Refreshing in the background - new data shows up when it's ready.")
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        st.sidebar.caption(f"Job data updated {(time.time() - snapshot.created_at) / 60:.0f} minutes ago")
 
     # --- Page Content ---
     
+    # With metrics on, add ?profile=1 (or ?profile=pyinstrument) to the URL to profile one render
+    profile_engine = st.query_params.get('profile')
+    with span('page_render', page=page_selection), \
+            profile(engine='pyinstrument' if profile_engine == 'pyinstrument' else 'cprofile',
+                    active=bool(profile_engine) and is_enabled()) as prof:
+        render_page(page_selection)
+    
+    if prof.report:
+        with st.expander("⏱️ Profile of this page render"):
+            st.code(prof.report)
+    
+    if is_enabled():
+        write_metrics(METRICS_FILE)
+        if METRICS_PORT:
+            start_metrics_server(int(METRICS_PORT))
+
+
+def render_page(page_selection):
+    """Draws the content of the selected page."""
+    
     # HOME PAGE
     if page_selection == "🏠 Home":
         st.title("Welcome to CareerCompass 🚀")
@@ -78,13 +349,13 @@ def main():
             st.markdown("### 📈 Quick Stats")
             
             # Show some stats
-            if st.button("🔍 Analyze Current Job Market"):
+            if st.button("🔍 Analyze Current Job Market") and data_ready():
                 with st.spinner("Analyzing..."):
-                    jobs = scrape_all_job_data(use_test_data=True)
-                    skills = get_skill_counts(jobs)
+                    jobs = load_jobs()
+                    skills, _ = get_skill_aggregates()
                     
                     st.metric("Total Jobs Analyzed", len(jobs))
-                    st.metric("Companies Tracked", len(set(j['company'] for j in jobs)))
+                    st.metric("Companies Tracked", len(jobs.companies()))
                     st.metric("Unique Skills Found", len(skills))
                     
                     top_skill = max(skills.items(), key=lambda x: x[1])
@@ -106,76 +377,80 @@ def main():
                 st.session_state['run_analysis'] = True
         
         # Run analysis
-        if st.session_state.get('run_analysis', False):
+        if st.session_state.get('run_analysis', False) and data_ready():
             with st.spinner('🔄 Scraping job postings and analyzing skills...'):
-                # Get data from your backend
-                jobs = scrape_all_job_data(use_test_data=True)
-                skill_counts = get_skill_counts(jobs)
+                if not jobs_are_cached():
+                    # First run per TTL: show results while the scrapers are still running
+                    live = st.empty()
+                    for partial_result in stream_analysis():
+                        with live.container():
+                            st.caption(f"🔄 {partial_result.jobs_seen} jobs analyzed so far...")
+                            st.plotly_chart(skills_chart(partial_result.top_skills(top_n), top_n),
+                                            use_container_width=True, key=f"live_chart_{partial_result.jobs_seen}")
+                    live.empty()
                 
-                # Store in session state
-                st.session_state['jobs'] = jobs
-                st.session_state['skill_counts'] = skill_counts
+                # Cached across sessions - only the first run per TTL does real work
+                jobs = load_jobs()
+                skill_counts, company_skills = get_skill_aggregates()
             
-            st.success(f"✅ Analyzed {len(jobs)} jobs from {len(set(j['company'] for j in jobs))} companies!")
-        
-        # Display results if available
-        if 'skill_counts' in st.session_state:
-            skill_counts = st.session_state['skill_counts']
-            jobs = st.session_state['jobs']
+            st.success(f"✅ Analyzed {len(jobs)} jobs from {len(jobs.companies())} companies!")
+            snapshot = get_snapshot()
+            if snapshot is not None and snapshot.duplicates:
+                st.caption(f"{snapshot.duplicates} reposted near-duplicate postings are counted once.")
             
             # Get top N skills
             top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:top_n]
-            skills = [s[0].title() for s in top_skills]
-            counts = [s[1] for s in top_skills]
             
             # Create horizontal bar chart
-            fig = go.Figure(data=[
-                go.Bar(
-                    y=skills[::-1],  # Reverse to show highest at top
-                    x=counts[::-1],
-                    orientation='h',
-                    marker=dict(
-                        color=counts[::-1],
-                        colorscale='Viridis',
-                        showscale=True,
-                        colorbar=dict(title="Count")
-                    ),
-                    text=counts[::-1],
-                    textposition='auto',
-                )
-            ])
-            
-            fig.update_layout(
-                title=f"Top {top_n} In-Demand Skills Across SHPE Sponsor Companies",
-                xaxis_title="Number of Job Postings Mentioning Skill",
-                yaxis_title="Technical Skill",
-                height=600,
-                showlegend=False,
-                hovermode='y'
-            )
-            
+            st.plotly_chart(skills_chart(top_skills, top_n), use_container_width=True)
+            
+            # Roll the same counts up by category (no extra pass over the postings)
+            st.markdown("### 🧩 Skills by Category")
+            category_counts = get_default_taxonomy().roll_up(skill_counts)
+            fig = go.Figure([go.Bar(x=list(category_counts), y=list(category_counts.values()),
+                                    text=list(category_counts.values()), textposition='auto')])
+            fig.update_layout(xaxis_title="Category", yaxis_title="Skill mentions", height=400)
             st.plotly_chart(fig, use_container_width=True)
             
             # Show breakdown by company
             st.markdown("### 📋 Skills by Company")
             
-            # Create company breakdown
-            company_skills = {}
-            for job in jobs:
-                company = job['company']
-                job_skills = extract_skills(job['description'])
-                if company not in company_skills:
-                    company_skills[company] = Counter()
-                company_skills[company].update(job_skills)
-            
             # Display in columns
             cols = st.columns(len(company_skills))
             for idx, (company, skills_counter) in enumerate(company_skills.items()):
                 with cols[idx]:
                     st.markdown(f"**{company}**")
-                    top_3 = skills_counter.most_common(3)
+                    top_3 = list(skills_counter.items())[:3]
                     for skill, count in top_3:
                         st.write(f"• {skill.title()}: {count}")
+            
+            # Show how demand changes over time
+            st.markdown("### 📈 Skill Trends")
+            trends = get_skill_trends()
+            
+            window = st.radio("Postings open in the last", WINDOWS, index=0,
+                              format_func=lambda days: f"{days} days", horizontal=True)
+            window_counts = trends.window_counts(window)
+            change = trends.change(window)
+            cols = st.columns(5)
+            for idx, (skill, count) in enumerate(list(window_counts.items())[:5]):
+                with cols[idx]:
+                    st.metric(skill.title(), count, f"{change.get(skill, 0):+d} vs previous {window} days")
+            
+            trend_skills = st.multiselect("Skills to compare", trends.vocabulary,
+                                          default=[skill for skill, _ in top_skills[:3]])
+            if trend_skills:
+                dates, series = trends.series(trend_skills, period_days=7, periods=52)
+                fig = go.Figure([go.Scatter(x=dates, y=series[skill], mode='lines', name=skill.title())
+                                 for skill in trend_skills])
+                fig.update_layout(
+                    title="Weekly demand over the last year",
+                    xaxis_title="Week",
+                    yaxis_title="Skill mentions in open postings",
+                    height=450,
+                    hovermode='x unified'
+                )
+                st.plotly_chart(fig, use_container_width=True)
     
     # RESUME MATCHER PAGE
     elif page_selection == "📄 Resume Matcher":
@@ -196,23 +471,23 @@ def main():
             if uploaded_file:
                 st.success(f"✅ Uploaded: {uploaded_file.name}")
                 
-                # Extract text from resume
-                if uploaded_file.type == "application/pdf":
-                    resume_text = read_pdf_text(uploaded_file)
-                else:
-                    resume_text = uploaded_file.read().decode('utf-8')
-                
-                st.session_state['resume_text'] = resume_text
+                # Extract text and skills from the resume (cached by file content,
+                # so reruns and re-uploads of the same file don't parse it again)
+                resume = analyze_resume(uploaded_file.getvalue(),
+                                        is_pdf=uploaded_file.type == "application/pdf")
+                st.session_state['resume'] = resume
                 
                 # Show preview
                 with st.expander("📄 Resume Preview (first 500 characters)"):
-                    st.text(resume_text[:500] + "...")
+                    st.text(resume['text'][:500] + "...")
         
         with col2:
             st.markdown("### Step 2: Select a Job")
+            if not data_ready():
+                return
             
-            # Get jobs
-            jobs = scrape_all_job_data(use_test_data=True)
+            # Get jobs (cached, so picking a job doesn't re-scrape)
+            jobs = load_jobs()
             
             # Create job selection dropdown
             job_options = [f"{job['company']} - {job['title']}" for job in jobs]
@@ -235,15 +510,12 @@ def main():
         st.markdown("---")
         
         if st.button("🎯 Calculate Match Score", type="primary", use_container_width=True):
-            if 'resume_text' not in st.session_state:
+            if 'resume' not in st.session_state:
                 st.error("⚠️ Please upload your resume first!")
             else:
                 with st.spinner("🔄 Analyzing your resume..."):
-                    resume_text = st.session_state['resume_text']
-                    job_text = selected_job['description']
-                    
-                    # Get comparison
-                    comparison = compare_skills(resume_text, job_text)
+                    # Get comparison (both sides' skills come from the analysis caches)
+                    comparison = match_resume(st.session_state['resume'], selected_job)
                     
                     st.session_state['comparison'] = comparison
         
@@ -323,5 +595,36 @@ def main():
                 4. **Update Resume**: Make sure your resume clearly lists your technical skills
                 """)
 
+        # Rank every job for this resume
+        st.markdown("---")
+        st.markdown("## 🏆 Best Matches For You")
+        
+        if st.button("🏆 Rank All Jobs", use_container_width=True):
+            if 'resume' not in st.session_state:
+                st.error("⚠️ Please upload your resume first!")
+            else:
+                # The resume is analyzed once and only jobs sharing a skill with it are scored
+                resume_skills = set(st.session_state['resume']['skills'])
+                st.session_state['ranking'] = get_job_index().rank(resume_skills=resume_skills, top_k=10)
+        
+        if 'ranking' in st.session_state:
+            ranking = st.session_state['ranking']
+            if not ranking:
+                st.write("No job shares a skill with your resume yet. Try adding your technical skills!")
+            else:
+                st.dataframe(
+                    [
+                        {
+                            "Company": match['job']['company'],
+                            "Title": match['job']['title'],
+                            "Match Score (%)": match['score'],
+                            "Skills to Learn": ", ".join(match['skills_you_are_missing']),
+                        }
+                        for match in ranking
+                    ],
+                    use_container_width=True,
+                    hide_index=True
+                )
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: batch resume matching (src.batch_match) on synthetic resumes and jobs.
+
+Writes --resumes resume PDFs to a temporary folder, then times reading them
+(serial and across processes) and scoring them against --jobs postings.
+Checks a sample of the scores against compare_skills.
+
+Run from the project root:
+    python -m benchmarks.bench_batch_match --resumes 500 --jobs 10000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.corpus import make_jobs, make_resume_lines
+from benchmarks.make_pdf import make_pdf
+from src.batch_match import batch_match, find_resumes, read_resumes
+from src.nlp_processor import compare_skills
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--resumes', type=int, default=500)
+    parser.add_argument('--jobs', type=int, default=10_000)
+    parser.add_argument('--top-k', type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    jobs = make_jobs(args.jobs)
+    with tempfile.TemporaryDirectory() as folder:
+        for i in range(args.resumes):
+            with open(os.path.join(folder, f'member{i:04d}.pdf'), 'wb') as f:
+                f.write(make_pdf([make_resume_lines(rng), make_resume_lines(rng)]))
+        paths = find_resumes(folder)
+
+        start = time.perf_counter()
+        resumes = read_resumes(paths, workers=1)
+        serial_time = time.perf_counter() - start
+        print(f"read {len(paths)} PDFs, workers=1: {serial_time:.2f}s")
+        workers = os.cpu_count() or 1
+        if workers > 1:
+            start = time.perf_counter()
+            assert read_resumes(paths, workers=workers) == resumes
+            elapsed = time.perf_counter() - start
+            print(f"read {len(paths)} PDFs, workers={workers}: {elapsed:.2f}s (speedup {serial_time / elapsed:.1f}x)")
+
+    start = time.perf_counter()
+    matches, gaps = batch_match(resumes, jobs, top_k=args.top_k)
+    print(f"score {len(resumes)} resumes x {len(jobs)} jobs + top-{args.top_k}: {time.perf_counter() - start:.2f}s")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for row in matches.sample(50, random_state=0).itertuples():
+            job = next(job for job in jobs if job['url'] == row.url)
+            assert compare_skills(resumes[row.member], job['description'])['score'] == row.score
+    print(f"{len(matches)} matches and {len(gaps)} skill gaps; sampled scores agree with compare_skills")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: near-duplicate detection (src.dedup) on synthetic postings with reposts.
+
+Times the MinHash signatures and LSH clustering, checks the clusters against
+the known reposts (and a sample of exact Jaccard similarities), then compares
+get_skill_counts with and without dedup (skills are only extracted from one
+posting per cluster, which matters most for the slower backends).
+
+Run from the project root:
+    python -m benchmarks.bench_dedup --jobs 10000 --repost-rate 0.3 --backend spacy
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from benchmarks.corpus import make_reposted_jobs
+from src.dedup import MinHasher, find_duplicate_clusters, shingle_hashes
+from src.nlp_processor import EXTRACTION_BACKENDS, get_skill_counts, job_descriptions, set_extraction_backend
+
+
+def _jaccard(a: str, b: str) -> float:
+    a, b = set(shingle_hashes(a)), set(shingle_hashes(b))
+    return len(a & b) / len(a | b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=10_000)
+    parser.add_argument('--repost-rate', type=float, default=0.3)
+    parser.add_argument('--threshold', type=float, default=0.8)
+    parser.add_argument('--backend', choices=sorted(EXTRACTION_BACKENDS), default='regex')
+    args = parser.parse_args()
+    set_extraction_backend(args.backend)
+
+    jobs = make_reposted_jobs(args.jobs, args.repost_rate)
+    texts = job_descriptions(jobs)
+
+    start = time.perf_counter()
+    MinHasher().signatures(texts)
+    print(f"signatures for {len(texts)} postings: {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    clusters = find_duplicate_clusters(texts, args.threshold)
+    print(f"signatures + LSH clustering: {time.perf_counter() - start:.2f}s "
+          f"({clusters.duplicates} duplicates in {len(clusters)} clusters)")
+
+    # Every repost at least `threshold` similar to its original should land with it
+    originals = np.array([job['original'] for job in jobs])
+    apart = np.flatnonzero(clusters.labels != clusters.labels[originals])
+    missed = sum(_jaccard(texts[i], texts[originals[i]]) >= args.threshold for i in apart)
+    print(f"reposts not clustered with their original: {len(apart)} "
+          f"({missed} of them at least {args.threshold} similar)")
+    rng = np.random.default_rng(0)
+    pairs = [(i, int(clusters.labels[i])) for i in rng.choice(len(jobs), 200) if clusters.labels[i] != i]
+    if pairs:
+        similarities = [_jaccard(texts[i], texts[j]) for i, j in pairs]
+        print(f"exact Jaccard of {len(pairs)} sampled duplicate pairs: min {min(similarities):.2f}, "
+              f"mean {np.mean(similarities):.2f}")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        get_skill_counts(jobs)
+        plain_time = time.perf_counter() - start
+        start = time.perf_counter()
+        get_skill_counts(jobs, dedup=True)
+        dedup_time = time.perf_counter() - start
+    print(f"get_skill_counts ({args.backend}): {plain_time:.2f}s, with dedup: {dedup_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: skill extraction backends ('regex' trie, 'tokens' hash lookup,
+'spacy' PhraseMatcher) as the vocabulary grows.
+
+Extra made-up skills (one to three words, some with 'c++'-style suffixes)
+are added to TECHNICAL_SKILLS and sprinkled into the synthetic postings,
+then every backend extracts the same corpus. Counts must be identical
+within a family (regex and tokens; spaCy tokenizes differently).
+
+Run from the project root:
+    python -m benchmarks.bench_extraction_backends --jobs 5000 --vocab 100 1000 10000
+"""
+
+import argparse
+import random
+import string
+import time
+from typing import List
+
+from benchmarks.corpus import make_jobs
+from src.nlp_processor import EXTRACTION_BACKENDS, TECHNICAL_SKILLS
+from src.skill_taxonomy import get_default_taxonomy
+
+
+def make_vocabulary(size: int, seed: int = 0) -> List[str]:
+    """TECHNICAL_SKILLS plus made-up skills, `size` skills in total."""
+    rng = random.Random(seed)
+    vocabulary = set(TECHNICAL_SKILLS)
+    while len(vocabulary) < size:
+        words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 8)))
+                 for _ in range(rng.randint(1, 3))]
+        skill = rng.choice([' ', '.', '-', '/']).join(words) + rng.choice(['', '', '', '++', '#'])
+        vocabulary.add(skill)
+    return sorted(vocabulary)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--vocab', type=int, nargs='+', default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    aliases = get_default_taxonomy().aliases
+    rng = random.Random(1)
+    for size in args.vocab:
+        vocabulary = make_vocabulary(size)
+        texts = [job['description'] + ' ' + ', '.join(rng.sample(vocabulary, 3)) for job in make_jobs(args.jobs)]
+        results = {}
+        for name, matcher_class in EXTRACTION_BACKENDS.items():
+            start = time.perf_counter()
+            matcher = matcher_class(vocabulary, aliases)
+            build = time.perf_counter() - start
+            start = time.perf_counter()
+            results[name] = (matcher.family, list(matcher.find_batch(texts)))
+            elapsed = time.perf_counter() - start
+            print(f"vocab={len(vocabulary):>6}  {name:<7} build {build * 1000:8.1f} ms   "
+                  f"extract {elapsed:6.2f}s ({len(texts) / elapsed:,.0f} docs/s)")
+        by_family = {}
+        for family, counts in results.values():
+            assert by_family.setdefault(family, counts) == counts, f"{family} backends disagree"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: parsing results pages with each HTML backend.
+
+Compares the old way (full html.parser soup, selectors parsed on every call)
+with PageParser on every installed backend, with and without the SoupStrainer.
+Uses the saved fixture pages, plus a large listing page built from them.
+
+Run from the project root:
+    python -m benchmarks.bench_html_parsing --repeat 200
+"""
+
+import argparse
+import os
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from src.page_parser import PageParser, available_backends
+from src.scraper import GoogleScraper
+
+FIXTURES_DIR = 'fixtures'
+PAGES = ['google_jobs.html', 'google_jobs_page2.html']
+
+
+def load_pages(cards_in_large_page: int = 100):
+    """The fixture pages, plus one page with many cards and extra page chrome."""
+    pages = {}
+    for name in PAGES:
+        with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+            pages[name] = f.read()
+
+    html = pages[PAGES[0]].decode('utf-8')
+    cards = re.findall(r'<div class="job-card">.*?</a>\s*</div>', html, flags=re.S)
+    filler = '<aside><ul>' + '<li><a href="/teams">Team</a> <span>Info</span></li>' * 50 + '</ul></aside>'
+    repeated = '\n'.join(cards[i % len(cards)] for i in range(cards_in_large_page))
+    pages[f'large ({cards_in_large_page} cards)'] = html.replace(
+        '<div class="job-list">', filler + '<div class="job-list">' + repeated
+    ).encode('utf-8')
+    return pages
+
+
+def old_parse(html, scraper):
+    """What CompanyScraper did before PageParser."""
+    soup = BeautifulSoup(html, 'html.parser')
+    jobs = []
+    for card in soup.select(scraper.card_selector):
+        title = card.select_one(scraper.title_selector)
+        description = card.select_one(scraper.description_selector)
+        link = card.select_one(scraper.link_selector)
+        if title and description:
+            jobs.append((title.text.strip(), description.text.strip(), link['href'] if link else None))
+    next_link = soup.select_one(scraper.next_page_selector)
+    return jobs, next_link['href'] if next_link else None
+
+
+def time_it(func, html, repeat: int) -> float:
+    func(html)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(html)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=200, help="Parses per page and variant")
+    parser.add_argument('--cards', type=int, default=100, help="Job cards in the large page")
+    args = parser.parse_args()
+
+    scraper = GoogleScraper()
+    fields = scraper.parser.fields
+    variants = [('old html.parser', lambda html: old_parse(html, scraper))]
+    for backend in available_backends():
+        strains = [True, False] if backend != 'selectolax' else [False]
+        for strain in strains:
+            page_parser = PageParser(scraper.card_selector, fields, scraper.next_page_selector,
+                                     backend=backend, strain=strain)
+            label = backend + (' + strainer' if strain else '')
+            variants.append((label, page_parser.parse))
+
+    print(f"Installed backends: {', '.join(available_backends())}")
+    for page_name, html in load_pages(args.cards).items():
+        print(f"\n{page_name} ({len(html) / 1024:.1f} KB)")
+        baseline = None
+        for label, func in variants:
+            ms = time_it(func, html, args.repeat)
+            baseline = baseline or ms
+            print(f"  {label:<26} {ms:8.3f} ms/page  ({baseline / ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: how long it takes to import the app and the src modules.
+
+Every module is imported in a fresh interpreter with `python -X importtime`
+(best of --repeat runs). Heavy libraries that should only load when they are
+needed (PDF parsing, scraping, plotting, spaCy) are listed in DEFERRED; the check
+fails if one of them shows up at import time again.
+
+Run from the project root:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --output before.json
+    python -m benchmarks.bench_import_time --compare before.json after.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+RESULTS_DIR = os.path.join('benchmarks', 'results')
+
+MODULES = ['src.nlp_processor', 'src.scraper', 'src.job_store', 'src.job_index', 'app']
+
+# Libraries that must not be imported just by importing these modules
+DEFERRED = {
+    'src.nlp_processor': ['PyPDF2', 'spacy'],
+    'src.scraper': ['requests', 'bs4', 'soupsieve', 'lxml', 'selectolax'],
+    # (plotly.graph_objects is not listed: streamlit itself imports it)
+    'app': ['PyPDF2', 'requests', 'bs4', 'plotly.express', 'spacy'],
+}
+
+
+def import_time(module: str) -> Dict:
+    """
+    Import `module` in a new interpreter and read the -X importtime report.
+
+    Returns:
+        {'ms': cumulative import time of the module, 'imported': every module it loaded}
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True)
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, total_us, name = line.split('|')
+        cumulative[name.strip()] = int(total_us)
+    return {'ms': cumulative.get(module, 0) / 1000, 'imported': set(cumulative)}
+
+
+def run(modules: List[str], repeat: int) -> List[Dict]:
+    results = []
+    for module in modules:
+        runs = [import_time(module) for _ in range(repeat)]
+        best = min(runs, key=lambda r: r['ms'])
+        leaked = [lib for lib in DEFERRED.get(module, []) if lib in best['imported']]
+        results.append({'module': module, 'import_ms': round(best['ms'], 2), 'deferred_imported': leaked})
+        status = 'OK' if not leaked else 'imports ' + ', '.join(leaked)
+        print(f"{module:<20} {best['ms']:>9.1f} ms   {status}")
+    return results
+
+
+def compare_runs(old_path: str, new_path: str):
+    with open(old_path, encoding='utf-8') as f:
+        old = {r['module']: r for r in json.load(f)['results']}
+    with open(new_path, encoding='utf-8') as f:
+        new = {r['module']: r for r in json.load(f)['results']}
+    for module in [m for m in new if m in old]:
+        before, after = old[module]['import_ms'], new[module]['import_ms']
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{module:<20} {before:>9.1f} -> {after:<9.1f} ms  ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='+', default=MODULES)
+    parser.add_argument('--repeat', type=int, default=5, help="Fresh interpreters per module (best is kept)")
+    parser.add_argument('--output', help="Where to save the JSON results")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="Compare two saved runs")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare_runs(*args.compare)
+        return
+
+    results = run(args.modules, args.repeat)
+    path = args.output
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, 'imports-' + time.strftime('%Y%m%d-%H%M%S') + '.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': sys.version.split()[0],
+                   'results': results}, f, indent=2)
+    print(f"\nSaved results to {path}")
+
+    if any(r['deferred_imported'] for r in results):
+        sys.exit("Some heavy libraries are imported too early (see above)")
+
+
+if __name__ == "__main__":
+    main()
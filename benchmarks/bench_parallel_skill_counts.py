@@ -0,0 +1,39 @@
+"""
+Benchmark: serial vs multi-process get_skill_counts on a synthetic corpus.
+
+Run from the project root:
+    python -m benchmarks.bench_parallel_skill_counts --jobs 100000
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.corpus import make_jobs
+from src.nlp_processor import get_skill_counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=100_000)
+    args = parser.parse_args()
+
+    corpus = make_jobs(args.jobs)
+
+    start = time.perf_counter()
+    serial = get_skill_counts(corpus)
+    serial_time = time.perf_counter() - start
+    print(f"workers=1: {serial_time:.2f}s")
+
+    workers = 2
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        parallel = get_skill_counts(corpus, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert parallel == serial and list(parallel) == list(serial)
+        print(f"workers={workers}: {elapsed:.2f}s (speedup {serial_time / elapsed:.1f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
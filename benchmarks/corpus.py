@@ -0,0 +1,107 @@
+"""
+Synthetic job postings and resumes for benchmarks, in the style of scrape_test_data().
+Everything is seeded, so the same size always gives the same corpus.
+"""
+
+import random
+from typing import Dict, List
+
+from benchmarks.make_pdf import make_pdf
+from src.scraper import scrape_test_data
+from src.nlp_processor import TECHNICAL_SKILLS
+
+COMPANIES = ['Google', 'Lockheed Martin', 'Texas Instruments', 'Northrop Grumman',
+             'Boeing', 'Intel', 'Microsoft', 'Raytheon', 'Honeywell', 'Qualcomm']
+TITLES = ['Software Engineer Intern', 'Data Scientist', 'Mechanical Engineer',
+          'Electrical Engineer Intern', 'Systems Engineer', 'DevOps Engineer',
+          'Embedded Software Engineer', 'Machine Learning Engineer']
+FILLER = [
+    "We are looking for a motivated engineer to join our team.",
+    "Must have strong problem-solving and communication skills.",
+    "Security clearance preferred.",
+    "Internship opportunity for engineering students.",
+    "Experience with technical documentation and requirements analysis.",
+    "You will collaborate with cross-functional teams on complex projects.",
+    "Knowledge of thermodynamics and finite element analysis is a plus.",
+]
+
+
+def _skill_sentence(rng: random.Random, skills: List[str]) -> str:
+    picked = rng.sample(skills, rng.randint(2, 6))
+    templates = [
+        "Experience with {} is required.",
+        "Knowledge of {} is a plus.",
+        "Programming skills in {} needed.",
+        "Should have hands-on experience using {}.",
+    ]
+    return rng.choice(templates).format(', '.join(picked[:-1]) + ' and ' + picked[-1])
+
+
+def make_jobs(n_jobs: int, seed: int = 0) -> List[Dict]:
+    """n_jobs fake postings: the real test postings' text mixed with random skills and filler."""
+    rng = random.Random(seed)
+    base = scrape_test_data()
+    skills = sorted(TECHNICAL_SKILLS)
+    jobs = []
+    for i in range(n_jobs):
+        sentences = [rng.choice(base)['description']]
+        sentences += [_skill_sentence(rng, skills) for _ in range(rng.randint(1, 3))]
+        sentences += rng.sample(FILLER, rng.randint(1, 3))
+        rng.shuffle(sentences)
+        company = rng.choice(COMPANIES)
+        jobs.append({
+            'company': company,
+            'title': rng.choice(TITLES),
+            'description': ' '.join(sentences),
+            'url': f"https://example.com/{company.lower().replace(' ', '-')}/jobs/{i}",
+        })
+    return jobs
+
+
+CITIES = ['Austin, TX', 'San Diego, CA', 'Huntsville, AL', 'Seattle, WA', 'Orlando, FL', 'Denver, CO']
+
+
+def make_reposted_jobs(n_jobs: int, repost_rate: float = 0.3, seed: int = 0) -> List[Dict]:
+    """
+    make_jobs with reposts mixed in: a `repost_rate` share of the postings are copies
+    of an earlier one with a different location sentence and URL (and sometimes a
+    sentence more or less), the way one role is listed once per office.
+    Each job has 'original': the index of the posting it copies (its own index if none).
+    """
+    rng = random.Random(seed)
+    n_originals = max(1, round(n_jobs * (1 - repost_rate)))
+    jobs = make_jobs(n_originals, seed)
+    for i, job in enumerate(jobs):
+        job['description'] += f" Location: {rng.choice(CITIES)}."
+        job['original'] = i
+    while len(jobs) < n_jobs:
+        original = rng.randrange(n_originals)
+        description = jobs[original]['description'].rsplit(' Location: ', 1)[0]
+        if rng.random() < 0.3:
+            description += ' ' + rng.choice(FILLER)
+        jobs.append(dict(jobs[original], description=f"{description} Location: {rng.choice(CITIES)}.",
+                         url=jobs[original]['url'] + f"?location={len(jobs)}"))
+    return jobs
+
+
+def make_resume_lines(rng: random.Random, n_lines: int = 40) -> List[str]:
+    skills = sorted(TECHNICAL_SKILLS)
+    lines = ["Jane Doe - Engineering Student", "SHPE UF Chapter Member", "EXPERIENCE"]
+    while len(lines) < n_lines:
+        if rng.random() < 0.4:
+            lines.append(_skill_sentence(rng, skills))
+        else:
+            lines.append(rng.choice(FILLER))
+    return lines
+
+
+def make_resumes(n_resumes: int, seed: int = 1) -> List[str]:
+    """n_resumes fake plain-text resumes."""
+    rng = random.Random(seed)
+    return ['\n'.join(make_resume_lines(rng)) for _ in range(n_resumes)]
+
+
+def make_resume_pdf(n_pages: int, seed: int = 2) -> bytes:
+    """A multi-page resume PDF (about 40 lines of text per page)."""
+    rng = random.Random(seed)
+    return make_pdf([make_resume_lines(rng) for _ in range(n_pages)])
@@ -0,0 +1,154 @@
+"""
+Benchmark suite for the NLP layer: skill extraction, aggregation, matching and PDF parsing.
+
+Run from the project root:
+    python -m benchmarks.run_benchmarks                      # 1k and 10k documents
+    python -m benchmarks.run_benchmarks --sizes 1000 10000 100000
+    python -m benchmarks.run_benchmarks --compare old.json new.json
+
+Every run is saved as JSON (benchmarks/results/ by default) so two runs,
+e.g. before and after a change, can be compared with --compare.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.corpus import make_jobs, make_resumes, make_resume_pdf
+from src.nlp_processor import extract_skills, get_skill_counts, compare_skills, read_pdf_text
+
+RESULTS_DIR = os.path.join('benchmarks', 'results')
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(name: str, size: int, operation: Callable, items: List, memory: bool = True) -> Dict:
+    """
+    Time `operation(item)` for every item, then (optionally) run it again
+    under tracemalloc to get the peak memory.
+
+    Returns:
+        Dictionary with throughput (ops/s), p50/p99 latency (ms) and peak memory (MB)
+    """
+    latencies = []
+    with contextlib.redirect_stdout(io.StringIO()):  # get_skill_counts prints a summary
+        operation(items[0])  # warm-up (builds the matcher, fills caches)
+        start = time.perf_counter()
+        for item in items:
+            op_start = time.perf_counter()
+            operation(item)
+            latencies.append(time.perf_counter() - op_start)
+        total = time.perf_counter() - start
+
+        peak_mb = None
+        if memory:
+            tracemalloc.start()
+            for item in items:
+                operation(item)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+
+    latencies.sort()
+    result = {
+        'name': name,
+        'size': size,
+        'ops': len(items),
+        'total_s': round(total, 4),
+        'throughput_ops_s': round(len(items) / total, 2) if total else None,
+        'p50_ms': round(_percentile(latencies, 50) * 1000, 4),
+        'p99_ms': round(_percentile(latencies, 99) * 1000, 4),
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 4),
+        'peak_mb': round(peak_mb, 2) if peak_mb is not None else None,
+    }
+    print(f"{name:<22} size={size:<7} {result['throughput_ops_s']:>12} ops/s  "
+          f"p50={result['p50_ms']:.3f}ms  p99={result['p99_ms']:.3f}ms  peak={result['peak_mb']}MB")
+    return result
+
+
+def run_suite(sizes: List[int], pdf_pages: List[int], memory: bool = True) -> List[Dict]:
+    results = []
+    for size in sizes:
+        jobs = make_jobs(size)
+        descriptions = [job['description'] for job in jobs]
+        # Pair every job with a resume (at most 2k pairs, compare_skills cost doesn't depend on size)
+        resumes = make_resumes(min(size, 2000))
+
+        results.append(measure('extract_skills', size, extract_skills, descriptions, memory))
+        # One aggregation over the whole corpus, repeated 3 times for stable numbers
+        results.append(measure('get_skill_counts', size, get_skill_counts, [jobs] * 3, memory))
+        pairs = list(zip(resumes, descriptions))
+        results.append(measure('compare_skills', size, lambda pair: compare_skills(*pair), pairs, memory))
+
+    for n_pages in pdf_pages:
+        pdf_bytes = make_resume_pdf(n_pages)
+        results.append(measure(f'read_pdf_text[{n_pages}p]', n_pages, read_pdf_text, [pdf_bytes] * 5, memory))
+    return results
+
+
+def save_results(results: List[Dict], path: str = None) -> str:
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, time.strftime('%Y%m%d-%H%M%S') + '.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'results': results,
+        }, f, indent=2)
+    return path
+
+
+def compare_runs(old_path: str, new_path: str):
+    """Print how every benchmark changed between two saved runs."""
+    with open(old_path, encoding='utf-8') as f:
+        old = {(r['name'], r['size']): r for r in json.load(f)['results']}
+    with open(new_path, encoding='utf-8') as f:
+        new = {(r['name'], r['size']): r for r in json.load(f)['results']}
+
+    print(f"{'benchmark':<22} {'size':>7} {'p50 ms':>18} {'throughput':>22} {'peak MB':>16}")
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+
+        def change(field):
+            if not before.get(field) or after.get(field) is None:
+                return 'n/a'
+            return f"{(after[field] - before[field]) / before[field] * 100:+.1f}%"
+
+        print(f"{key[0]:<22} {key[1]:>7} "
+              f"{before['p50_ms']:>8.3f}->{after['p50_ms']:<8.3f}"
+              f"{change('throughput_ops_s'):>22} {change('peak_mb'):>16}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help="Corpus sizes (number of postings)")
+    parser.add_argument('--pdf-pages', type=int, nargs='+', default=[1, 5, 20],
+                        help="Page counts of the generated resume PDFs")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc pass (faster)")
+    parser.add_argument('--output', help="Where to save the JSON results")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="Compare two saved runs")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare_runs(*args.compare)
+        return
+
+    results = run_suite(args.sizes, args.pdf_pages, memory=not args.no_memory)
+    print(f"\nSaved results to {save_results(results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Memoized resume and job analysis.
+
+Re-uploading the same resume, or matching it against one job after another,
+shouldn't parse the PDF and extract its skills again. Resumes are cached by
+a hash of the uploaded bytes (text + skills), jobs by their posting hash
+(skill bitmask). Both caches are bounded: least recently used entries are
+dropped when full, and entries expire after a TTL.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable
+
+from src.job_store import posting_hash
+from src.nlp_processor import (SkillMatcher, compare_masks, extract_skills, get_default_matcher,
+                               read_pdf_text)
+
+
+class LRUCache:
+    """
+    Thread-safe cache holding at most `max_entries` values, each for at most `ttl_seconds`.
+
+    Args:
+        max_entries: Least recently used entries are evicted beyond this
+        ttl_seconds: Entries older than this are recomputed (None = never expire)
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (stored_at, value), oldest use first
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds is not None \
+                    and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable):
+        """The cached value for `key`, or compute() (stored for next time)."""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every caller in this process (every app session)
+RESUME_CACHE = LRUCache(max_entries=64, ttl_seconds=60 * 60)
+JOB_PROFILE_CACHE = LRUCache(max_entries=50_000, ttl_seconds=6 * 60 * 60)
+
+
+def content_hash(data: bytes) -> str:
+    """sha1 of some bytes (e.g. an uploaded file)."""
+    return hashlib.sha1(data).hexdigest()
+
+
+def analyze_resume(data: bytes, is_pdf: bool = True, matcher: SkillMatcher = None,
+                   cache: LRUCache = RESUME_CACHE) -> Dict:
+    """
+    Text and skills of an uploaded resume, computed once per distinct file.
+
+    Args:
+        data: The uploaded file's bytes
+        is_pdf: PDF (True) or UTF-8 text (False)
+        matcher: SkillMatcher to use (defaults to the shared one)
+        cache: Where to memoize the result
+
+    Returns:
+        Dictionary with 'text', 'skills' (Counter) and 'mask' (skill bitmask).
+        Treat it as read-only, it is shared with later calls.
+    """
+    matcher = matcher or get_default_matcher()
+
+    def analyze():
+        text = read_pdf_text(data) if is_pdf else data.decode('utf-8')
+        skills = extract_skills(text, matcher)
+        return {'text': text, 'skills': skills, 'mask': matcher.to_mask(skills)}
+
+    # The vocabulary is part of the key: new skills or aliases mean a new analysis
+    return cache.get_or_compute((content_hash(data), is_pdf, matcher.key), analyze)
+
+
+def job_skill_mask(job: Dict, matcher: SkillMatcher = None, cache: LRUCache = JOB_PROFILE_CACHE) -> int:
+    """A posting's skills as a bitmask (SkillMatcher.to_mask), extracted once per posting."""
+    matcher = matcher or get_default_matcher()
+    return cache.get_or_compute(
+        (posting_hash(job), matcher.key),
+        lambda: matcher.to_mask(extract_skills(job.get('description', ''), matcher)),
+    )
+
+
+def match_resume(resume: Dict, job: Dict, matcher: SkillMatcher = None) -> Dict:
+    """
+    compare_skills for an analyzed resume (analyze_resume) and a job posting,
+    without parsing or extracting anything that is already cached.
+    """
+    matcher = matcher or get_default_matcher()
+    return compare_masks(resume['mask'], job_skill_mask(job, matcher), matcher)
@@ -0,0 +1,224 @@
+"""
+Batch resume matching: every resume in a folder against every job posting.
+
+Resumes (PDF or .txt) are parsed in parallel across processes, then the
+whole resumes x jobs score matrix is computed at once with skill bitsets
+(skill_profiles.score_matrix). The results are two tables:
+
+    matches   each member's top-K jobs (score, matched and missing skills)
+    gaps      each member's missing skills, ranked by how many jobs ask for them
+
+Run from the project root:
+    python -m src.batch_match resumes/ --top-k 10 --output reports/career_fair.csv
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.nlp_processor import SkillMatcher, SkillMatrix, extract_skills_batch, get_default_matcher, \
+    job_descriptions, read_pdf_text
+from src.skill_profiles import SkillProfiles, score_matrix
+
+RESUME_EXTENSIONS = ('.pdf', '.txt')
+
+
+def read_resume_file(path: str) -> str:
+    """Text of one resume file (PDF or UTF-8 text)."""
+    if path.lower().endswith('.pdf'):
+        return read_pdf_text(path)
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def find_resumes(directory: str) -> List[str]:
+    """Paths of the resume files in a folder, sorted by name."""
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.lower().endswith(RESUME_EXTENSIONS))
+
+
+def read_resumes(paths: List[str], workers: int = None) -> Dict[str, str]:
+    """
+    Parse many resume files, split across a pool of processes.
+    PDF parsing is pure Python, so processes (not threads) are needed for a speedup.
+
+    Args:
+        paths: Resume files (.pdf or .txt)
+        workers: Number of processes (defaults to the number of CPU cores, 1 = run here)
+
+    Returns:
+        Member name (file name without extension) -> resume text
+
+    Raises:
+        ValueError: If two files have the same name (e.g. ana.pdf and ana.txt)
+    """
+    names = {}
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        if name in names:
+            raise ValueError(f"'{names[name]}' and '{path}' are both resumes of '{name}'; keep only one")
+        names[name] = path
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2:
+        texts = [read_resume_file(path) for path in paths]
+    else:
+        chunk_size = max(1, -(-len(paths) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            texts = list(pool.map(read_resume_file, paths, chunksize=chunk_size))
+    return dict(zip(names, texts))
+
+
+def _unpack(words: np.ndarray, n_skills: int) -> np.ndarray:
+    """Packed skill bits (SkillProfiles.words) as a rows x skills array of 0/1."""
+    bits = np.unpackbits(words.astype('<u8').view(np.uint8), axis=1, bitorder='little')
+    return bits[:, :n_skills]
+
+
+def _skill_lists(words: np.ndarray, vocabulary: List[str]) -> List[str]:
+    """Every row of packed skill bits as a comma-separated, sorted skill list."""
+    return [', '.join(vocabulary[j] for j in np.flatnonzero(row)) for row in _unpack(words, len(vocabulary))]
+
+
+def batch_match(resumes: Dict[str, str], jobs, top_k: int = 5, job_matrix: SkillMatrix = None,
+                matcher: SkillMatcher = None, top_gaps: int = 10) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Score every resume against every job and keep each member's best matches.
+
+    Args:
+        resumes: Member name -> resume text (e.g. from read_resumes)
+        jobs: Job dictionaries (or a JobCollection)
+        top_k: Matches to keep per member
+        job_matrix: The jobs' skills if already extracted (JobStore.skill_matrix, snapshots);
+            ignored if it was built with a different vocabulary than `matcher`
+        matcher: SkillMatcher to use (defaults to the shared one)
+        top_gaps: Missing skills to keep per member
+
+    Returns:
+        (matches, gaps) DataFrames:
+        matches has member, rank, company, title, url, score, skills_you_have, skills_you_are_missing;
+        gaps has member, skill, jobs_requiring (all jobs), top_matches_requiring (the member's top-K)
+    """
+    matcher = matcher or get_default_matcher()
+    members = list(resumes)
+    if job_matrix is not None and list(job_matrix.skills) != list(matcher.vocabulary):
+        # Extracted with another vocabulary (e.g. an older snapshot): the bit positions
+        # would not line up, and skills added since were never looked for
+        print("Job skills were extracted with a different skill vocabulary; extracting again")
+        job_matrix = None
+    if job_matrix is None:
+        job_matrix = extract_skills_batch(job_descriptions(jobs), matcher)
+    job_profiles = SkillProfiles.from_matrix(job_matrix)
+    resume_profiles = SkillProfiles.from_texts([resumes[member] for member in members], matcher)
+
+    scores = score_matrix(resume_profiles, job_profiles)
+    top_k = min(top_k, len(job_profiles))
+    # Best score first; ties keep the jobs' order (same as sorting each row)
+    top_jobs = np.argsort(-scores, axis=1, kind='stable')[:, :top_k]
+
+    member_rows = np.repeat(np.arange(len(members)), top_k)
+    job_rows = top_jobs.ravel()
+    resume_words = resume_profiles.words[member_rows]
+    job_words = job_profiles.words[job_rows]
+    picked = [jobs[int(j)] for j in job_rows]
+    matches = pd.DataFrame({
+        'member': [members[i] for i in member_rows],
+        'rank': np.tile(np.arange(1, top_k + 1), len(members)),
+        'company': [job.get('company', '') for job in picked],
+        'title': [job.get('title', '') for job in picked],
+        'url': [job.get('url', 'N/A') for job in picked],
+        'score': np.round(scores[member_rows, job_rows].astype(float), 1),  # float32 -> same value as compare_skills
+        'skills_you_have': _skill_lists(job_words & resume_words, job_profiles.vocabulary),
+        'skills_you_are_missing': _skill_lists(job_words & ~resume_words, job_profiles.vocabulary),
+    })
+    return matches, _skill_gaps(members, resume_profiles, job_profiles, top_jobs, top_gaps)
+
+
+def _skill_gaps(members: List[str], resumes: SkillProfiles, jobs: SkillProfiles,
+                top_jobs: np.ndarray, top_gaps: int) -> pd.DataFrame:
+    lacking = 1 - _unpack(resumes.words, len(resumes.vocabulary)).astype(np.int64)  # members x skills
+    job_bits = _unpack(jobs.words, len(jobs.vocabulary)).astype(np.int64)
+    demand = lacking * job_bits.sum(axis=0)            # jobs asking for each missing skill
+    in_top = lacking * job_bits[top_jobs].sum(axis=1)  # ... among the member's top matches
+
+    rows = []
+    for i, member in enumerate(members):
+        # Most wanted by the member's own top matches first, then by all jobs
+        order = np.lexsort((-demand[i], -in_top[i]))
+        for j in order[(demand[i][order] > 0)][:top_gaps]:
+            rows.append((member, jobs.vocabulary[j], int(demand[i, j]), int(in_top[i, j])))
+    return pd.DataFrame(rows, columns=['member', 'skill', 'jobs_requiring', 'top_matches_requiring'])
+
+
+def write_table(table: pd.DataFrame, path: str):
+    """Save as Parquet (.parquet) or CSV (anything else)."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    if path.endswith('.parquet'):
+        table.to_parquet(path, index=False)
+    else:
+        table.to_csv(path, index=False)
+
+
+def load_jobs(source: str):
+    """
+    Jobs to match against, with their already extracted skills.
+
+    Args:
+        source: 'snapshot' (latest dashboard snapshot), 'test' (scrape_test_data)
+            or the path of a JobStore database
+
+    Returns:
+        (jobs, SkillMatrix or None if the skills still need to be extracted)
+    """
+    if source == 'test':
+        from src.scraper import scrape_test_data
+        return scrape_test_data(), None
+    if source == 'snapshot':
+        from src.snapshot import load_latest_snapshot
+        snapshot = load_latest_snapshot()
+        if snapshot is None:
+            raise SystemExit("No snapshot yet (run: python -m src.snapshot)")
+        return snapshot.jobs, snapshot.matrix
+
+    from src.job_store import JobStore
+    store = JobStore(source)
+    try:
+        return store.skill_matrix()
+    finally:
+        store.close()
+
+
+def main():
+    from src.job_store import DEFAULT_STORE_PATH
+
+    parser = argparse.ArgumentParser(description="Match every resume in a folder against every job posting.")
+    parser.add_argument('resume_dir', help="Folder of resumes (.pdf / .txt, one per member)")
+    parser.add_argument('--jobs', default='snapshot',
+                        help=f"'snapshot', 'test' or a JobStore path such as {DEFAULT_STORE_PATH}")
+    parser.add_argument('--top-k', type=int, default=5, help="Matches to keep per member")
+    parser.add_argument('--top-gaps', type=int, default=10, help="Missing skills to keep per member")
+    parser.add_argument('--workers', type=int, default=None, help="Processes for PDF parsing (default: all cores)")
+    parser.add_argument('--output', default=os.path.join('reports', 'matches.csv'),
+                        help="Matches file (.csv or .parquet); gaps go next to it as *_gaps")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    resumes = read_resumes(find_resumes(args.resume_dir), workers=args.workers)
+    print(f"Read {len(resumes)} resumes in {time.perf_counter() - start:.1f}s")
+
+    jobs, job_matrix = load_jobs(args.jobs)
+    matches, gaps = batch_match(resumes, jobs, top_k=args.top_k, job_matrix=job_matrix, top_gaps=args.top_gaps)
+    stem, extension = os.path.splitext(args.output)
+    write_table(matches, args.output)
+    write_table(gaps, stem + '_gaps' + (extension or '.csv'))
+    print(f"Matched {len(resumes)} resumes x {len(jobs)} jobs in {time.perf_counter() - start:.1f}s")
+    print(f"Wrote {args.output} and {stem}_gaps{extension or '.csv'}")
+
+
+if __name__ == "__main__":
+    main()
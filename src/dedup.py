@@ -0,0 +1,237 @@
+"""
+Near-duplicate job postings (the same role reposted for several locations).
+
+Every description gets a MinHash signature: for each of `num_perm` random
+hash functions, the smallest hash of its word 3-grams ("shingles"). Two
+signatures agree in about as many places as the texts' shingle sets
+overlap (Jaccard similarity). Locality-sensitive hashing then splits the
+signatures into bands; postings that share a whole band land in the same
+bucket and become candidates, so near-duplicates are found in roughly
+linear time instead of comparing every pair. Candidates are only merged
+if their signatures agree on at least `threshold` of the positions.
+
+    clusters = find_duplicate_clusters(job_descriptions(jobs))
+    unique_jobs = [jobs[i] for i in clusters.representatives]
+"""
+
+import re
+import zlib
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+_WORD = re.compile(r'\w+')
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_SHINGLE_MIX = np.uint64(0x9E3779B1)
+_SHIFT = np.uint64(32)
+_BAND_MIX = np.uint64(0x100000001B3)
+
+
+class _WordHashes(dict):
+    """word -> 32-bit hash, computed the first time a word is seen."""
+
+    def __missing__(self, word: str) -> int:
+        h = self[word] = zlib.crc32(word.encode('utf-8'))
+        return h
+
+
+def _word_hashes(text: str, size: int, cache: _WordHashes) -> np.ndarray:
+    """Hash of every word, padded with zeros to at least `size` words (no words: empty)."""
+    words = _WORD.findall(text.lower())
+    hashes = np.fromiter(map(cache.__getitem__, words), dtype=np.uint64, count=len(words))
+    if 0 < len(hashes) < size:
+        hashes = np.concatenate([hashes, np.zeros(size - len(hashes), dtype=np.uint64)])
+    return hashes
+
+
+def _combine(hashes: np.ndarray, size: int) -> np.ndarray:
+    """Fold every run of `size` word hashes (order matters) into one 32-bit shingle hash."""
+    n = len(hashes) - size + 1
+    shingles = np.zeros(n, dtype=np.uint64)
+    for k in range(size):
+        shingles *= _SHINGLE_MIX
+        shingles += hashes[k:k + n]
+        shingles &= _MAX_HASH
+    return shingles
+
+
+def shingle_hashes(text: str, size: int = 3) -> np.ndarray:
+    """32-bit hashes of the text's distinct word `size`-grams (lowercased)."""
+    hashes = _word_hashes(text, size, _WordHashes())
+    if len(hashes) == 0:
+        return hashes
+    return np.unique(_combine(hashes, size))
+
+
+class MinHasher:
+    """
+    MinHash signatures with `num_perm` hash functions: the top 32 bits of
+    a * x + b (64-bit arithmetic, random odd a), "multiply-shift" hashing.
+
+    Args:
+        num_perm: Signature length (more = more accurate similarity estimates)
+        shingle_size: Words per shingle
+        seed: Seed for the hash functions (same seed = comparable signatures)
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = (rng.integers(0, 1 << 63, num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1))[:, None]
+        self._b = rng.integers(0, 1 << 63, num_perm, dtype=np.uint64)[:, None]
+
+    def signatures(self, texts: List[str], chunk_words: int = 16_000) -> np.ndarray:
+        """
+        Signatures of many texts at once, shape (texts, num_perm).
+        Texts without any words get all-max signatures (see find_duplicate_clusters).
+        """
+        size = self.shingle_size
+        cache = _WordHashes()
+        words = [_word_hashes(text, size, cache) for text in texts]
+        signatures = np.full((len(texts), self.num_perm), _MAX_HASH, dtype=np.uint64)
+
+        # Shingle and hash the words of many texts in a few array operations, a chunk of texts at a time
+        start = 0
+        while start < len(texts):
+            stop, total = start, 0
+            while stop < len(texts) and (total == 0 or total + len(words[stop]) <= chunk_words):
+                total += len(words[stop])
+                stop += 1
+            lengths = np.array([len(w) for w in words[start:stop]])
+            if total:
+                # Shingles that would cross into the next text are dropped
+                all_shingles = _combine(np.concatenate(words[start:stop]), size)
+                counts = np.maximum(lengths - size + 1, 0)
+                firsts = np.cumsum(lengths) - lengths
+                keep = np.repeat(firsts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+                values = all_shingles[keep]
+
+                hashed = np.empty((self.num_perm, len(values)), dtype=np.uint64)
+                # In place: a * x + b wraps around at 2^64 on purpose, then keep the top 32 bits
+                np.multiply(self._a, values, out=hashed)
+                hashed += self._b
+                hashed >>= _SHIFT
+                rows = np.flatnonzero(counts) + start
+                offsets = (np.cumsum(counts) - counts)[counts > 0]
+                signatures[rows] = np.minimum.reduceat(hashed, offsets, axis=1).T
+            start = stop
+        return signatures
+
+
+class DuplicateClusters:
+    """
+    Groups of near-duplicate postings.
+
+    Args:
+        labels: For every posting, the index of its cluster's representative
+            (the cluster's first posting; a posting without duplicates is its own)
+    """
+
+    def __init__(self, labels: np.ndarray):
+        self.labels = labels
+        self.representatives = np.flatnonzero(labels == np.arange(len(labels)))
+        self.sizes = np.bincount(labels, minlength=len(labels))[self.representatives]
+
+    def __len__(self) -> int:
+        return len(self.representatives)
+
+    @property
+    def duplicates(self) -> int:
+        """Postings that are near-duplicates of an earlier one."""
+        return len(self.labels) - len(self.representatives)
+
+    def weights(self, per: str = 'cluster') -> np.ndarray:
+        """
+        Weight of every posting for aggregation.
+
+        Args:
+            per: 'cluster' - every cluster counts once (its representative has weight 1);
+                'posting' - the representative stands in for every posting of its cluster
+
+        Returns:
+            int64 array, one weight per posting (0 for non-representatives)
+        """
+        if per not in ('cluster', 'posting'):
+            raise ValueError(f"per must be 'cluster' or 'posting', not '{per}'")
+        weights = np.zeros(len(self.labels), dtype=np.int64)
+        weights[self.representatives] = 1 if per == 'cluster' else self.sizes
+        return weights
+
+    def members(self) -> Dict[int, List[int]]:
+        """Representative -> every posting in its cluster, for clusters with duplicates."""
+        groups = {}
+        for i, label in enumerate(self.labels):
+            groups.setdefault(int(label), []).append(i)
+        return {rep: group for rep, group in groups.items() if len(group) > 1}
+
+
+def _find(parent: np.ndarray, i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_duplicate_clusters(texts: List[str], threshold: float = 0.8, bands: int = 16,
+                            hasher: MinHasher = None) -> DuplicateClusters:
+    """
+    Cluster near-duplicate texts with MinHash + LSH.
+
+    Args:
+        texts: Job descriptions
+        threshold: Minimum estimated Jaccard similarity to merge two postings
+        bands: LSH bands (num_perm must divide by it); with 128 hashes and 16
+            bands, pairs above ~0.7 similarity are almost always compared
+        hasher: MinHasher to use (defaults to 128 hash functions)
+
+    Returns:
+        DuplicateClusters over the texts, in order
+    """
+    hasher = hasher or MinHasher()
+    signatures = hasher.signatures(texts)
+    rows = hasher.num_perm // bands
+    candidates = np.flatnonzero(~(signatures == _MAX_HASH).all(axis=1))  # no words: never a duplicate
+
+    # Every posting is paired with the first posting in each bucket it lands in
+    pairs = [np.zeros((0, 2), dtype=np.int64)]
+    for band in range(bands if len(candidates) > 1 else 0):
+        keys = np.zeros(len(candidates), dtype=np.uint64)
+        for column in signatures[candidates, band * rows:(band + 1) * rows].T:
+            keys *= _BAND_MIX  # wraps around: a 64-bit hash of the band's values
+            keys += column
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        starts = np.concatenate([[True], sorted_keys[1:] != sorted_keys[:-1]])
+        firsts = order[np.flatnonzero(starts)[np.cumsum(starts) - 1]]
+        repeated = order[~starts]
+        pairs.append(np.stack([candidates[firsts[~starts]], candidates[repeated]], axis=1))
+    pairs = np.unique(np.concatenate(pairs), axis=0)
+
+    # Keep only the pairs whose signatures really agree on enough positions
+    similar = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1) >= threshold
+    parent = np.arange(len(texts))
+    for i, j in pairs[similar]:
+        a, b = _find(parent, i), _find(parent, j)
+        # The earliest posting stays the representative
+        parent[max(a, b)] = min(a, b)
+
+    labels = np.array([_find(parent, i) for i in range(len(texts))], dtype=np.int64)
+    return DuplicateClusters(labels)
+
+
+def dedupe_jobs(jobs, threshold: float = 0.8) -> Tuple[List, DuplicateClusters]:
+    """
+    The dedup stage between scraping and skill extraction.
+
+    Args:
+        jobs: Job dictionaries (or a JobCollection)
+        threshold: Minimum estimated Jaccard similarity of two descriptions to treat them as one posting
+
+    Returns:
+        (one posting per cluster, in order; the clusters over `jobs`)
+    """
+    from src.nlp_processor import job_descriptions
+
+    clusters = find_duplicate_clusters(job_descriptions(jobs), threshold)
+    return [jobs[int(i)] for i in clusters.representatives], clusters
@@ -0,0 +1,65 @@
+"""
+Local cache of fetched pages so refreshes only download and parse what changed.
+Stores each page's ETag / Last-Modified plus the jobs parsed from it.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+DEFAULT_CACHE_PATH = os.path.join('data', 'fetch_cache.json')
+
+
+class FetchCache:
+    """
+    URL -> {'etag', 'last_modified', 'jobs', 'next_url'} saved as one JSON file.
+
+    Args:
+        path: Where to keep the cache on disk (None = memory only, nothing saved)
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_PATH):
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable fetch cache {path}: {e}")
+
+    def get(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            return self._entries.get(url)
+
+    def put(self, url: str, entry: Dict):
+        with self._lock:
+            self._entries[url] = entry
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Headers that let the server answer 304 Not Modified if the page is unchanged."""
+        entry = self.get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def save(self):
+        """Write the cache to disk (atomically, so a crash can't leave half a file)."""
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self._entries)
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,235 @@
+"""
+Shared HTTP fetching for the scrapers.
+Week 4: one pooled session for every company, polite per-host rate limits
+instead of a global sleep, and retries with backoff.
+"""
+
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Set
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.instrumentation import span, incr
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Status codes that are worth trying again (rate limited / server hiccup)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class _HostSlot:
+    """Politeness bookkeeping for one host: how many requests at once and how far apart."""
+
+    def __init__(self, max_concurrent: int):
+        self.semaphore = threading.Semaphore(max_concurrent)
+        self.lock = threading.Lock()
+        self.next_allowed = 0.0
+
+
+class PoliteFetcher:
+    """
+    Fetches pages concurrently while staying polite to each site.
+
+    - One requests.Session with a connection pool shared by all scrapers
+    - At most `per_host_limit` requests in flight per host, spaced
+      `per_host_delay` seconds apart (replaces the old time.sleep(2))
+    - At most `max_workers` scrapers running at the same time
+    - Timeouts, plus retries with exponential backoff on errors and 429/5xx
+      (a server asking to wait longer than `max_backoff` seconds is an error)
+
+    Use it as a context manager so the session gets closed:
+
+        with PoliteFetcher() as fetcher:
+            html = fetcher.get(url).text
+    """
+
+    def __init__(self, max_workers: int = 8, per_host_limit: int = 1,
+                 per_host_delay: float = 2.0, timeout: float = 10,
+                 retries: int = 3, backoff: float = 0.5, max_backoff: float = 60,
+                 headers: Dict = None, session: requests.Session = None):
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.per_host_delay = per_host_delay
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        session.headers.update(headers or DEFAULT_HEADERS)
+        self.session = session
+
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _host_slot(self, url: str) -> _HostSlot:
+        host = urlparse(url).netloc
+        with self._hosts_lock:
+            if host not in self._hosts:
+                self._hosts[host] = _HostSlot(self.per_host_limit)
+            return self._hosts[host]
+
+    def _wait_turn(self, slot: _HostSlot):
+        """Block until this host may receive another request."""
+        with slot.lock:
+            now = time.monotonic()
+            wait = slot.next_allowed - now
+            slot.next_allowed = max(now, slot.next_allowed) + self.per_host_delay
+        if wait > 0:
+            time.sleep(wait)
+
+    def _backoff_delay(self, attempt: int, response: requests.Response = None) -> float:
+        # Respect the server's Retry-After (in seconds) when it gives one
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return float(retry_after)
+        return min(self.backoff * (2 ** attempt) * (1 + random.random() * 0.25), self.max_backoff)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET a URL politely, retrying transient failures.
+
+        Args:
+            url: Page to fetch
+            **kwargs: Passed on to requests (e.g. headers, params)
+
+        Returns:
+            The successful response (raises after the last failed attempt)
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        slot = self._host_slot(url)
+        host = urlparse(url).netloc
+
+        for attempt in range(self.retries + 1):
+            response = None
+            with slot.semaphore:
+                self._wait_turn(slot)
+                try:
+                    with span('http_fetch', host=host):
+                        response = self.session.get(url, **kwargs)
+                    incr('http_responses', host=host, status=response.status_code)
+                    if response.status_code not in RETRY_STATUSES:
+                        response.raise_for_status()
+                        return response
+                    error = requests.HTTPError(f"{response.status_code} for {url}", response=response)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+
+            if attempt == self.retries:
+                raise error
+            delay = self._backoff_delay(attempt, response)
+            if delay > self.max_backoff:
+                # e.g. Retry-After: 86400 - don't hold up the whole refresh for it
+                raise requests.HTTPError(f"{error} (server asked to retry after {delay:.0f}s)", response=response)
+            print(f"Retrying {url} in {delay:.1f}s ({error})")
+            time.sleep(delay)
+
+    def run_all(self, scrapers: List[Callable], names: List[str] = None) -> List[List[Dict]]:
+        """
+        Run scraper functions concurrently. Each one is called as scraper(fetcher=self).
+
+        Args:
+            scrapers: Scraper functions that accept a `fetcher` keyword
+            names: Names for error messages and metrics (defaults to the function names)
+
+        Returns:
+            One list of jobs per scraper, in the same order (empty if it failed)
+        """
+        def run(scraper_func, name):
+            try:
+                with span('scraper_call', scraper=name):
+                    return scraper_func(fetcher=self)
+            except Exception as e:
+                print(f"Error with {name}: {e}")
+                return []
+
+        if not scrapers:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(scrapers))) as pool:
+            return list(pool.map(run, scrapers, names or [getattr(s, '__name__', 'scraper') for s in scrapers]))
+
+    def iter_all(self, scrapers: List[Callable], names: List[str] = None,
+                 buffer_size: int = 256, completed: Set[str] = None) -> Iterator[Dict]:
+        """
+        Streaming version of run_all: scraper generators run concurrently and
+        their jobs are yielded as they arrive.
+
+        The buffer between scrapers and the caller is bounded, so scrapers pause
+        (instead of piling up jobs in memory) when the caller is slower.
+        If the caller stops early, the scrapers are stopped too.
+
+        Args:
+            scrapers: Generator functions that accept a `fetcher` keyword
+            names: Names for error messages and metrics (defaults to the function names)
+            buffer_size: Maximum number of jobs waiting to be consumed
+            completed: Optional set that gets the name of every scraper that ran to
+                the end without an error (a failed site is not the same as no postings)
+
+        Yields:
+            Jobs from all scrapers, interleaved in arrival order
+        """
+        if not scrapers:
+            return
+        names = names or [getattr(s, '__name__', 'scraper') for s in scrapers]
+        buffer = queue.Queue(maxsize=buffer_size)
+        stop = threading.Event()
+        done = object()  # marks the end of one scraper
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def run(scraper_func, name):
+            try:
+                with span('scraper_call', scraper=name):
+                    for job in scraper_func(fetcher=self):
+                        if not put(job):
+                            return
+                if completed is not None:
+                    completed.add(name)
+            except Exception as e:
+                print(f"Error with {name}: {e}")
+            finally:
+                put(done)
+
+        pool = ThreadPoolExecutor(max_workers=min(self.max_workers, len(scrapers)))
+        try:
+            for scraper_func, name in zip(scrapers, names):
+                pool.submit(run, scraper_func, name)
+            remaining = len(scrapers)
+            while remaining:
+                item = buffer.get()
+                if item is done:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            stop.set()
+            pool.shutdown(wait=True)
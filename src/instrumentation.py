@@ -0,0 +1,249 @@
+"""
+Lightweight timing spans and counters for the hot paths (scraping, parsing,
+skill extraction, PDF pages, page renders).
+
+Off by default: span() then returns a shared do-nothing object, so the cost
+is one boolean check. Turn it on with CAREERCOMPASS_METRICS=1 (or enable()).
+
+    with span('http_fetch', host='careers.google.com'):
+        ...
+    incr('documents_extracted', 25)
+
+Results can be written to a JSON file (write_metrics), rendered in the
+Prometheus text format (prometheus_text / serve_prometheus), and a single
+request can be profiled with cProfile or pyinstrument (profile()).
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+# Upper bounds (seconds) of the latency histogram buckets
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+_enabled = os.environ.get('CAREERCOMPASS_METRICS', '') not in ('', '0', 'false')
+_lock = threading.Lock()
+_timings = {}   # (name, labels) -> {'count', 'total', 'max', 'buckets'}
+_counters = {}  # (name, labels) -> value
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """Forget every recorded span and counter."""
+    with _lock:
+        _timings.clear()
+        _counters.clear()
+
+
+def _key(name: str, labels: Dict) -> Tuple:
+    return name, tuple(sorted(labels.items()))
+
+
+def record(name: str, seconds: float, **labels):
+    """Add one timing measurement."""
+    key = _key(name, labels)
+    with _lock:
+        stats = _timings.get(key)
+        if stats is None:
+            stats = _timings[key] = {'count': 0, 'total': 0.0, 'max': 0.0, 'buckets': [0] * len(BUCKETS)}
+        stats['count'] += 1
+        stats['total'] += seconds
+        stats['max'] = max(stats['max'], seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                stats['buckets'][i] += 1
+                break
+
+
+def incr(name: str, value: float = 1, **labels):
+    """Increase a counter (does nothing while disabled)."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+class _Span:
+    __slots__ = ('name', 'labels', 'start')
+
+    def __init__(self, name: str, labels: Dict):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **labels):
+    """Context manager that times its block (a shared no-op while disabled)."""
+    if not _enabled:
+        return _NOOP_SPAN
+    return _Span(name, labels)
+
+
+def snapshot() -> Dict:
+    """Everything recorded so far, as plain data."""
+    with _lock:
+        return {
+            'timings': [
+                {'name': name, 'labels': dict(labels), 'count': s['count'],
+                 'total_s': s['total'], 'mean_s': s['total'] / s['count'], 'max_s': s['max']}
+                for (name, labels), s in sorted(_timings.items())
+            ],
+            'counters': [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(_counters.items())
+            ],
+        }
+
+
+def write_metrics(path: str):
+    """Write snapshot() to a JSON file (replaced atomically)."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(snapshot(), written_at=time.time()), f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _prometheus_labels(labels: Tuple, extra: str = '') -> str:
+    parts = [f'{key}="{str(value).replace(chr(34), chr(39))}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def prometheus_text() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        timing_names = sorted({name for name, _ in _timings})
+        for metric in timing_names:
+            full = f'careercompass_{metric}_seconds'
+            lines.append(f'# TYPE {full} histogram')
+            for (name, labels), s in sorted(_timings.items()):
+                if name != metric:
+                    continue
+                cumulative = 0
+                for bound, n in zip(BUCKETS, s['buckets']):
+                    cumulative += n
+                    bucket_labels = _prometheus_labels(labels, 'le="%s"' % bound)
+                    lines.append(f'{full}_bucket{bucket_labels} {cumulative}')
+                inf_labels = _prometheus_labels(labels, 'le="+Inf"')
+                lines.append(f'{full}_bucket{inf_labels} {s["count"]}')
+                lines.append(f'{full}_sum{_prometheus_labels(labels)} {s["total"]}')
+                lines.append(f'{full}_count{_prometheus_labels(labels)} {s["count"]}')
+        for metric in sorted({name for name, _ in _counters}):
+            full = f'careercompass_{metric}_total'
+            lines.append(f'# TYPE {full} counter')
+            for (name, labels), value in sorted(_counters.items()):
+                if name == metric:
+                    lines.append(f'{full}{_prometheus_labels(labels)} {value}')
+    return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = prometheus_text().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve_prometheus(port: int = 9108, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """Serve prometheus_text() on http://host:port/metrics from a background thread."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True, name='metrics-server').start()
+    return server
+
+
+class profile:
+    """
+    Profile one block of code (e.g. a single page render).
+
+        with profile() as prof:
+            render_page()
+        print(prof.report)
+
+    Args:
+        engine: 'cprofile' (built in) or 'pyinstrument' (sampling, if installed)
+        active: Set to False to skip profiling without changing the code around it
+        limit: Number of functions to show in the cProfile report
+    """
+
+    def __init__(self, engine: str = 'cprofile', active: bool = True, limit: int = 30):
+        self.engine = engine
+        self.active = active
+        self.limit = limit
+        self.report = None
+        self._profiler = None
+
+    def __enter__(self):
+        if not self.active:
+            return self
+        if self.engine == 'pyinstrument':
+            from pyinstrument import Profiler
+            self._profiler = Profiler()
+            self._profiler.start()
+        else:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc):
+        if self._profiler is None:
+            return False
+        if self.engine == 'pyinstrument':
+            self._profiler.stop()
+            self.report = self._profiler.output_text()
+        else:
+            self._profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(self._profiler, stream=out).sort_stats('cumulative').print_stats(self.limit)
+            self.report = out.getvalue()
+        return False
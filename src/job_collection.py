@@ -0,0 +1,163 @@
+"""
+Compact in-memory job postings.
+
+JobPosting is a small fixed-field object (no per-posting dict), and
+JobCollection stores many postings column by column in pyarrow arrays,
+with company names stored once each (dictionary-encoded, like a pandas
+categorical). Slicing and filtering by company return views that share
+the same column data instead of copying it.
+
+Both behave like the job dictionaries used everywhere else (job['title'],
+job.get('url')), so existing functions accept them unchanged.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Union
+
+import numpy as np
+import pyarrow as pa
+
+FIELDS = ('company', 'title', 'description', 'url')
+
+
+class JobPosting:
+    """One job posting; reads like a job dictionary (posting['title'], posting.get('url'))."""
+
+    __slots__ = FIELDS
+
+    def __init__(self, company: str = '', title: str = '', description: str = '', url: str = 'N/A'):
+        self.company = company
+        self.title = title
+        self.description = description
+        self.url = url
+
+    @classmethod
+    def from_dict(cls, job: Dict) -> 'JobPosting':
+        return cls(job.get('company', ''), job.get('title', ''), job.get('description', ''), job.get('url', 'N/A'))
+
+    def __getitem__(self, key: str) -> str:
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in FIELDS else default
+
+    def keys(self):
+        return FIELDS
+
+    def to_dict(self) -> Dict[str, str]:
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def __eq__(self, other):
+        if isinstance(other, (JobPosting, dict)):
+            return all(self.get(field) == other.get(field) for field in FIELDS)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"JobPosting(company={self.company!r}, title={self.title!r})"
+
+
+class JobCollection:
+    """
+    Many postings stored as columns (pyarrow arrays).
+
+    Build one with JobCollection.from_records(jobs). Iterating gives
+    JobPosting objects; collection[i] is one posting and collection[a:b],
+    collection.for_company(name) are views over the same data.
+
+    Args:
+        table: pyarrow Table with the FIELDS columns ('company' dictionary-encoded)
+        rows: Row numbers of the table that belong to this view (None = all rows)
+    """
+
+    def __init__(self, table: pa.Table, rows: np.ndarray = None):
+        self.table = table
+        self.rows = rows
+        company = table.column('company').combine_chunks()
+        self._company_names = company.dictionary.to_pylist()
+        self._company_codes = company.indices.to_numpy(zero_copy_only=False)
+
+    @classmethod
+    def from_records(cls, jobs: Iterable[Union[Dict, JobPosting]]) -> 'JobCollection':
+        """Build a collection from job dictionaries (or JobPostings)."""
+        columns = {field: [] for field in FIELDS}
+        defaults = {'url': 'N/A'}
+        for job in jobs:
+            for field in FIELDS:
+                columns[field].append(job.get(field, defaults.get(field, '')))
+        return cls(pa.table({
+            'company': pa.array(columns['company'], pa.string()).dictionary_encode(),
+            'title': pa.array(columns['title'], pa.string()),
+            'description': pa.array(columns['description'], pa.large_string()),
+            'url': pa.array(columns['url'], pa.string()),
+        }))
+
+    def _view(self, table: pa.Table, rows: np.ndarray, company_codes: np.ndarray) -> 'JobCollection':
+        # Same column data and company names, different rows
+        view = JobCollection.__new__(JobCollection)
+        view.table, view.rows = table, rows
+        view._company_names = self._company_names
+        view._company_codes = company_codes
+        return view
+
+    def __len__(self) -> int:
+        return self.table.num_rows if self.rows is None else len(self.rows)
+
+    def column(self, field: str) -> List[str]:
+        """One field of every posting, in order (e.g. all descriptions)."""
+        values = self.table.column(field)
+        if self.rows is not None:
+            values = values.take(pa.array(self.rows))
+        return values.to_pylist()
+
+    def __iter__(self) -> Iterator[JobPosting]:
+        columns = [self.column(field) for field in FIELDS]
+        for values in zip(*columns):
+            yield JobPosting(*values)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if self.rows is None and key.step in (None, 1):
+                start, stop, _ = key.indices(len(self))
+                return self._view(self.table.slice(start, max(0, stop - start)), None,
+                                  self._company_codes[start:stop])
+            rows = np.arange(len(self))[key] if self.rows is None else self.rows[key]
+            return self._view(self.table, rows, self._company_codes)
+
+        index = range(len(self))[key]  # raises IndexError like a list
+        row = index if self.rows is None else int(self.rows[index])
+        return JobPosting(*(self.table.column(field)[row].as_py() for field in FIELDS))
+
+    def _codes(self) -> np.ndarray:
+        return self._company_codes if self.rows is None else self._company_codes[self.rows]
+
+    def companies(self) -> List[str]:
+        """Company names in order of their first posting."""
+        codes = self._codes()
+        _, first = np.unique(codes, return_index=True)
+        return [self._company_names[codes[i]] for i in sorted(first)]
+
+    def for_company(self, company: str) -> 'JobCollection':
+        """View of one company's postings (shares the column data, no copy)."""
+        if company not in self._company_names:
+            return self._view(self.table, np.zeros(0, dtype=np.int64), self._company_codes)
+        matches = np.flatnonzero(self._codes() == self._company_names.index(company))
+        return self._view(self.table, matches if self.rows is None else self.rows[matches], self._company_codes)
+
+    def by_company(self) -> Dict[str, 'JobCollection']:
+        """Company -> view of its postings, in order of first posting."""
+        return {company: self.for_company(company) for company in self.companies()}
+
+    def to_records(self) -> List[Dict]:
+        """Plain job dictionaries (a full copy)."""
+        return [posting.to_dict() for posting in self]
+
+    def to_pandas(self):
+        """DataFrame of the postings; 'company' becomes a pandas categorical."""
+        table = self.table if self.rows is None else self.table.take(pa.array(self.rows))
+        return table.to_pandas()
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the column data (shared with any views)."""
+        return self.table.nbytes
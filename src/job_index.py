@@ -0,0 +1,92 @@
+"""
+Ranks every job posting against one resume.
+Skills of every job are extracted once when the index is built; after that,
+ranking a resume only touches the postings that share a skill with it
+(an inverted index: skill -> ids of the jobs that ask for it).
+"""
+
+from typing import Dict, List, Set
+
+import numpy as np
+
+from src.nlp_processor import SkillMatrix, extract_skills, extract_skills_batch, job_descriptions
+
+
+class JobIndex:
+    """
+    Precomputed job skill sets plus an inverted index from skill to job ids.
+
+    Args:
+        jobs: Job dictionaries (with 'description') or a JobCollection
+        matrix: Their SkillMatrix, if already computed (e.g. from JobStore.skill_matrix())
+    """
+
+    def __init__(self, jobs: List[Dict], matrix: SkillMatrix = None):
+        if matrix is None:
+            matrix = extract_skills_batch(job_descriptions(jobs))
+        self.jobs = jobs
+        self.skills = matrix.skills
+
+        # Skill set size of every job (the denominator of the match score)
+        self.job_sizes = np.diff(matrix.indptr).astype(np.int32)
+
+        # Inverted index: skill column -> sorted array of job ids
+        rows = np.repeat(np.arange(len(jobs), dtype=np.int32), self.job_sizes)
+        order = np.argsort(matrix.indices, kind='stable')
+        columns = matrix.indices[order]
+        bounds = np.searchsorted(columns, np.arange(len(self.skills) + 1))
+        self.postings = {
+            skill: rows[order[bounds[j]:bounds[j + 1]]] for j, skill in enumerate(self.skills)
+        }
+
+        # Kept to rebuild a job's skill set for the have / missing lists of the top results
+        self._indptr = matrix.indptr
+        self._indices = matrix.indices
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def job_skills(self, job_id: int) -> Set[str]:
+        return {self.skills[j] for j in self._indices[self._indptr[job_id]:self._indptr[job_id + 1]]}
+
+    def rank(self, resume_text: str = None, resume_skills: Set[str] = None, top_k: int = 10) -> List[Dict]:
+        """
+        Best matching jobs for a resume, scored exactly like compare_skills.
+
+        Args:
+            resume_text: Text extracted from the resume (skills are extracted once)
+            resume_skills: Or the resume's skills, if already known
+            top_k: How many jobs to return
+
+        Returns:
+            List of compare_skills-style dictionaries (plus 'job_id' and 'job'),
+            best match first. Jobs sharing no skill with the resume are left out.
+        """
+        if resume_skills is None:
+            resume_skills = set(extract_skills(resume_text).keys())
+
+        # Count, for every job, how many of the resume's skills it asks for
+        hit_lists = [self.postings[skill] for skill in resume_skills if skill in self.postings]
+        if not hit_lists:
+            return []
+        hits = np.bincount(np.concatenate(hit_lists), minlength=len(self.jobs))
+
+        candidates = np.flatnonzero(hits)
+        scores = hits[candidates] / self.job_sizes[candidates]
+        # Best score first, then most matched skills, then original job order
+        order = np.lexsort((candidates, -hits[candidates], -scores))[:top_k]
+
+        results = []
+        for job_id in candidates[order]:
+            job_skills = self.job_skills(job_id)
+            skills_you_have = resume_skills & job_skills
+            results.append({
+                'job_id': int(job_id),
+                'job': self.jobs[job_id],
+                'score': round(len(skills_you_have) / len(job_skills) * 100, 1),
+                'skills_you_have': sorted(skills_you_have),
+                'skills_you_are_missing': sorted(job_skills - resume_skills),
+                'total_job_skills': len(job_skills),
+                'total_resume_skills': len(resume_skills),
+            })
+        return results
@@ -0,0 +1,449 @@
+"""
+Persistent job store (SQLite) so postings and their skills survive between runs.
+Each posting is keyed by a hash of its content, so re-scraping the same job
+is free: it is recognized and skipped instead of being extracted again.
+
+Skill counts are also kept in per-day, per-company buckets (skill_days):
+a new posting adds its counts to the day it was first seen, and an expired
+posting adds them to `removed` on the day it closed. Trends over any time
+window are read from these buckets (see SkillTrends) instead of the postings.
+Everything else (jobs, skill counts, skill_matrix) only covers open postings.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.nlp_processor import SkillMatcher, SkillMatrix, extract_skills_batch, get_default_matcher
+
+DEFAULT_STORE_PATH = os.path.join('data', 'jobs.sqlite')
+DAY_SECONDS = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    hash TEXT PRIMARY KEY,
+    company TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    url TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_skills (
+    hash TEXT NOT NULL REFERENCES jobs(hash),
+    skill TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (hash, skill)
+);
+CREATE INDEX IF NOT EXISTS job_skills_by_skill ON job_skills(skill);
+CREATE TABLE IF NOT EXISTS expired_jobs (
+    hash TEXT PRIMARY KEY REFERENCES jobs(hash),
+    day INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS skill_days (
+    day INTEGER NOT NULL,
+    company TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    added INTEGER NOT NULL DEFAULT 0,
+    removed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, company, skill)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def posting_hash(job: Dict) -> str:
+    """Content hash of a posting (company + title + description)."""
+    content = '\x1f'.join([job.get('company', ''), job.get('title', ''), job.get('description', '')])
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def day_number(timestamp: float) -> int:
+    """Days since 1970-01-01 (UTC) - the key of the skill_days buckets."""
+    return int(timestamp // DAY_SECONDS)
+
+
+def _vocab_fingerprint(matcher: SkillMatcher) -> str:
+    # Aliases change the stored counts too, so they are part of it
+    terms = [matcher.family] + matcher.vocabulary + sorted(f'{alias}={skill}' for alias, skill in matcher.aliases.items())
+    return hashlib.sha1('\n'.join(terms).encode('utf-8')).hexdigest()
+
+
+def _open_filter(open_only: bool) -> str:
+    """SQL condition on `jobs` that keeps only postings that haven't expired (if open_only)."""
+    return "jobs.hash NOT IN (SELECT hash FROM expired_jobs)" if open_only else "1"
+
+
+class JobStore:
+    """
+    Jobs plus their precomputed skill counts, stored in one SQLite file.
+
+    Args:
+        path: Database file (':memory:' for a throwaway store)
+        matcher: SkillMatcher used for extraction (defaults to TECHNICAL_SKILLS).
+            If the vocabulary changed since the store was written, stored
+            skills are re-extracted once so aggregates stay consistent.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, matcher: SkillMatcher = None):
+        self.path = path
+        self.matcher = matcher or get_default_matcher()
+
+        folder = os.path.dirname(path)
+        if path != ':memory:' and folder:
+            os.makedirs(folder, exist_ok=True)
+
+        # One connection shared by Streamlit's threads, guarded by a lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+        if self._get_meta('vocab') != _vocab_fingerprint(self.matcher):
+            self.reindex_skills()
+        elif self._get_meta('skill_days') is None:
+            # Store written before the skill_days buckets existed
+            with self._lock, self._conn:
+                self._rebuild_skill_days()
+
+    def close(self):
+        self._conn.close()
+
+    def _get_meta(self, key: str):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def _skill_rows(self, hashes: List[str], matrix: SkillMatrix) -> List[Tuple[str, str, int]]:
+        rows = []
+        for i, job_hash in enumerate(hashes):
+            start, end = matrix.indptr[i], matrix.indptr[i + 1]
+            for j, count in zip(matrix.indices[start:end], matrix.data[start:end]):
+                rows.append((job_hash, matrix.skills[j], int(count)))
+        return rows
+
+    def ingest(self, jobs: Iterable[Dict], skills: Iterable[Counter] = None,
+               batch_size: int = 1000, now: float = None) -> Dict[str, int]:
+        """
+        Add postings to the store. Postings already stored are only marked as
+        seen again; skills are extracted for the new ones only.
+        Works through the jobs in batches, so a stream of any length can be ingested.
+
+        Args:
+            jobs: Job dictionaries (company, title, description, url), JobPostings or a JobCollection
+            skills: Skill Counters already extracted for these jobs, in the same
+                order (e.g. from iter_extracted), so they aren't extracted twice
+            batch_size: Jobs written per transaction
+            now: Time to record the postings as seen at (default: now)
+
+        Returns:
+            Dictionary with the number of 'new' and 'seen' postings
+        """
+        pairs = zip(jobs, skills) if skills is not None else ((job, None) for job in jobs)
+        totals = {'new': 0, 'seen': 0}
+        batch = []
+        for pair in pairs:
+            batch.append(pair)
+            if len(batch) >= batch_size:
+                self._ingest_batch(batch, totals, now)
+                batch = []
+        if batch:
+            self._ingest_batch(batch, totals, now)
+
+        print(f"Stored {totals['new']} new jobs ({totals['seen']} already seen)")
+        return totals
+
+    def _ingest_batch(self, batch: List[Tuple[Dict, Counter]], totals: Dict[str, int], now: float = None):
+        now = now or time.time()
+        by_hash = {}
+        for job, job_skills in batch:
+            by_hash.setdefault(posting_hash(job), (job, job_skills))
+
+        with self._lock:
+            known = set()
+            hashes = list(by_hash)
+            # Look the hashes up in chunks (SQLite limits the number of ? parameters)
+            for i in range(0, len(hashes), 500):
+                chunk = hashes[i:i + 500]
+                known.update(row[0] for row in self._conn.execute(
+                    f"SELECT hash FROM jobs WHERE hash IN ({','.join('?' * len(chunk))})", chunk))
+
+        new_hashes = [job_hash for job_hash in by_hash if job_hash not in known]
+        skill_rows = []
+        to_extract = []
+        for job_hash in new_hashes:
+            job, job_skills = by_hash[job_hash]
+            if job_skills is None:
+                to_extract.append(job_hash)
+            else:
+                skill_rows.extend((job_hash, skill, count) for skill, count in job_skills.items())
+        if to_extract:
+            matrix = extract_skills_batch(
+                (by_hash[h][0].get('description', '') for h in to_extract), self.matcher)
+            skill_rows.extend(self._skill_rows(to_extract, matrix))
+
+        with self._lock, self._conn:
+            # Another session may have stored some of these postings since the lookup above
+            # (skills are extracted outside the lock); those count as seen, not new
+            inserted = set()
+            for job_hash in new_hashes:
+                job = by_hash[job_hash][0]
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (job_hash, job.get('company', ''), job.get('title', ''), job.get('description', ''),
+                     job.get('url', 'N/A'), now, now))
+                if cursor.rowcount:
+                    inserted.add(job_hash)
+            known.update(job_hash for job_hash in new_hashes if job_hash not in inserted)
+            skill_rows = [row for row in skill_rows if row[0] in inserted]
+
+            self._conn.executemany(
+                "UPDATE jobs SET last_seen = ? WHERE hash = ?", [(now, h) for h in known])
+            self._conn.executemany("INSERT INTO job_skills VALUES (?, ?, ?)", skill_rows)
+
+            # New postings count towards today's buckets
+            added = Counter()
+            for job_hash, skill, count in skill_rows:
+                added[(day_number(now), by_hash[job_hash][0].get('company', ''), skill)] += count
+            self._add_to_buckets('added', added)
+
+            # Expired postings that are back are open again
+            revived = self._expired_among(known)
+            if revived:
+                self._retract_expiry(revived)
+            if inserted or revived:
+                self._bump_version()
+
+        totals['new'] += len(inserted)
+        totals['seen'] += len(known)
+
+    def reindex_skills(self):
+        """Re-extract skills for every stored posting (after the vocabulary changes)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT hash, description FROM jobs").fetchall()
+        matrix = extract_skills_batch((description for _, description in rows), self.matcher)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM job_skills")
+            self._conn.executemany(
+                "INSERT INTO job_skills VALUES (?, ?, ?)",
+                self._skill_rows([job_hash for job_hash, _ in rows], matrix))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('vocab', ?)", (_vocab_fingerprint(self.matcher),))
+            self._rebuild_skill_days()
+            self._bump_version()
+
+    def _add_to_buckets(self, column: str, counts: Dict[Tuple[int, str, str], int]):
+        """Add (day, company, skill) -> count to the 'added' or 'removed' column of skill_days."""
+        self._conn.executemany(
+            f"INSERT INTO skill_days (day, company, skill, {column}) VALUES (?, ?, ?, ?) "
+            f"ON CONFLICT(day, company, skill) DO UPDATE SET {column} = {column} + excluded.{column}",
+            [(day, company, skill, count) for (day, company, skill), count in counts.items()])
+
+    def _company_skill_rows(self, hashes: List[str]) -> List[Tuple[str, str, str, int]]:
+        """(hash, company, skill, count) of the given postings."""
+        rows = []
+        for i in range(0, len(hashes), 500):
+            chunk = hashes[i:i + 500]
+            rows.extend(self._conn.execute(
+                "SELECT jobs.hash, jobs.company, job_skills.skill, job_skills.count "
+                "FROM job_skills JOIN jobs ON jobs.hash = job_skills.hash "
+                f"WHERE jobs.hash IN ({','.join('?' * len(chunk))})", chunk))
+        return rows
+
+    def _expired_among(self, hashes) -> List[Tuple[str, int]]:
+        hashes = list(hashes)
+        rows = []
+        for i in range(0, len(hashes), 500):
+            chunk = hashes[i:i + 500]
+            rows.extend(self._conn.execute(
+                f"SELECT hash, day FROM expired_jobs WHERE hash IN ({','.join('?' * len(chunk))})", chunk))
+        return rows
+
+    def _retract_expiry(self, expired: List[Tuple[str, int]]):
+        """Undo the 'removed' counts of postings that turned out to be still open."""
+        day_of = dict(expired)
+        removed = Counter()
+        for job_hash, company, skill, count in self._company_skill_rows(list(day_of)):
+            removed[(day_of[job_hash], company, skill)] -= count
+        self._add_to_buckets('removed', removed)
+        self._conn.executemany("DELETE FROM expired_jobs WHERE hash = ?", [(h,) for h in day_of])
+
+    @property
+    def version(self) -> int:
+        """Goes up whenever postings are added, expired or reopened (a cache key for aggregates)."""
+        return int(self._get_meta('version') or 0)
+
+    def _bump_version(self):
+        """Caller holds the lock, inside a transaction."""
+        self._conn.execute(
+            "INSERT INTO meta VALUES ('version', '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1")
+
+    def _select(self, open_only: bool, postings: Iterable[Dict] = None) -> str:
+        """
+        SQL condition on `jobs` for the postings to aggregate (caller holds the lock).
+        `postings` are put in a temporary table, so any number of them can be used.
+        """
+        condition = _open_filter(open_only)
+        if postings is None:
+            return condition
+        with self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS selected_jobs (hash TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM selected_jobs")
+            self._conn.executemany("INSERT OR IGNORE INTO selected_jobs VALUES (?)",
+                                   ((posting_hash(job),) for job in postings))
+        return condition + " AND jobs.hash IN (SELECT hash FROM selected_jobs)"
+
+    def _rebuild_skill_days(self):
+        """Recompute every skill_days bucket from the postings (caller holds the lock)."""
+        self._conn.execute("DELETE FROM skill_days")
+        self._conn.execute(
+            "INSERT INTO skill_days (day, company, skill, added) "
+            "SELECT CAST(jobs.first_seen / ? AS INTEGER), jobs.company, job_skills.skill, SUM(job_skills.count) "
+            "FROM job_skills JOIN jobs ON jobs.hash = job_skills.hash GROUP BY 1, 2, 3", (DAY_SECONDS,))
+        self._conn.execute(
+            "INSERT INTO skill_days (day, company, skill, removed) "
+            "SELECT expired_jobs.day, jobs.company, job_skills.skill, SUM(job_skills.count) "
+            "FROM job_skills JOIN jobs ON jobs.hash = job_skills.hash "
+            "JOIN expired_jobs ON expired_jobs.hash = jobs.hash WHERE true GROUP BY 1, 2, 3 "
+            "ON CONFLICT(day, company, skill) DO UPDATE SET removed = removed + excluded.removed")
+        self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('skill_days', '1')")
+
+    def expire_postings(self, max_age_days: float = 7, now: float = None, companies: Iterable[str] = None) -> int:
+        """
+        Mark postings that haven't been seen for `max_age_days` as closed.
+        Their skills are retracted from the trend buckets from the day after
+        they were last seen. If one shows up again, ingest reopens it.
+
+        Args:
+            max_age_days: Days a posting may go unseen before it counts as closed
+            now: Current time (default: now)
+            companies: Only expire postings of these companies, e.g. the ones whose
+                scrape just finished (a site that could not be reached says
+                nothing about its postings). Default: every company
+
+        Returns:
+            Number of postings that were expired
+        """
+        now = now or time.time()
+        if companies is not None:
+            companies = set(companies)
+        with self._lock, self._conn:
+            expired = [(job_hash, day_number(last_seen) + 1)
+                       for job_hash, company, last_seen in self._conn.execute(
+                           "SELECT jobs.hash, jobs.company, jobs.last_seen FROM jobs "
+                           "LEFT JOIN expired_jobs ON expired_jobs.hash = jobs.hash "
+                           "WHERE expired_jobs.hash IS NULL AND jobs.last_seen < ?",
+                           (now - max_age_days * DAY_SECONDS,)).fetchall()
+                       if companies is None or company in companies]
+            day_of = dict(expired)
+            removed = Counter()
+            for job_hash, company, skill, count in self._company_skill_rows(list(day_of)):
+                removed[(day_of[job_hash], company, skill)] += count
+            self._add_to_buckets('removed', removed)
+            self._conn.executemany("INSERT INTO expired_jobs VALUES (?, ?)", expired)
+            if expired:
+                self._bump_version()
+        return len(expired)
+
+    def skill_days(self) -> List[Tuple[int, str, str, int, int]]:
+        """Every trend bucket as (day, company, skill, added, removed), oldest day first."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT day, company, skill, added, removed FROM skill_days "
+                "WHERE added != 0 OR removed != 0 ORDER BY day").fetchall()
+
+    def jobs(self, company: str = None, open_only: bool = True) -> List[Dict]:
+        """Stored postings (optionally for one company), oldest first; open ones only unless open_only=False."""
+        query = f"SELECT company, title, description, url FROM jobs WHERE {_open_filter(open_only)}"
+        params = ()
+        if company is not None:
+            query += " AND company = ?"
+            params = (company,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY first_seen, rowid", params).fetchall()
+        return [{'company': c, 'title': t, 'description': d, 'url': u} for c, t, d, u in rows]
+
+    def skill_counts(self, open_only: bool = True, postings: Iterable[Dict] = None) -> Dict[str, int]:
+        """
+        Same result as get_skill_counts over the stored jobs, without re-extracting.
+        Closed (expired) postings are left out unless open_only=False.
+
+        Args:
+            open_only: Leave out expired postings
+            postings: Only count these postings (e.g. the current scrape, already ingested)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_skills.skill, SUM(job_skills.count) AS total "
+                "FROM job_skills JOIN jobs ON jobs.hash = job_skills.hash "
+                f"WHERE {self._select(open_only, postings)} "
+                "GROUP BY job_skills.skill ORDER BY total DESC, job_skills.skill").fetchall()
+        return dict(rows)
+
+    def company_skill_counts(self, open_only: bool = True,
+                             postings: Iterable[Dict] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Skill counts per company (companies in the order first stored), most common first.
+        Takes the same filters as skill_counts.
+        """
+        with self._lock:
+            selected = self._select(open_only, postings)
+            companies = self._conn.execute(
+                f"SELECT company FROM jobs WHERE {selected} "
+                "GROUP BY company ORDER BY MIN(rowid)").fetchall()
+            rows = self._conn.execute(
+                "SELECT jobs.company, job_skills.skill, SUM(job_skills.count) AS total "
+                "FROM job_skills JOIN jobs ON jobs.hash = job_skills.hash "
+                f"WHERE {selected} "
+                "GROUP BY jobs.company, job_skills.skill "
+                "ORDER BY total DESC, job_skills.skill").fetchall()
+        by_company = {company: {} for (company,) in companies}
+        for company, skill, total in rows:
+            by_company[company][skill] = total
+        return by_company
+
+    def skill_matrix(self, open_only: bool = True) -> Tuple[List[Dict], SkillMatrix]:
+        """
+        Stored jobs and their skills as a SkillMatrix, rebuilt from the stored
+        counts (no extraction). Rows follow the order of the returned jobs.
+        Closed (expired) postings are left out unless open_only=False.
+        """
+        with self._lock:
+            job_rows = self._conn.execute(
+                "SELECT hash, company, title, description, url FROM jobs "
+                f"WHERE {_open_filter(open_only)} ORDER BY first_seen, rowid").fetchall()
+            skill_rows = self._conn.execute("SELECT hash, skill, count FROM job_skills").fetchall()
+
+        skills = self.matcher.vocabulary
+        skill_index = self.matcher.skill_index
+        per_job = {}
+        for job_hash, skill, count in skill_rows:
+            per_job.setdefault(job_hash, []).append((skill_index[skill], count))
+
+        indptr = [0]
+        indices = []
+        data = []
+        for job_hash, *_ in job_rows:
+            for j, count in sorted(per_job.get(job_hash, [])):
+                indices.append(j)
+                data.append(count)
+            indptr.append(len(indices))
+
+        jobs = [{'company': c, 'title': t, 'description': d, 'url': u} for _, c, t, d, u in job_rows]
+        matrix = SkillMatrix(skills, np.array(indptr, dtype=np.int64),
+                             np.array(indices, dtype=np.int32), np.array(data, dtype=np.int32))
+        return jobs, matrix
@@ -1,134 +1,717 @@
 import re
 from collections import Counter
-from typing import List, Dict, Set
-import PyPDF2
+from typing import List, Dict, Set, Iterable, Tuple
+import numpy as np
 import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-# Comprehensive list of technical skills to search for
-# Week 1: Start with this hardcoded list
-TECHNICAL_SKILLS = {
-    # Programming Languages
-    'python', 'java', 'javascript', 'c++', 'c#', 'r', 'matlab', 'sql',
-    'typescript', 'go', 'rust', 'kotlin', 'swift', 'scala', 'ruby',
-    
-    # Web Technologies
-    'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-    'html', 'css', 'bootstrap', 'tailwind', 'next.js',
-    
-    # Databases
-    'mysql', 'postgresql', 'mongodb', 'redis', 'cassandra', 'dynamodb',
-    
-    # Cloud & DevOps
-    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform',
-    'ci/cd', 'git', 'github', 'gitlab',
-    
-    # Data Science & ML
-    'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'keras',
-    'machine learning', 'deep learning', 'nlp', 'computer vision',
-    'data analysis', 'statistics', 'tableau', 'power bi',
-    
-    # Engineering Tools
-    'autocad', 'solidworks', 'catia', 'ansys', 'matlab', 'simulink',
-    'labview', 'pcb design', 'vhdl', 'verilog', 'spice',
-    
-    # Methodologies & Concepts
-    'agile', 'scrum', 'rest api', 'microservices', 'oop', 'tdd',
-    'data structures', 'algorithms', 'system design',
-    
-    # Other
-    'linux', 'excel', 'jira', 'confluence', 'slack'
+from src.instrumentation import span, incr
+from src.skill_taxonomy import get_default_taxonomy
+
+# Comprehensive list of technical skills to search for.
+# Skills, their categories and aliases ('k8s' -> 'kubernetes') live in src/skill_taxonomy.json
+TECHNICAL_SKILLS = set(get_default_taxonomy().skills)
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a "word" character that the regex word boundary uses."""
+    return ch.isalnum() or ch == '_'
+
+
+def _ends_on_boundary(text: str, end: int) -> bool:
+    """True if a regex word boundary (\\b) sits right before text[end]."""
+    return _is_word_char(text[end - 1]) != (end < len(text) and _is_word_char(text[end]))
+
+
+class SkillMatcher:
+    """
+    Finds every skill from a vocabulary in a single pass over the text.
+
+    All skills are compiled into one regex shaped like a trie, so the text is
+    scanned once instead of once per skill. Matching follows the same
+    word-boundary rules the old per-skill loop used, so the counts are identical
+    (including how tokens like 'c++', 'c#', 'node.js' and 'ci/cd' behave).
+
+    Aliases are compiled into the same regex and counted as their skill
+    ('k8s' counts as 'kubernetes'), so they cost no extra pass either.
+
+    Build it once and reuse it - compiling is the expensive part.
+    """
+
+    # Matchers of the same family always find the same counts
+    family = 'regex'
+
+    def __init__(self, skills, aliases: Dict[str, str] = None):
+        self.skills = frozenset(skill.lower() for skill in skills)
+        # alias -> skill (aliases of skills outside the vocabulary are ignored)
+        self.aliases = {alias.lower(): skill.lower() for alias, skill in (aliases or {}).items()
+                        if skill.lower() in self.skills and alias.lower() not in self.skills}
+        # Identifies what this matcher finds (cache keys, stored results)
+        self.key = (self.family, self.skills, frozenset(self.aliases.items()))
+        # Stable column order for matrices and bitmasks: skill i is vocabulary[i]
+        self.vocabulary = sorted(self.skills)
+        self.skill_index = {skill: i for i, skill in enumerate(self.vocabulary)}
+
+        self._compile(self.skills | set(self.aliases))
+
+    def _compile(self, terms: Set[str]):
+        """Build the lookup structure for every skill and alias."""
+        trie = {}
+        for skill in terms:
+            node = trie
+            for ch in skill:
+                node = node.setdefault(ch, {})
+            node[''] = True  # marks the end of a skill
+
+        # The lookahead lets us see matches that start inside a previous one
+        # (e.g. 'js' inside 'node.js'), just like separate findall calls would.
+        # (An empty vocabulary would compile to a pattern that matches everywhere.)
+        self._pattern = re.compile(r'(?=\b(' + self._trie_regex(trie) + r'))') if terms else None
+
+        # The regex reports the longest skill at each position, so remember
+        # which shorter skills are prefixes of it (e.g. 'machine' / 'machine learning')
+        by_length = sorted(terms, key=len)
+        self._shorter_prefixes = {
+            skill: [other for other in by_length if other != skill and skill.startswith(other)]
+            for skill in terms
+        }
+
+    @classmethod
+    def _trie_regex(cls, node: Dict) -> str:
+        """Turn a trie node into a regex; longer skills are tried first."""
+        alternatives = [
+            re.escape(ch) + cls._trie_regex(child)
+            for ch, child in sorted(node.items()) if ch
+        ]
+        if '' in node:
+            alternatives.append(r'\b')
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+
+    def find(self, text: str) -> Counter:
+        """
+        Count every skill occurrence in the text.
+
+        Args:
+            text: Job description or resume text
+
+        Returns:
+            Counter object with skill frequencies
+        """
+        if not text:
+            return Counter()
+        return self._count(self._matches(text.lower()))
+
+    def find_batch(self, texts: Iterable[str]) -> Iterable[Counter]:
+        """find() for many texts, in order (backends may batch the work)."""
+        return map(self.find, texts)
+
+    def _count(self, matches) -> Counter:
+        """Count skills from _matches() output, applying the overlap rules."""
+        found_skills = Counter()
+        last_end = {}  # a skill's own matches never overlap (same as re.findall)
+        covered_end = 0  # aliases don't count inside another match ('js' in 'node.js')
+
+        for start, terms in matches:
+            for term in terms:
+                end = start + len(term)
+                skill = self.aliases.get(term, term)
+                if skill is not term and start < covered_end:
+                    continue
+                # Keyed by skill, so 'react.js' or 'microsoft excel' count their skill once
+                if last_end.get(skill, -1) > start:
+                    continue
+                last_end[skill] = end
+                covered_end = max(covered_end, end)
+                found_skills[skill] += 1
+
+        return found_skills
+
+    def _matches(self, text_lower: str):
+        """
+        Yield (start, terms) for every position where skills or aliases match
+        (with word boundaries on both ends), longest term first.
+        """
+        if self._pattern is None:
+            return
+        for match in self._pattern.finditer(text_lower):
+            start = match.start()
+            longest = match.group(1)
+            shorter = self._shorter_prefixes[longest]
+            if not shorter:
+                yield start, (longest,)
+                continue
+            # Check the closing word boundary of the shorter terms ourselves
+            yield start, [longest] + [term for term in shorter if _ends_on_boundary(text_lower, start + len(term))]
+
+    def to_mask(self, skills: Iterable[str]) -> int:
+        """Encode a set of skills as an integer bitmask (bit i = vocabulary[i])."""
+        mask = 0
+        for skill in skills:
+            mask |= 1 << self.skill_index[skill]
+        return mask
+
+    def from_mask(self, mask: int) -> List[str]:
+        """Decode a bitmask back into its skills (sorted, because the vocabulary is)."""
+        skills = []
+        while mask:
+            lowest = mask & -mask
+            skills.append(self.vocabulary[lowest.bit_length() - 1])
+            mask ^= lowest
+        return skills
+
+
+_WORD_RUN = re.compile(r'\w+')
+
+
+class TokenMatcher(SkillMatcher):
+    """
+    SkillMatcher that tokenizes the text once and looks skills up in a hash table.
+
+    The text is split into runs of word characters. At every run that can
+    start a skill, windows of 1-3 runs are looked up as-is, including what
+    sits between and right after them, so 'node.js', 'ci/cd', 'c++', 'c#'
+    and 'machine learning' are all found. The cost per document grows with
+    the number of tokens, not with the size of the vocabulary, and the counts
+    are the same as SkillMatcher's (same word-boundary and overlap rules).
+    """
+
+    def _compile(self, terms: Set[str]):
+        self._terms = frozenset(terms)
+        self._first_words = set()
+        self._max_words = 1
+        suffix_lengths = set()
+        for term in terms:
+            words = _WORD_RUN.findall(term)
+            if not words or not term.startswith(words[0]):
+                raise ValueError(f"TokenMatcher skills must start with a letter or digit: '{term}'")
+            self._first_words.add(words[0])
+            self._max_words = max(self._max_words, len(words))
+            # Characters after the last word run, e.g. '++' in 'c++'
+            suffix_lengths.add(len(term) - term.rindex(words[-1]) - len(words[-1]))
+        self._suffix_lengths = sorted(suffix_lengths - {0})
+
+    def _matches(self, text_lower: str):
+        runs = [(match.start(), match.end()) for match in _WORD_RUN.finditer(text_lower)]
+        for i, (start, end) in enumerate(runs):
+            if text_lower[start:end] not in self._first_words:
+                continue
+            found = []
+            for _, stop in runs[i:i + self._max_words]:
+                # A window always ends on a boundary; a suffix ('c++') needs checking
+                if text_lower[start:stop] in self._terms:
+                    found.append(text_lower[start:stop])
+                for extra in self._suffix_lengths:
+                    candidate = text_lower[start:stop + extra]
+                    if candidate in self._terms and stop + extra <= len(text_lower) \
+                            and _ends_on_boundary(text_lower, stop + extra):
+                        found.append(candidate)
+            if found:
+                # Same order as SkillMatcher: the longest term, then the others shortest first
+                found.sort(key=len)
+                yield start, [found[-1]] + found[:-1]
+
+
+class SpacyMatcher(SkillMatcher):
+    """
+    SkillMatcher that finds skills with a spaCy PhraseMatcher (case-insensitive, LOWER).
+
+    Only spaCy's tokenizer runs: the pipeline is spacy.blank('en'), so there is
+    no tagger, parser or NER and no model to download. Skills are matched on
+    whole spaCy tokens, so counts can differ from the regex backends, e.g.
+    'C++,' and 'c#,' are found (the regex needs a word character after the
+    symbol) and 'r' is not found inside 'r&d'.
+
+    Many texts go through nlp.pipe in batches (find_batch).
+
+    Args:
+        skills, aliases: As for SkillMatcher
+        batch_size: Texts per nlp.pipe batch
+        n_process: Processes nlp.pipe tokenizes with
+    """
+
+    family = 'spacy'
+
+    def __init__(self, skills, aliases: Dict[str, str] = None, batch_size: int = 256, n_process: int = 1):
+        self.batch_size = batch_size
+        self.n_process = n_process
+        super().__init__(skills, aliases)
+
+    def _compile(self, terms: Set[str]):
+        # Imported here so only this backend pays for loading spaCy
+        import spacy
+        from spacy.matcher import PhraseMatcher
+
+        self._nlp = spacy.blank('en')
+        self._phrase_matcher = PhraseMatcher(self._nlp.vocab, attr='LOWER')
+        for term in sorted(terms):
+            self._phrase_matcher.add(term, [self._nlp.make_doc(term)])
+
+    def find(self, text: str) -> Counter:
+        if not text:
+            return Counter()
+        return self._count(self._doc_matches(self._nlp.make_doc(text)))
+
+    def find_batch(self, texts: Iterable[str]) -> Iterable[Counter]:
+        docs = self._nlp.pipe(texts, batch_size=self.batch_size, n_process=self.n_process)
+        for doc in docs:
+            yield self._count(self._doc_matches(doc))
+
+    def _doc_matches(self, doc):
+        """Same (start, terms) pairs as _matches(), from the PhraseMatcher's spans."""
+        by_start = {}
+        for match_id, start, end in self._phrase_matcher(doc):
+            by_start.setdefault(doc[start].idx, []).append(self._nlp.vocab.strings[match_id])
+        for start in sorted(by_start):
+            found = sorted(by_start[start], key=len)
+            yield start, [found[-1]] + found[:-1]
+
+
+# Extraction backends that can be picked at runtime (set_extraction_backend)
+EXTRACTION_BACKENDS = {
+    'regex': SkillMatcher,
+    'tokens': TokenMatcher,
+    'spacy': SpacyMatcher,
 }
 
+_default_matcher = None
+_default_vocab = frozenset()
+_default_backend = 'regex'
+
+
+def set_extraction_backend(name: str):
+    """
+    Choose how the shared matcher finds skills: 'regex' (default), 'tokens' or 'spacy'.
+    Can also be set with the CAREERCOMPASS_EXTRACTOR environment variable.
+    """
+    global _default_backend
+    if name not in EXTRACTION_BACKENDS:
+        raise ValueError(f"Unknown extraction backend '{name}' (choose from {', '.join(EXTRACTION_BACKENDS)})")
+    _default_backend = name
+
 
-def extract_skills(text: str) -> Counter:
+if os.environ.get('CAREERCOMPASS_EXTRACTOR'):
+    set_extraction_backend(os.environ['CAREERCOMPASS_EXTRACTOR'])
+
+
+def get_default_matcher() -> SkillMatcher:
+    """
+    Returns the shared SkillMatcher for TECHNICAL_SKILLS (with the taxonomy's aliases).
+    It is rebuilt automatically if TECHNICAL_SKILLS is edited (e.g. in a notebook)
+    or another extraction backend is chosen.
+    """
+    global _default_matcher, _default_vocab
+    matcher_class = EXTRACTION_BACKENDS[_default_backend]
+    if _default_matcher is None or _default_vocab != TECHNICAL_SKILLS or type(_default_matcher) is not matcher_class:
+        _default_vocab = frozenset(TECHNICAL_SKILLS)
+        _default_matcher = matcher_class(_default_vocab, get_default_taxonomy().aliases)
+    return _default_matcher
+
+
+def extract_skills(text: str, matcher: SkillMatcher = None) -> Counter:
     """
     Extract technical skills from text using keyword matching.
     
     Args:
         text: Job description or resume text
+        matcher: Optional prebuilt SkillMatcher (defaults to TECHNICAL_SKILLS)
         
     Returns:
         Counter object with skill frequencies
     """
     if not text:
         return Counter()
-    
-    # Convert to lowercase for matching
-    text_lower = text.lower()
-    
-    # Find all skills present in the text
-    found_skills = Counter()
-    
-    for skill in TECHNICAL_SKILLS:
-        # Use word boundaries to avoid partial matches
-        # e.g., "java" should not match "javascript"
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        matches = re.findall(pattern, text_lower)
-        if matches:
-            found_skills[skill] = len(matches)
-    
-    return found_skills
 
+    if matcher is None:
+        matcher = get_default_matcher()
+
+    # Word boundaries avoid partial matches,
+    # e.g., "java" should not match "javascript"
+    return matcher.find(text)
+
+
+class SkillMatrix:
+    """
+    Sparse document x skill count matrix (CSR layout, built on NumPy).
+
+    Row i holds the skill counts of document i. Columns follow `skills`,
+    which is sorted so the same vocabulary always gives the same index.
+    Only non-zero entries are stored, so memory grows with the number of
+    skills actually found, not documents x vocabulary.
+    """
+
+    def __init__(self, skills: List[str], indptr: np.ndarray,
+                 indices: np.ndarray, data: np.ndarray):
+        self.skills = skills
+        self.skill_index = {skill: i for i, skill in enumerate(skills)}
+        self.indptr = indptr    # row i lives in indices/data[indptr[i]:indptr[i + 1]]
+        self.indices = indices  # column (skill) of each stored count
+        self.data = data        # the count itself
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.indptr) - 1, len(self.skills)
+
+    def row(self, i: int) -> Counter:
+        """Skill counts of one document as a Counter (same as extract_skills)."""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return Counter({self.skills[j]: int(c) for j, c in zip(self.indices[start:end], self.data[start:end])})
+
+    def _entry_weights(self, weights: np.ndarray = None) -> np.ndarray:
+        """Stored counts, each multiplied by its document's weight (if given)."""
+        if weights is None:
+            return self.data
+        return self.data * np.repeat(np.asarray(weights, dtype=np.int64), np.diff(self.indptr))
+
+    def totals(self, weights: np.ndarray = None) -> np.ndarray:
+        """
+        Total count of every skill across all documents.
+
+        Args:
+            weights: Optional weight per document (e.g. DuplicateClusters.weights(),
+                so reposted duplicates only count once)
+        """
+        return np.bincount(self.indices, weights=self._entry_weights(weights),
+                           minlength=len(self.skills)).astype(np.int64)
 
-def get_skill_counts(job_list: List[Dict]) -> Dict[str, int]:
+    def group_totals(self, labels: List, weights: np.ndarray = None) -> Tuple[List, np.ndarray]:
+        """
+        Sum rows that share a label (e.g. the company of each job).
+
+        Args:
+            labels: One label per document
+            weights: Optional weight per document (see totals)
+
+        Returns:
+            (group names in first-seen order, groups x skills array of counts)
+        """
+        groups = list(dict.fromkeys(labels))
+        group_of_label = {label: i for i, label in enumerate(groups)}
+        row_groups = np.fromiter((group_of_label[label] for label in labels), dtype=np.int64, count=len(labels))
+
+        # Group id of every stored entry, then one bincount over (group, skill) cells
+        entry_groups = np.repeat(row_groups, np.diff(self.indptr))
+        n_skills = len(self.skills)
+        flat = np.bincount(entry_groups * n_skills + self.indices, weights=self._entry_weights(weights),
+                           minlength=len(groups) * n_skills)
+        return groups, flat.astype(np.int64).reshape(len(groups), n_skills)
+
+    def top_n(self, counts: np.ndarray, n: int = None) -> List[Tuple[str, int]]:
+        """
+        Top skills from a counts vector (e.g. totals() or one row of group_totals()).
+        Ties are broken alphabetically; skills with a zero count are left out.
+        """
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        if n is not None:
+            order = order[:n]
+        return [(self.skills[j], int(counts[j])) for j in order]
+
+    def to_dense(self) -> np.ndarray:
+        """Full documents x skills array. Only use this on small matrices."""
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+        return dense
+
+    def to_scipy(self):
+        """Convert to a scipy.sparse.csr_matrix (needs scipy installed)."""
+        from scipy.sparse import csr_matrix
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+
+def extract_skills_batch(texts: Iterable[str], matcher: SkillMatcher = None) -> SkillMatrix:
+    """
+    Extract skills from many documents at once.
+
+    Args:
+        texts: Job descriptions or resumes
+        matcher: Optional prebuilt SkillMatcher (defaults to TECHNICAL_SKILLS)
+
+    Returns:
+        SkillMatrix with one row per text
+    """
+    if matcher is None:
+        matcher = get_default_matcher()
+
+    skill_index = matcher.skill_index
+
+    indptr = [0]
+    indices = []
+    data = []
+    with span('skill_extraction_batch'):
+        for found in matcher.find_batch(texts):
+            for skill, count in found.items():
+                indices.append(skill_index[skill])
+                data.append(count)
+            indptr.append(len(indices))
+    incr('documents_extracted', len(indptr) - 1)
+
+    return SkillMatrix(
+        matcher.vocabulary,
+        np.array(indptr, dtype=np.int64),
+        np.array(indices, dtype=np.int32),
+        np.array(data, dtype=np.int32),
+    )
+
+
+def job_descriptions(job_list) -> List[str]:
+    """
+    The description of every job, in order.
+    A JobCollection gives its whole description column at once.
+    """
+    if hasattr(job_list, 'column'):
+        return job_list.column('description')
+    return [job.get('description', '') for job in job_list]
+
+
+def get_skill_counts(job_list: List[Dict], workers: int = 1, by_category: bool = False,
+                     dedup: bool = False) -> Dict[str, int]:
     """
     Process a list of jobs and count skill occurrences across all jobs.
     
     Args:
-        job_list: List of job dictionaries with 'description' key
+        job_list: List of job dictionaries with 'description' key (or a JobCollection)
+        workers: Number of processes to use (1 = run here, None = all CPU cores)
+        by_category: Add the counts up per taxonomy category (same single pass over the jobs)
+        dedup: Count near-duplicate postings (the same role reposted per location) once;
+            skills are only extracted from one posting of each group
         
     Returns:
-        Dictionary mapping skills to their total count
+        Dictionary mapping skills (or categories) to their total count
     """
-    total_skills = Counter()
-    
-    for job in job_list:
-        description = job.get('description', '')
-        job_skills = extract_skills(description)
-        total_skills.update(job_skills)
-    
-    # Convert Counter to regular dict and sort by count
-    skill_dict = dict(total_skills.most_common())
+    jobs_processed = len(job_list)
+    if dedup:
+        from src.dedup import dedupe_jobs
+        job_list, clusters = dedupe_jobs(job_list)
+        print(f"Skipped {clusters.duplicates} near-duplicate postings")
+
+    if workers == 1:
+        matrix = extract_skills_batch(job_descriptions(job_list))
+        # Sorted by count, most common first
+        skill_dict = dict(matrix.top_n(matrix.totals()))
+    else:
+        skill_dict = parallel_skill_counts(job_list, workers=workers)
     
-    print(f"Processed {len(job_list)} jobs")
+    print(f"Processed {jobs_processed} jobs")
     print(f"Found {len(skill_dict)} unique skills")
     
+    if by_category:
+        return get_default_taxonomy().roll_up(skill_dict)
     return skill_dict
 
 
-def read_pdf_text(uploaded_file) -> str:
+def iter_extracted(jobs: Iterable[Dict], matcher: SkillMatcher = None):
+    """
+    Streaming extraction stage: yields (job, skill Counter) one job at a time,
+    so nothing is kept around after a job has been processed.
+    """
+    if matcher is None:
+        matcher = get_default_matcher()
+    for job in jobs:
+        with span('skill_extraction'):
+            skills = matcher.find(job.get('description', ''))
+        incr('documents_extracted')
+        yield job, skills
+
+
+class SkillAggregator:
+    """
+    Running skill counts (overall and per company) that grow one job at a time.
+    Memory depends on the number of skills and companies, never on the number of jobs.
+    """
+
+    def __init__(self):
+        self.totals = Counter()
+        self.by_company = {}
+        self.jobs_seen = 0
+
+    def add(self, job: Dict, skills: Counter):
+        self.totals.update(skills)
+        company = job.get('company', '')
+        if company not in self.by_company:
+            self.by_company[company] = Counter()
+        self.by_company[company].update(skills)
+        self.jobs_seen += 1
+
+    def consume(self, extracted: Iterable[Tuple[Dict, Counter]], every: int = 50):
+        """
+        Add every (job, skills) pair from a stream, yielding self after each
+        `every` jobs (and once at the end) so callers can show partial results.
+        """
+        for job, skills in extracted:
+            self.add(job, skills)
+            if self.jobs_seen % every == 0:
+                yield self
+        if self.jobs_seen % every != 0 or self.jobs_seen == 0:
+            yield self
+
+    @staticmethod
+    def _ordered(counts: Counter, n: int = None) -> List[Tuple[str, int]]:
+        # Same order as get_skill_counts: count descending, ties alphabetical
+        ordered = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        return ordered if n is None else ordered[:n]
+
+    def skill_counts(self) -> Dict[str, int]:
+        """Current totals, same format as get_skill_counts."""
+        return dict(self._ordered(self.totals))
+
+    def top_skills(self, n: int = None) -> List[Tuple[str, int]]:
+        return self._ordered(self.totals, n)
+
+    def company_skill_counts(self) -> Dict[str, Dict[str, int]]:
+        """Current per-company counts, each most common first."""
+        return {company: dict(self._ordered(counts)) for company, counts in self.by_company.items()}
+
+
+# Each worker process builds its own matcher once, when it starts
+_worker_matcher = None
+
+
+def _init_skill_worker(matcher_class: type, skills: frozenset, aliases: Dict[str, str]):
+    global _worker_matcher
+    _worker_matcher = matcher_class(skills, aliases)
+
+
+def _count_shard(texts: List[str]) -> Counter:
+    total = Counter()
+    for found in _worker_matcher.find_batch(texts):
+        total.update(found)
+    return total
+
+
+def _tree_reduce(partials: List[Counter]) -> Counter:
+    """Merge partial counts pairwise (log2(n) rounds) instead of one long chain."""
+    if not partials:
+        return Counter()
+    while len(partials) > 1:
+        merged = []
+        for i in range(0, len(partials) - 1, 2):
+            partials[i].update(partials[i + 1])
+            merged.append(partials[i])
+        if len(partials) % 2:
+            merged.append(partials[-1])
+        partials = merged
+    return partials[0]
+
+
+def parallel_skill_counts(job_list: List[Dict], workers: int = None,
+                          chunk_size: int = None) -> Dict[str, int]:
+    """
+    Same result as get_skill_counts, but the jobs are split across a pool of processes.
+    Regex matching holds the GIL, so processes (not threads) are needed for a speedup.
+
+    Args:
+        job_list: List of job dictionaries with 'description' key (or a JobCollection)
+        workers: Number of processes (defaults to the number of CPU cores)
+        chunk_size: Jobs per shard (defaults to ~4 shards per worker)
+
+    Returns:
+        Dictionary mapping skills to their total count, most common first
+    """
+    workers = workers or os.cpu_count() or 1
+    texts = job_descriptions(job_list)
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(texts) // (workers * 4)))
+    shards = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    matcher = get_default_matcher()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_skill_worker,
+                             initargs=(type(matcher), matcher.skills, matcher.aliases)) as pool:
+        partials = list(pool.map(_count_shard, shards))
+
+    total_skills = _tree_reduce(partials)
+    # Same ordering as the serial path: count descending, ties alphabetical
+    return dict(sorted(total_skills.items(), key=lambda item: (-item[1], item[0])))
+
+
+class _MemoryViewReader(io.RawIOBase):
+    """Read-only file object over a memoryview, so PyPDF2 can read it without a copy."""
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast('B')
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def readinto(self, b):
+        chunk = self._view[self._pos:self._pos + len(b)]
+        b[:len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+
+def iter_pdf_pages(source, max_pages: int = None, min_chars: int = None):
+    """
+    Yield the text of a PDF one page at a time (pages are only parsed when asked for).
+
+    Args:
+        source: Streamlit uploaded file / open binary file, a file path,
+            or the PDF bytes themselves (bytes, bytearray or memoryview)
+        max_pages: Stop after this many pages
+        min_chars: Stop once at least this many characters have been yielded
+
+    Yields:
+        Text of each page ('' for pages without extractable text)
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source) if isinstance(source, bytes) else _MemoryViewReader(source)
+    if not hasattr(source, 'read'):
+        # File path: the with-block closes it even if parsing fails or we stop early
+        with open(source, 'rb') as pdf_file:
+            yield from iter_pdf_pages(pdf_file, max_pages, min_chars)
+        return
+
+    # Imported here so only the Resume Matcher pays for loading PyPDF2
+    import PyPDF2
+    
+    # Create PDF reader object (reads straight from the file, no extra copy)
+    pdf_reader = PyPDF2.PdfReader(source)
+
+    collected = 0
+    for page_number, page in enumerate(pdf_reader.pages):
+        if max_pages is not None and page_number >= max_pages:
+            break
+        with span('pdf_page_parse'):
+            page_text = page.extract_text() or ""
+        yield page_text
+        collected += len(page_text)
+        if min_chars is not None and collected >= min_chars:
+            break
+
+
+def read_pdf_text(uploaded_file, max_pages: int = None, min_chars: int = None) -> str:
     """
     Extract text from an uploaded PDF file.
     Week 3 function - for resume parsing.
     
     Args:
-        uploaded_file: Streamlit uploaded file object or file path
+        uploaded_file: Streamlit uploaded file object or file path (or PDF bytes)
+        max_pages: Only read this many pages
+        min_chars: Stop reading pages once this much text has been found
         
     Returns:
         Extracted text as string
     """
     try:
-        # Handle Streamlit uploaded file
-        if hasattr(uploaded_file, 'read'):
-            pdf_bytes = uploaded_file.read()
-            pdf_file = io.BytesIO(pdf_bytes)
-        else:
-            # Handle file path
-            pdf_file = open(uploaded_file, 'rb')
-        
-        # Create PDF reader object
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        
-        # Extract text from all pages
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        
-        # Close file if we opened it
-        if not hasattr(uploaded_file, 'read'):
-            pdf_file.close()
-            
-        return text.strip()
+        return "\n".join(iter_pdf_pages(uploaded_file, max_pages, min_chars)).strip()
         
     except Exception as e:
         print(f"Error reading PDF: {e}")
@@ -147,26 +730,39 @@ def compare_skills(resume_text: str, job_text: str) -> Dict:
     Returns:
         Dictionary with match score and skill lists
     """
-    # Extract skills from both
-    resume_skills = set(extract_skills(resume_text).keys())
-    job_skills = set(extract_skills(job_text).keys())
+    # Extract skills from both, as bitmasks over the skill vocabulary
+    matcher = get_default_matcher()
+    resume_mask = matcher.to_mask(extract_skills(resume_text, matcher))
+    job_mask = matcher.to_mask(extract_skills(job_text, matcher))
+    return compare_masks(resume_mask, job_mask, matcher)
+
+
+def compare_masks(resume_mask: int, job_mask: int, matcher: SkillMatcher = None) -> Dict:
+    """
+    compare_skills for skills that were already extracted (as SkillMatcher.to_mask bitmasks).
+    
+    Returns:
+        Dictionary with match score and skill lists
+    """
+    matcher = matcher or get_default_matcher()
     
     # Calculate matches
-    skills_you_have = resume_skills & job_skills  # Intersection
-    skills_you_are_missing = job_skills - resume_skills  # Difference
+    skills_you_have = resume_mask & job_mask  # Intersection
+    skills_you_are_missing = job_mask & ~resume_mask  # Difference
+    total_job_skills = job_mask.bit_count()
     
     # Calculate match score
-    if len(job_skills) == 0:
+    if total_job_skills == 0:
         match_score = 0
     else:
-        match_score = (len(skills_you_have) / len(job_skills)) * 100
+        match_score = (skills_you_have.bit_count() / total_job_skills) * 100
     
     return {
         'score': round(match_score, 1),
-        'skills_you_have': sorted(list(skills_you_have)),
-        'skills_you_are_missing': sorted(list(skills_you_are_missing)),
-        'total_job_skills': len(job_skills),
-        'total_resume_skills': len(resume_skills)
+        'skills_you_have': matcher.from_mask(skills_you_have),
+        'skills_you_are_missing': matcher.from_mask(skills_you_are_missing),
+        'total_job_skills': total_job_skills,
+        'total_resume_skills': resume_mask.bit_count()
     }
 
 
@@ -0,0 +1,150 @@
+"""
+HTML parsing for the scrapers' results pages.
+
+Uses the fastest backend that is installed:
+  - selectolax (pip install selectolax)
+  - lxml through BeautifulSoup (pip install lxml)
+  - Python's built-in html.parser (always available, slowest)
+
+With the BeautifulSoup backends only the job cards and the next-page link are
+kept while parsing (SoupStrainer), and CSS selectors are compiled once and
+reused for every page.
+"""
+
+import importlib.util
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+BACKENDS = ('selectolax', 'lxml', 'html.parser')
+
+# Selectors like 'div', 'div.job-card' or '.job-card.featured' (tag and classes only)
+_SIMPLE_SELECTOR = re.compile(r'^([a-zA-Z][\w-]*)?((?:\.[\w-]+)*)$')
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first."""
+    return [name for name in BACKENDS
+            if name == 'html.parser' or importlib.util.find_spec(name) is not None]
+
+
+def pick_backend(backend: str = None) -> str:
+    """The requested backend, or the fastest installed one if None."""
+    if backend is None:
+        return available_backends()[0]
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown HTML backend {backend!r} (choose from {', '.join(BACKENDS)})")
+    if backend not in available_backends():
+        raise ValueError(f"HTML backend {backend!r} is not installed")
+    return backend
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selector: str):
+    """Compiled soupsieve selector, shared by every page and scraper that uses it."""
+    return soupsieve.compile(selector)
+
+
+def _strainer(selectors: List[str]) -> Optional[SoupStrainer]:
+    """
+    A SoupStrainer keeping only the elements the selectors can match.
+    None if a selector is more than tag + classes (then the whole page is parsed).
+    """
+    names, classes = set(), set()
+    for selector in selectors:
+        match = _SIMPLE_SELECTOR.match(selector.strip())
+        if not match or not selector.strip():
+            return None
+        tag, class_part = match.groups()
+        names.add(tag)
+        classes.update(class_part.split('.')[1:] or [None])
+    # None in a set means "any tag" / "any class"
+    name = None if None in names else sorted(names)
+    if None in classes:
+        return SoupStrainer(name) if name else None
+    return SoupStrainer(name, class_=sorted(classes))
+
+
+class PageParser:
+    """
+    Pulls job cards out of a results page.
+
+    Args:
+        card_selector: CSS selector of one job card
+        fields: Field name -> (CSS selector inside the card, attribute or None for the text)
+        next_page_selector: CSS selector of the "next page" link (optional)
+        backend: 'selectolax', 'lxml' or 'html.parser' (default: fastest installed)
+        strain: Only parse the cards and the next-page link (BeautifulSoup backends)
+    """
+
+    def __init__(self, card_selector: str, fields: Dict[str, Tuple[str, Optional[str]]],
+                 next_page_selector: str = None, backend: str = None, strain: bool = True):
+        self.card_selector = card_selector
+        self.fields = fields
+        self.next_page_selector = next_page_selector
+        self.backend = pick_backend(backend)
+
+        selectors = [card_selector] + ([next_page_selector] if next_page_selector else [])
+        self.strainer = _strainer(selectors) if strain else None
+
+    def parse(self, html, limit: int = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Args:
+            html: Page content (str or bytes)
+            limit: Maximum number of cards to return
+
+        Returns:
+            (one dictionary of field values per card, href of the next-page link or None).
+            A field is None when its element (or attribute) is missing.
+        """
+        if self.backend == 'selectolax':
+            return self._parse_selectolax(html, limit)
+        return self._parse_soup(html, limit)
+
+    def _parse_soup(self, html, limit):
+        soup = BeautifulSoup(html, self.backend, parse_only=self.strainer)
+
+        cards = []
+        for card in compile_selector(self.card_selector).select(soup, limit=limit or 0):
+            values = {}
+            for field, (selector, attribute) in self.fields.items():
+                element = compile_selector(selector).select_one(card)
+                if element is None:
+                    values[field] = None
+                elif attribute:
+                    values[field] = element.get(attribute)
+                else:
+                    values[field] = element.text.strip()
+            cards.append(values)
+
+        next_href = None
+        if self.next_page_selector:
+            link = compile_selector(self.next_page_selector).select_one(soup)
+            next_href = link.get('href') if link else None
+        return cards, next_href
+
+    def _parse_selectolax(self, html, limit):
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html)
+        cards = []
+        for card in tree.css(self.card_selector)[:limit or None]:
+            values = {}
+            for field, (selector, attribute) in self.fields.items():
+                element = card.css_first(selector)
+                if element is None:
+                    values[field] = None
+                elif attribute:
+                    values[field] = element.attributes.get(attribute)
+                else:
+                    values[field] = element.text(deep=True).strip()
+            cards.append(values)
+
+        next_href = None
+        if self.next_page_selector:
+            link = tree.css_first(self.next_page_selector)
+            next_href = link.attributes.get('href') if link else None
+        return cards, next_href
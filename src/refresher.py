@@ -0,0 +1,127 @@
+"""
+Background refresh of the dashboard data.
+
+A SnapshotRefresher thread, started once with the app, rebuilds the snapshot
+(scrape -> extract -> store -> write_snapshot) every `interval_seconds`,
+give or take some random jitter so several servers don't all hit the
+sponsor sites at the same moment. A finished snapshot is published by
+swapping a single reference, so page renders always read a complete,
+unchanging snapshot and never wait for (or start) a scrape themselves.
+
+    refresher = SnapshotRefresher(interval_seconds=30 * 60).start()
+    refresher.snapshot           # latest completed snapshot (None until the first one)
+    refresher.request_refresh()  # refresh soon, in the background
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from src.instrumentation import span, incr
+from src.job_store import DEFAULT_STORE_PATH
+from src.snapshot import DEFAULT_SNAPSHOT_DIR, Snapshot, build_snapshot, load_latest_snapshot
+
+
+class SnapshotRefresher:
+    """
+    Keeps a fresh Snapshot, rebuilt on a schedule by one background thread.
+
+    If a new enough snapshot is already on disk (written by cron or another
+    server process), it is picked up instead of scraping again.
+
+    Args:
+        interval_seconds: Time between refreshes
+        jitter: Random +/- fraction of the interval added to every wait (0.1 = +/-10%)
+        snapshot_dir: Where snapshots are read and written
+        store_path: JobStore database the refreshes update
+        live: Scrape the real sites (default: test data)
+        build: Function that writes a new snapshot and returns its path
+            (defaults to snapshot.build_snapshot with the settings above)
+    """
+
+    def __init__(self, interval_seconds: float = 30 * 60, jitter: float = 0.1,
+                 snapshot_dir: str = DEFAULT_SNAPSHOT_DIR, store_path: str = DEFAULT_STORE_PATH,
+                 live: bool = False, build: Callable[[], str] = None):
+        self.interval_seconds = interval_seconds
+        self.jitter = jitter
+        self.snapshot_dir = snapshot_dir
+        self._build = build or (lambda: build_snapshot(store_path, snapshot_dir, live=live))
+        self._snapshot = load_latest_snapshot(snapshot_dir)
+
+        self.refreshes = 0
+        self.last_error = None
+        self.last_duration = None
+        self.next_refresh_at = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def snapshot(self) -> Optional[Snapshot]:
+        """The latest completed snapshot (None until the first refresh finishes)."""
+        return self._snapshot
+
+    def start(self) -> 'SnapshotRefresher':
+        """Start the background thread (once); returns self."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='snapshot-refresher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = None):
+        """Stop the thread after the refresh that is running (if any)."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def request_refresh(self):
+        """Refresh as soon as possible, in the background (never in the caller's thread)."""
+        self._wake.set()
+
+    def next_delay(self) -> float:
+        """The interval plus or minus the jitter."""
+        return self.interval_seconds * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _is_fresh(self, snapshot: Optional[Snapshot]) -> bool:
+        min_age = self.interval_seconds * (1 - self.jitter)
+        return snapshot is not None and time.time() - snapshot.created_at < min_age
+
+    def refresh(self, force: bool = False) -> Snapshot:
+        """
+        Build a new snapshot and publish it (or adopt a fresh enough one from disk).
+        Normally called by the background thread; safe to call directly in scripts.
+        """
+        latest = load_latest_snapshot(self.snapshot_dir)
+        if not force and self._is_fresh(latest):
+            self._snapshot = latest
+            return latest
+
+        start = time.perf_counter()
+        with span('snapshot_refresh'):
+            snapshot = Snapshot(self._build())
+        self.last_duration = time.perf_counter() - start
+        self._snapshot = snapshot  # one reference swap publishes it
+        self.refreshes += 1
+        incr('snapshot_refreshes')
+        return snapshot
+
+    def _run(self):
+        # Refresh right away unless a recent snapshot already exists
+        delay = 0 if not self._is_fresh(self._snapshot) else self.next_delay()
+        while not self._stop.is_set():
+            self.next_refresh_at = time.time() + delay
+            requested = self._wake.wait(delay)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.refresh(force=requested)
+                self.last_error = None
+            except Exception as e:
+                # Keep serving the previous snapshot and try again at the next interval
+                self.last_error = f"{type(e).__name__}: {e}"
+                incr('snapshot_refresh_errors')
+                print(f"Background refresh failed: {self.last_error}")
+            delay = self.next_delay()
@@ -3,65 +3,242 @@ Web scraper for job postings from SHPE sponsor companies.
 Week 1: Basic scraper for one company
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
-from typing import List, Dict
+from typing import Dict, TYPE_CHECKING
+from functools import partial
+from urllib.parse import urljoin
 
-def scrape_google_jobs(max_jobs=10):
+from src.fetch_cache import FetchCache, DEFAULT_CACHE_PATH
+from src.instrumentation import span
+
+# requests and the HTML parsers are only imported when a real scrape runs,
+# so the app starts (and reruns) quickly on test data
+if TYPE_CHECKING:
+    from src.fetcher import PoliteFetcher
+    from src.page_parser import PageParser
+
+# Every company scraper class registers itself here (see register_scraper)
+SCRAPER_REGISTRY = {}
+
+
+def register_scraper(scraper_class):
+    """Class decorator that adds a CompanyScraper to SCRAPER_REGISTRY."""
+    SCRAPER_REGISTRY[scraper_class.company] = scraper_class
+    return scraper_class
+
+
+def _job_key(job: Dict) -> str:
+    """Identifies a posting across refreshes (its link, or its title if it has none)."""
+    return job['url'] if job.get('url', 'N/A') != 'N/A' else job['title']
+
+
+class CompanyScraper:
     """
-    Scrapes job postings from Google Careers.
+    Base class for one company's careers site.
+
+    Subclasses only declare where the jobs are and how to find them:
+    the start URL, CSS selectors for the job cards and their fields, and
+    (optionally) the selector of the "next page" link for pagination.
+    """
+
+    company = None
+    start_url = None
+    card_selector = 'div.job-card'
+    title_selector = 'h3.job-title'
+    description_selector = 'div.job-description'
+    link_selector = 'a.job-link'
+    next_page_selector = None  # e.g. 'a.next-page'; None = single page
+    max_pages = 1
+    max_jobs = 10
+    html_backend = None  # 'selectolax', 'lxml' or 'html.parser'; None = fastest installed
+
+    def __init__(self, start_url: str = None, html_backend: str = None):
+        if start_url:
+            self.start_url = start_url
+        if html_backend:
+            self.html_backend = html_backend
+        self._parser = None
+
+    @property
+    def parser(self) -> 'PageParser':
+        """The page parser for this site's selectors (built once, reused for every page)."""
+        if self._parser is None:
+            from src.page_parser import PageParser
+            self._parser = PageParser(
+                self.card_selector,
+                {
+                    'title': (self.title_selector, None),
+                    'description': (self.description_selector, None),
+                    'url': (self.link_selector, 'href'),
+                },
+                next_page_selector=self.next_page_selector,
+                backend=self.html_backend,
+            )
+        return self._parser
+
+    def parse_page(self, html, page_url: str = None, max_jobs: int = None):
+        """
+        Parses job cards out of one results page.
+        
+        Args:
+            html: Page content (str or bytes)
+            page_url: URL of the page (used to resolve a relative next-page link)
+            max_jobs: Maximum number of jobs to return
+            
+        Returns:
+            (list of job dictionaries, URL of the next page or None)
+        """
+        with span('html_parse', company=self.company):
+            return self._parse_page(html, page_url, max_jobs)
+
+    def _parse_page(self, html, page_url, max_jobs):
+        jobs = []
+        cards, next_href = self.parser.parse(html, limit=max_jobs)
+        
+        for card in cards:
+            if card['title'] is not None and card['description'] is not None:
+                jobs.append({
+                    'company': self.company,
+                    'title': card['title'],
+                    'description': card['description'],
+                    'url': card['url'] or 'N/A'
+                })
+        
+        next_url = urljoin(page_url or self.start_url, next_href) if next_href else None
+        return jobs, next_url
+
+    def iter_jobs(self, fetcher: 'PoliteFetcher', cache: FetchCache = None,
+                  max_jobs: int = None, stats: Dict = None):
+        """
+        Yields postings page by page, as soon as each page is parsed.
+
+        Pages are requested with If-None-Match / If-Modified-Since from the cache.
+        A 304 reuses the jobs parsed last time, so only changed pages get parsed.
+
+        Args:
+            fetcher: Shared PoliteFetcher
+            cache: FetchCache to read/update (memory-only if not given)
+            max_jobs: Maximum number of jobs to yield (defaults to self.max_jobs)
+            stats: Optional dictionary that gets 'changed_keys', 'pages_fetched'
+                and 'pages_unchanged' filled in while scraping
+
+        Yields:
+            Job dictionaries
+        """
+        max_jobs = max_jobs or self.max_jobs
+        if cache is None:
+            cache = FetchCache(path=None)
+        if stats is None:
+            stats = {}
+        stats.update(changed_keys=set(), pages_fetched=0, pages_unchanged=0)
+
+        yielded = 0
+        url = self.start_url
+
+        for _ in range(self.max_pages):
+            if not url or yielded >= max_jobs:
+                break
+            cached = cache.get(url)
+            response = fetcher.get(url, headers=cache.conditional_headers(url))
+
+            if response.status_code == 304 and cached:
+                page_jobs, next_url = cached['jobs'], cached['next_url']
+                stats['pages_unchanged'] += 1
+            else:
+                page_jobs, next_url = self.parse_page(response.content, url)
+                previous = {_job_key(job): job for job in cached['jobs']} if cached else {}
+                stats['changed_keys'].update(
+                    _job_key(job) for job in page_jobs if previous.get(_job_key(job)) != job
+                )
+                cache.put(url, {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'jobs': page_jobs,
+                    'next_url': next_url,
+                })
+                stats['pages_fetched'] += 1
+
+            for job in page_jobs[:max_jobs - yielded]:
+                yield job
+            yielded += min(len(page_jobs), max_jobs - yielded)
+            url = next_url
+
+    def scrape(self, fetcher: 'PoliteFetcher', cache: FetchCache = None, max_jobs: int = None) -> Dict:
+        """
+        Scrapes every results page, skipping pages the server says are unchanged.
+
+        Args:
+            fetcher: Shared PoliteFetcher
+            cache: FetchCache to read/update (memory-only if not given)
+            max_jobs: Maximum number of jobs to return (defaults to self.max_jobs)
+
+        Returns:
+            Dictionary with 'jobs' (all current postings), 'changed_jobs' (new or
+            edited since the last refresh), 'pages_fetched' and 'pages_unchanged'
+        """
+        stats = {}
+        jobs = list(self.iter_jobs(fetcher, cache, max_jobs, stats))
+        print(f"Successfully scraped {len(jobs)} jobs from {self.company} "
+              f"({stats['pages_fetched']} pages fetched, {stats['pages_unchanged']} unchanged)")
+        return {
+            'company': self.company,
+            'jobs': jobs,
+            'changed_jobs': [job for job in jobs if _job_key(job) in stats['changed_keys']],
+            'pages_fetched': stats['pages_fetched'],
+            'pages_unchanged': stats['pages_unchanged'],
+        }
+
+
+@register_scraper
+class GoogleScraper(CompanyScraper):
+    """
+    Google Careers.
     This is a SIMPLIFIED example - real implementation will vary by site.
+    """
+    company = 'Google'
+    # NOTE: This is a placeholder URL - you'll need to find the actual careers page
+    start_url = "https://careers.google.com/jobs/results/"
+    # TODO: Inspect the actual website and update these selectors
+    # This is a TEMPLATE - you need to find the correct CSS selectors
+    card_selector = 'div.job-card'
+    title_selector = 'h3.job-title'
+    description_selector = 'div.job-description'
+    link_selector = 'a.job-link'
+    next_page_selector = 'a.next-page'
+    max_pages = 5
+
+
+# Week 2: Add more companies here, e.g.
+# @register_scraper
+# class LockheedScraper(CompanyScraper):
+#     company = 'Lockheed Martin'
+#     start_url = "..."
+
+
+def scrape_google_jobs(max_jobs=10, fetcher=None, url=None):
+    """
+    Scrapes job postings from Google Careers.
     
     Args:
         max_jobs: Maximum number of jobs to scrape
+        fetcher: Shared PoliteFetcher (a private one is created if not given)
+        url: Results page to scrape (override to point at a local test server)
         
     Returns:
         List of dictionaries with job data
     """
     jobs = []
-    
-    # NOTE: This is a placeholder URL - you'll need to find the actual careers page
-    # Example: "https://careers.google.com/jobs/results/"
-    url = "https://careers.google.com/jobs/results/"
+    own_fetcher = fetcher is None
+    if own_fetcher:
+        from src.fetcher import PoliteFetcher
+        fetcher = PoliteFetcher()
     
     try:
-        # Make request with headers to avoid being blocked
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # TODO: Inspect the actual website and update these selectors
-        # This is a TEMPLATE - you need to find the correct CSS selectors
-        job_cards = soup.find_all('div', class_='job-card', limit=max_jobs)
-        
-        for card in job_cards:
-            try:
-                # Extract job details (UPDATE THESE SELECTORS)
-                title = card.find('h3', class_='job-title')
-                description = card.find('div', class_='job-description')
-                link = card.find('a', class_='job-link')
-                
-                if title and description:
-                    jobs.append({
-                        'company': 'Google',
-                        'title': title.text.strip(),
-                        'description': description.text.strip(),
-                        'url': link['href'] if link else 'N/A'
-                    })
-            except Exception as e:
-                print(f"Error parsing job card: {e}")
-                continue
-                
-        print(f"Successfully scraped {len(jobs)} jobs from Google")
-        
+        jobs = GoogleScraper(url).scrape(fetcher, max_jobs=max_jobs)['jobs']
     except Exception as e:
         print(f"Error scraping Google jobs: {e}")
+    finally:
+        if own_fetcher:
+            fetcher.close()
     
     return jobs
 
@@ -105,12 +282,89 @@ def scrape_test_data():
     ]
 
 
-def scrape_all_job_data(use_test_data=True):
+def refresh_job_data(cache_path=DEFAULT_CACHE_PATH, companies=None, max_workers=8):
+    """
+    Incremental scrape of every registered company.
+    Pages that haven't changed since the last run come back as 304 and are not re-parsed.
+    
+    Args:
+        cache_path: Where the fetch cache lives (None = don't keep one)
+        companies: Company names from SCRAPER_REGISTRY to scrape (default: all)
+        max_workers: How many company scrapers may run at the same time
+        
+    Returns:
+        Dictionary with 'jobs' (all postings), 'changed_jobs' (only the new or
+        edited ones - the only postings that need skill extraction again),
+        'pages_fetched' and 'pages_unchanged'
+    """
+    from src.fetcher import PoliteFetcher
+    
+    cache = FetchCache(cache_path)
+    scrapers = [SCRAPER_REGISTRY[name]() for name in (companies or SCRAPER_REGISTRY)]
+    
+    # Scrapers run concurrently; the fetcher keeps each site's request rate polite
+    with PoliteFetcher(max_workers=max_workers) as fetcher:
+        results = fetcher.run_all([partial(scraper.scrape, cache=cache) for scraper in scrapers],
+                                  names=[scraper.company for scraper in scrapers])
+    cache.save()
+    
+    refresh = {'jobs': [], 'changed_jobs': [], 'pages_fetched': 0, 'pages_unchanged': 0}
+    for result in results:
+        if not result:  # that scraper failed (already reported)
+            continue
+        refresh['jobs'].extend(result['jobs'])
+        refresh['changed_jobs'].extend(result['changed_jobs'])
+        refresh['pages_fetched'] += result['pages_fetched']
+        refresh['pages_unchanged'] += result['pages_unchanged']
+    
+    return refresh
+
+
+def iter_job_data(use_test_data=True, max_workers=8, cache_path=None, scrapers=None, completed=None):
+    """
+    Streaming version of scrape_all_job_data: yields postings as soon as they are parsed,
+    from all companies at once, instead of waiting for the slowest scraper.
+    Only a small buffer of postings is held in memory at any time.
+    
+    Args:
+        use_test_data: If True, yields fake data. Set to False when scraper is ready.
+        max_workers: How many company scrapers may run at the same time
+        cache_path: Fetch cache to use for conditional requests (None = fetch everything)
+        scrapers: CompanyScraper instances to run (default: one of every registered scraper)
+        completed: Optional set that gets the companies whose scrape finished without an error
+        
+    Yields:
+        Job dictionaries (in arrival order, so companies are interleaved)
+    """
+    if use_test_data:
+        print("Using test data...")
+        jobs = scrape_test_data()
+        yield from jobs
+        if completed is not None:
+            completed.update(job['company'] for job in jobs)
+        return
+    
+    from src.fetcher import PoliteFetcher
+    
+    cache = FetchCache(cache_path)
+    if scrapers is None:
+        scrapers = [scraper_class() for scraper_class in SCRAPER_REGISTRY.values()]
+    try:
+        with PoliteFetcher(max_workers=max_workers) as fetcher:
+            yield from fetcher.iter_all([partial(scraper.iter_jobs, cache=cache) for scraper in scrapers],
+                                        names=[scraper.company for scraper in scrapers], completed=completed)
+    finally:
+        cache.save()
+
+
+def scrape_all_job_data(use_test_data=True, max_workers=8, cache_path=None):
     """
     Master function to scrape from all target companies.
     
     Args:
         use_test_data: If True, returns fake data. Set to False when scraper is ready.
+        max_workers: How many company scrapers may run at the same time
+        cache_path: Fetch cache to use for conditional requests (None = fetch everything)
         
     Returns:
         List of all job postings from all companies
@@ -119,24 +373,7 @@ def scrape_all_job_data(use_test_data=True):
         print("Using test data...")
         return scrape_test_data()
     
-    all_jobs = []
-    
-    # Week 2: Add more companies here
-    companies = [
-        scrape_google_jobs,
-        # scrape_lockheed_jobs,
-        # scrape_ti_jobs,
-    ]
-    
-    for scraper_func in companies:
-        try:
-            jobs = scraper_func()
-            all_jobs.extend(jobs)
-            time.sleep(2)  # Be polite - don't hammer servers
-        except Exception as e:
-            print(f"Error with {scraper_func.__name__}: {e}")
-    
-    return all_jobs
+    return refresh_job_data(cache_path=cache_path, max_workers=max_workers)['jobs']
 
 
 if __name__ == "__main__":
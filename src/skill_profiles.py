@@ -0,0 +1,113 @@
+"""
+Compact skill profiles: every job or resume becomes a row of bits over the
+skill vocabulary (bit i = SkillMatcher.vocabulary[i]), packed into 64-bit words.
+Matching is then AND + popcount over whole arrays of profiles at once,
+about 16 bytes per posting for the ~100 skills in TECHNICAL_SKILLS.
+"""
+
+from typing import Iterable, List
+
+import numpy as np
+
+from src.nlp_processor import SkillMatcher, SkillMatrix, extract_skills_batch, get_default_matcher
+
+
+class SkillProfiles:
+    """
+    A (profiles x words) uint64 array of skill bitsets.
+
+    Args:
+        vocabulary: Skill for every bit position (SkillMatcher.vocabulary)
+        words: Packed bits, shape (number of profiles, ceil(len(vocabulary) / 64))
+    """
+
+    def __init__(self, vocabulary: List[str], words: np.ndarray):
+        self.vocabulary = vocabulary
+        self.words = words
+
+    def __len__(self) -> int:
+        return self.words.shape[0]
+
+    @staticmethod
+    def n_words(vocabulary: List[str]) -> int:
+        return max(1, -(-len(vocabulary) // 64))
+
+    @classmethod
+    def from_matrix(cls, matrix: SkillMatrix) -> 'SkillProfiles':
+        """Profiles from a SkillMatrix (a skill is set if its count is non-zero)."""
+        words = np.zeros((matrix.shape[0], cls.n_words(matrix.skills)), dtype=np.uint64)
+        rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+        columns = matrix.indices.astype(np.uint64)
+        np.bitwise_or.at(words, (rows, columns // 64), np.uint64(1) << (columns % np.uint64(64)))
+        return cls(matrix.skills, words)
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str], matcher: SkillMatcher = None) -> 'SkillProfiles':
+        """Extract skills from every text and encode them."""
+        return cls.from_matrix(extract_skills_batch(texts, matcher))
+
+    @classmethod
+    def from_masks(cls, masks: Iterable[int], matcher: SkillMatcher = None) -> 'SkillProfiles':
+        """Profiles from integer bitmasks (SkillMatcher.to_mask)."""
+        vocabulary = (matcher or get_default_matcher()).vocabulary
+        n_bytes = cls.n_words(vocabulary) * 8
+        packed = b''.join(mask.to_bytes(n_bytes, 'little') for mask in masks)
+        words = np.frombuffer(packed, dtype='<u8').astype(np.uint64)
+        return cls(vocabulary, words.reshape(-1, cls.n_words(vocabulary)))
+
+    def mask(self, i: int) -> int:
+        """Profile i as an integer bitmask."""
+        return int.from_bytes(self.words[i].astype('<u8').tobytes(), 'little')
+
+    def skills(self, i: int) -> List[str]:
+        """Skills of profile i, sorted."""
+        bits = np.unpackbits(self.words[i].astype('<u8').view(np.uint8), bitorder='little')
+        return [self.vocabulary[j] for j in np.flatnonzero(bits[:len(self.vocabulary)])]
+
+    def sizes(self) -> np.ndarray:
+        """Number of skills in every profile."""
+        return np.bitwise_count(self.words).sum(axis=1, dtype=np.int64)
+
+
+def match_scores(resume: int, jobs: SkillProfiles) -> np.ndarray:
+    """
+    compare_skills' match score of one resume against every job at once.
+
+    Args:
+        resume: The resume's skills as a bitmask (SkillMatcher.to_mask)
+        jobs: Profiles of the jobs
+
+    Returns:
+        Float array with one score (0-100, rounded to 0.1) per job
+    """
+    resume_words = np.frombuffer(resume.to_bytes(jobs.words.shape[1] * 8, 'little'), dtype='<u8').astype(np.uint64)
+    hits = np.bitwise_count(jobs.words & resume_words).sum(axis=1, dtype=np.int64)
+    return _scores(hits, jobs.sizes())
+
+
+def score_matrix(resumes: SkillProfiles, jobs: SkillProfiles, chunk_cells: int = 4_000_000) -> np.ndarray:
+    """
+    Match score of every resume against every job (resumes x jobs).
+
+    Resumes are processed in chunks so the temporary AND array stays around
+    `chunk_cells` words no matter how many resumes are scored.
+
+    Returns:
+        float32 array of scores (0-100, rounded to 0.1), shape (len(resumes), len(jobs))
+    """
+    job_sizes = jobs.sizes()
+    n_words = jobs.words.shape[1]
+    scores = np.zeros((len(resumes), len(jobs)), dtype=np.float32)
+    step = max(1, chunk_cells // max(1, len(jobs) * n_words))
+    for start in range(0, len(resumes), step):
+        block = resumes.words[start:start + step]
+        hits = np.bitwise_count(block[:, None, :] & jobs.words[None, :, :]).sum(axis=2, dtype=np.int64)
+        scores[start:start + step] = _scores(hits, job_sizes)
+    return scores
+
+
+def _scores(hits: np.ndarray, job_sizes: np.ndarray) -> np.ndarray:
+    # Jobs without any skill score 0 (same rule as compare_skills)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = np.where(job_sizes > 0, hits / job_sizes * 100, 0.0)
+    return np.round(scores, 1)
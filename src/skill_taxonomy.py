@@ -0,0 +1,98 @@
+"""
+Skill taxonomy: every skill's category and the other names it goes by.
+
+The taxonomy lives in skill_taxonomy.json as category -> skill -> aliases:
+
+    {"Cloud & DevOps": {"kubernetes": ["k8s"], ...}, ...}
+
+It is flattened once into two lookups (skill -> category, alias -> skill).
+SkillMatcher compiles the skills and aliases into the same single regex,
+so adding aliases does not add passes over the text, and category totals
+are a roll-up of skill counts that were already computed.
+"""
+
+import json
+import os
+from typing import Dict, List
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), 'skill_taxonomy.json')
+
+
+def normalize(term: str) -> str:
+    """Lowercase with single spaces, the form skills and aliases are stored in."""
+    return ' '.join(term.lower().split())
+
+
+class SkillTaxonomy:
+    """
+    Skills grouped into categories, each with its aliases.
+
+    Args:
+        categories: category -> skill -> list of aliases (the JSON file's layout)
+
+    Raises:
+        ValueError: If a skill is listed twice or an alias is ambiguous
+    """
+
+    def __init__(self, categories: Dict[str, Dict[str, List[str]]]):
+        self.categories = list(categories)
+        self.category_of = {}  # skill -> category
+        self.aliases = {}      # alias -> skill
+        for category, skills in categories.items():
+            for skill, aliases in skills.items():
+                skill = normalize(skill)
+                if skill in self.category_of:
+                    raise ValueError(f"'{skill}' is listed under both "
+                                     f"'{self.category_of[skill]}' and '{category}'")
+                self.category_of[skill] = category
+                for alias in map(normalize, aliases):
+                    if self.aliases.get(alias, skill) != skill:
+                        raise ValueError(f"Alias '{alias}' is used for both '{self.aliases[alias]}' and '{skill}'")
+                    if alias != skill:
+                        self.aliases[alias] = skill
+
+        clashes = sorted(set(self.aliases) & set(self.category_of))
+        if clashes:
+            raise ValueError(f"Aliases that are also skills: {', '.join(clashes)}")
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_TAXONOMY_PATH) -> 'SkillTaxonomy':
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @property
+    def skills(self) -> List[str]:
+        """Every skill, in file order."""
+        return list(self.category_of)
+
+    def canonical(self, term: str) -> str:
+        """The skill a term stands for ('k8s' -> 'kubernetes'), or None if it is unknown."""
+        term = normalize(term)
+        if term in self.category_of:
+            return term
+        return self.aliases.get(term)
+
+    def roll_up(self, skill_counts: Dict[str, int]) -> Dict[str, int]:
+        """
+        Add up skill counts (e.g. from get_skill_counts) per category.
+        Skills that are not in the taxonomy are counted under 'Other'.
+
+        Returns:
+            Dictionary mapping categories to their total count, most common first
+        """
+        totals = {}
+        for skill, count in skill_counts.items():
+            category = self.category_of.get(skill, 'Other')
+            totals[category] = totals.get(category, 0) + count
+        return dict(sorted(totals.items(), key=lambda item: (-item[1], item[0])))
+
+
+_default_taxonomy = None
+
+
+def get_default_taxonomy() -> SkillTaxonomy:
+    """The taxonomy in skill_taxonomy.json, loaded once."""
+    global _default_taxonomy
+    if _default_taxonomy is None:
+        _default_taxonomy = SkillTaxonomy.load()
+    return _default_taxonomy
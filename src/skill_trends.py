@@ -0,0 +1,198 @@
+"""
+Skill demand over time, from the per-day, per-company buckets of JobStore.skill_days().
+
+Postings are open from the day they were first seen until they expire.
+Buckets hold the skill counts of postings opened ("added") and closed
+("removed") each day, and running totals of both answer any window in
+constant time: the postings open at some point during days [start, end]
+are everything added up to `end` minus everything removed up to `start`
+(a posting removed on day d was last open on day d - 1).
+
+    trends = SkillTrends.from_store(store)
+    trends.window_counts(days=30)           # last 30 days, all companies
+    trends.series(['python', 'sql'])        # weekly trend lines
+"""
+
+import datetime
+import time
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src.job_store import JobStore, day_number
+from src.nlp_processor import get_default_matcher
+
+WINDOWS = (7, 30, 90)
+
+
+def day_to_date(day: int) -> datetime.date:
+    """Calendar date of a day number (see job_store.day_number)."""
+    return datetime.date(1970, 1, 1) + datetime.timedelta(days=int(day))
+
+
+class SkillTrends:
+    """
+    Day x company x skill counts of opened and closed postings, updated with deltas.
+
+    Args:
+        vocabulary: Skill names (e.g. SkillMatcher.vocabulary)
+    """
+
+    def __init__(self, vocabulary: List[str]):
+        self.vocabulary = list(vocabulary)
+        self.skill_index = {skill: i for i, skill in enumerate(self.vocabulary)}
+        self.companies = []
+        self._company_index = {}
+        self.first_day = None
+        self._added = np.zeros((0, 0, len(self.vocabulary)), dtype=np.int64)
+        self._removed = np.zeros_like(self._added)
+        self._running = None  # cached running totals, dropped on every change
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, str, str, int, int]], vocabulary: List[str] = None) -> 'SkillTrends':
+        """Build from (day, company, skill, added, removed) rows (JobStore.skill_days())."""
+        trends = cls(vocabulary or get_default_matcher().vocabulary)
+        rows = [row for row in rows if row[2] in trends.skill_index]
+        if not rows:
+            return trends
+
+        trends.companies = list(dict.fromkeys(row[1] for row in rows))
+        trends._company_index = {company: i for i, company in enumerate(trends.companies)}
+        days = np.array([row[0] for row in rows], dtype=np.int64)
+        trends.first_day = int(days.min())
+        cells = (days - trends.first_day,
+                 np.array([trends._company_index[row[1]] for row in rows]),
+                 np.array([trends.skill_index[row[2]] for row in rows]))
+        shape = (int(days.max()) - trends.first_day + 1, len(trends.companies), len(trends.vocabulary))
+        trends._added = np.zeros(shape, dtype=np.int64)
+        trends._removed = np.zeros(shape, dtype=np.int64)
+        np.add.at(trends._added, cells, np.array([row[3] for row in rows], dtype=np.int64))
+        np.add.at(trends._removed, cells, np.array([row[4] for row in rows], dtype=np.int64))
+        return trends
+
+    @classmethod
+    def from_store(cls, store: JobStore) -> 'SkillTrends':
+        return cls.from_rows(store.skill_days(), store.matcher.vocabulary)
+
+    @property
+    def last_day(self) -> int:
+        return None if self.first_day is None else self.first_day + self._added.shape[0] - 1
+
+    def _make_room(self, day: int, company: str = None) -> Tuple[int, int]:
+        """Grow the arrays to cover `day` (and `company`); returns their positions."""
+        if self.first_day is None:
+            self.first_day = day
+        before = max(0, self.first_day - day)
+        after = max(0, day - self.first_day - self._added.shape[0] + 1)
+        new_company = company is not None and company not in self._company_index
+        if new_company:
+            self._company_index[company] = len(self.companies)
+            self.companies.append(company)
+        if before or after or new_company:
+            padding = ((before, after), (0, 1 if new_company else 0), (0, 0))
+            self._added = np.pad(self._added, padding)
+            self._removed = np.pad(self._removed, padding)
+            self.first_day -= before
+        return day - self.first_day, self._company_index.get(company)
+
+    def _apply(self, column: str, company: str, skills: Dict[str, int], day: int):
+        d, c = self._make_room(day, company)
+        counts = self._added if column == 'added' else self._removed
+        for skill, count in skills.items():
+            if skill in self.skill_index:
+                counts[d, c, self.skill_index[skill]] += count
+        self._running = None
+
+    def add(self, company: str, skills: Dict[str, int], day: int):
+        """A posting opened on `day` (skill -> count)."""
+        self._apply('added', company, skills, day)
+
+    def retract(self, company: str, skills: Dict[str, int], day: int):
+        """A posting closed on `day` (the same skills it was added with)."""
+        self._apply('removed', company, skills, day)
+
+    def _totals(self, company: str = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Running totals of added and removed counts, shape (days + 1) x skills.
+        Row i holds everything up to (not including) day first_day + i.
+        """
+        if self._running is None:
+            zero = np.zeros((1,) + self._added.shape[1:], dtype=np.int64)
+            self._running = {
+                'added': np.concatenate([zero, np.cumsum(self._added, axis=0)]),
+                'removed': np.concatenate([zero, np.cumsum(self._removed, axis=0)]),
+            }
+            self._running['all'] = (self._running['added'].sum(axis=1), self._running['removed'].sum(axis=1))
+        if company is None:
+            return self._running['all']
+        if company not in self._company_index:
+            empty = np.zeros((self._added.shape[0] + 1, len(self.vocabulary)), dtype=np.int64)
+            return empty, empty
+        c = self._company_index[company]
+        return self._running['added'][:, c, :], self._running['removed'][:, c, :]
+
+    def _row(self, days) -> np.ndarray:
+        """Running-total row holding everything up to and including each day."""
+        return np.clip(np.asarray(days) - self.first_day + 1, 0, self._added.shape[0])
+
+    def _ordered(self, counts: np.ndarray) -> Dict[str, int]:
+        # Most common first, ties alphabetically; skills with no postings left out
+        order = sorted((j for j in np.flatnonzero(counts)), key=lambda j: (-counts[j], self.vocabulary[j]))
+        return {self.vocabulary[j]: int(counts[j]) for j in order}
+
+    def _window(self, days: int, end_day: int, company: str) -> np.ndarray:
+        added, removed = self._totals(company)
+        if end_day is None:
+            end_day = day_number(time.time())
+        # Closed on or before the first day of the window = never open during it
+        return added[self._row(end_day)] - removed[self._row(end_day - days + 1)]
+
+    def window_counts(self, days: int = 7, end_day: int = None, company: str = None) -> Dict[str, int]:
+        """
+        Skill counts of the postings open at some point in the last `days` days.
+
+        Args:
+            days: Window length (e.g. 7, 30 or 90)
+            end_day: Last day of the window (default: today)
+            company: Only this company's postings (default: all)
+        """
+        if self.first_day is None:
+            return {}
+        return self._ordered(self._window(days, end_day, company))
+
+    def new_counts(self, days: int = 7, end_day: int = None, company: str = None) -> Dict[str, int]:
+        """Skill counts of the postings first seen in the last `days` days."""
+        if self.first_day is None:
+            return {}
+        if end_day is None:
+            end_day = day_number(time.time())
+        added, _ = self._totals(company)
+        return self._ordered(added[self._row(end_day)] - added[self._row(end_day - days)])
+
+    def change(self, days: int = 7, end_day: int = None, company: str = None) -> Dict[str, int]:
+        """Window counts minus those of the window before (e.g. week over week)."""
+        if self.first_day is None:
+            return {}
+        if end_day is None:
+            end_day = day_number(time.time())
+        delta = self._window(days, end_day, company) - self._window(days, end_day - days, company)
+        order = sorted(np.flatnonzero(delta), key=lambda j: (-abs(delta[j]), self.vocabulary[j]))
+        return {self.vocabulary[j]: int(delta[j]) for j in order}
+
+    def series(self, skills: List[str], period_days: int = 7, periods: int = 52,
+               end_day: int = None, company: str = None) -> Tuple[List[datetime.date], Dict[str, np.ndarray]]:
+        """
+        Trend lines: window counts of consecutive periods (weekly by default).
+
+        Returns:
+            (first date of every period, oldest first; skill -> count per period)
+        """
+        if end_day is None:
+            end_day = day_number(time.time())
+        ends = end_day - period_days * np.arange(periods - 1, -1, -1)
+        dates = [day_to_date(end - period_days + 1) for end in ends]
+        if self.first_day is None:
+            return dates, {skill: np.zeros(periods, dtype=np.int64) for skill in skills}
+        added, removed = self._totals(company)
+        counts = added[self._row(ends)] - removed[self._row(ends - period_days + 1)]
+        return dates, {skill: counts[:, self.skill_index[skill]] for skill in skills if skill in self.skill_index}
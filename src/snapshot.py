@@ -0,0 +1,256 @@
+"""
+Precomputed dashboard data ("snapshots").
+
+A scheduled job (e.g. cron) scrapes, extracts skills and writes a snapshot:
+
+    python -m src.snapshot --live
+
+The app then memory-maps the latest snapshot instead of analyzing postings
+itself, so a dashboard load only reads the few KB it shows.
+
+A snapshot covers the postings that are currently open: everything in the
+store except postings that have expired (not listed for --expire-after days).
+Totals, top skills, per-company counts and the job index all describe that
+current catalog, not every posting ever scraped.
+
+A snapshot is a folder under data/snapshots/:
+    meta.json          creation time, skill vocabulary, company names
+    skill_totals.npy   total count of every skill (vocabulary order; near-duplicate
+                       postings count once, see src/dedup.py)
+    top_skills.npy     skill ids, most common first
+    company_totals.npy companies x skills counts
+    job_indptr.npy, job_indices.npy, job_data.npy
+                       every posting's skills (SkillMatrix), for the job index
+    jobs.arrow         the postings (Arrow IPC file, see JobCollection)
+The LATEST file next to the folders names the newest complete snapshot.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from src.job_collection import JobCollection
+from src.job_index import JobIndex
+from src.dedup import find_duplicate_clusters
+from src.fetch_cache import DEFAULT_CACHE_PATH
+from src.job_store import JobStore, DEFAULT_STORE_PATH
+from src.nlp_processor import SkillMatrix, job_descriptions
+
+DEFAULT_SNAPSHOT_DIR = os.path.join('data', 'snapshots')
+LATEST_FILE = 'LATEST'
+
+
+class Snapshot:
+    """
+    One snapshot folder, memory-mapped (nothing is read until it is used).
+
+    Args:
+        path: The snapshot folder
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.vocabulary = self.meta['vocabulary']
+        self.companies = self.meta['companies']
+
+        self.skill_totals = self._load('skill_totals')
+        self.top_skill_ids = self._load('top_skills')
+        self.company_totals = self._load('company_totals')
+        self.matrix = SkillMatrix(self.vocabulary, self._load('job_indptr'),
+                                  self._load('job_indices'), self._load('job_data'))
+        self._jobs = None
+        self._job_index = None
+
+    def _load(self, name: str) -> np.ndarray:
+        return np.load(os.path.join(self.path, name + '.npy'), mmap_mode='r')
+
+    @property
+    def created_at(self) -> float:
+        return self.meta['created_at']
+
+    @property
+    def jobs(self) -> JobCollection:
+        """The postings, read straight from the memory-mapped Arrow file."""
+        if self._jobs is None:
+            source = pa.memory_map(os.path.join(self.path, 'jobs.arrow'))
+            self._jobs = JobCollection(pa.ipc.open_file(source).read_all())
+        return self._jobs
+
+    @property
+    def duplicates(self) -> int:
+        """Near-duplicate postings left out of the totals (0 for snapshots written without dedup)."""
+        return self.meta.get('duplicates', 0)
+
+    def skill_counts(self) -> Dict[str, int]:
+        """Same as JobStore.skill_counts() when the snapshot was written (minus near-duplicates)."""
+        return {self.vocabulary[j]: int(self.skill_totals[j]) for j in self.top_skill_ids}
+
+    def top_skills(self, n: int = 10) -> List[Tuple[str, int]]:
+        return [(self.vocabulary[j], int(self.skill_totals[j])) for j in self.top_skill_ids[:n]]
+
+    def company_skill_counts(self) -> Dict[str, Dict[str, int]]:
+        """Same as JobStore.company_skill_counts() when the snapshot was written (minus near-duplicates)."""
+        return {company: dict(self.matrix.top_n(np.asarray(self.company_totals[i])))
+                for i, company in enumerate(self.companies)}
+
+    def job_index(self) -> JobIndex:
+        """JobIndex over the snapshot's postings (no skill extraction), built once."""
+        if self._job_index is None:
+            self._job_index = JobIndex(self.jobs, self.matrix)
+        return self._job_index
+
+
+def write_snapshot(store: JobStore, snapshot_dir: str = DEFAULT_SNAPSHOT_DIR, keep: int = 3,
+                   dedup: bool = True) -> str:
+    """
+    Write a snapshot of the store's open postings and make it the latest one.
+
+    The folder is written under a temporary name and renamed when complete,
+    then LATEST is replaced, so readers never see a half-written snapshot.
+
+    Args:
+        store: JobStore with the analyzed postings
+        snapshot_dir: Folder holding the snapshots
+        keep: How many snapshots to keep (older ones are deleted)
+        dedup: Count near-duplicate postings once in the skill and company totals
+            (every posting stays in the job index)
+
+    Returns:
+        Path of the new snapshot folder
+    """
+    jobs, matrix = store.skill_matrix(open_only=True)
+    weights, duplicates = None, 0
+    if dedup:
+        clusters = find_duplicate_clusters(job_descriptions(jobs))
+        weights, duplicates = clusters.weights(), clusters.duplicates
+    totals = matrix.totals(weights)
+    companies, company_totals = matrix.group_totals([job['company'] for job in jobs], weights)
+    top_skill_ids = [matrix.skills.index(skill) for skill, _ in matrix.top_n(totals)]
+
+    os.makedirs(snapshot_dir, exist_ok=True)
+    name = time.strftime('%Y%m%d-%H%M%S')
+    suffix = 1
+    while os.path.exists(os.path.join(snapshot_dir, name)):
+        suffix += 1
+        name = time.strftime('%Y%m%d-%H%M%S') + f'-{suffix}'
+    final_path = os.path.join(snapshot_dir, name)
+    tmp_path = final_path + '.tmp'
+    os.makedirs(tmp_path)
+
+    arrays = {
+        'skill_totals': totals,
+        'top_skills': np.array(top_skill_ids, dtype=np.int32),
+        'company_totals': company_totals.reshape(len(companies), len(matrix.skills)),
+        'job_indptr': matrix.indptr,
+        'job_indices': matrix.indices,
+        'job_data': matrix.data,
+    }
+    for array_name, array in arrays.items():
+        np.save(os.path.join(tmp_path, array_name + '.npy'), array)
+    with pa.OSFile(os.path.join(tmp_path, 'jobs.arrow'), 'wb') as sink:
+        table = JobCollection.from_records(jobs).table
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    with open(os.path.join(tmp_path, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({'created_at': time.time(), 'jobs': len(jobs), 'duplicates': duplicates,
+                   'vocabulary': matrix.skills, 'companies': companies}, f, indent=2)
+    os.replace(tmp_path, final_path)
+
+    latest_tmp = os.path.join(snapshot_dir, LATEST_FILE + '.tmp')
+    with open(latest_tmp, 'w', encoding='utf-8') as f:
+        f.write(name)
+    os.replace(latest_tmp, os.path.join(snapshot_dir, LATEST_FILE))
+
+    _remove_old_snapshots(snapshot_dir, keep)
+    return final_path
+
+
+def _remove_old_snapshots(snapshot_dir: str, keep: int):
+    names = sorted(name for name in os.listdir(snapshot_dir)
+                   if os.path.isdir(os.path.join(snapshot_dir, name)) and not name.endswith('.tmp'))
+    for name in names[:-keep] if keep > 0 else []:
+        # ignore_errors: a running app may still have the old files mapped (Windows)
+        shutil.rmtree(os.path.join(snapshot_dir, name), ignore_errors=True)
+
+
+def latest_snapshot_path(snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> Optional[str]:
+    """Folder of the newest complete snapshot, or None if there is none yet."""
+    try:
+        with open(os.path.join(snapshot_dir, LATEST_FILE), encoding='utf-8') as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None
+    path = os.path.join(snapshot_dir, name)
+    return path if os.path.isdir(path) else None
+
+
+def load_latest_snapshot(snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> Optional[Snapshot]:
+    """The newest snapshot, memory-mapped, or None if there is none yet."""
+    path = latest_snapshot_path(snapshot_dir)
+    return Snapshot(path) if path else None
+
+
+def build_snapshot(store_path: str = DEFAULT_STORE_PATH, snapshot_dir: str = DEFAULT_SNAPSHOT_DIR,
+                   live: bool = False, keep: int = 3, expire_after: float = 7, dedup: bool = True,
+                   scrapers: List = None, cache_path: str = DEFAULT_CACHE_PATH) -> str:
+    """
+    Scrape, extract skills of new postings, update the store and write a new snapshot.
+
+    Args:
+        store_path: JobStore database to update
+        snapshot_dir: Where snapshots are written
+        live: Scrape the real sites (default: test data)
+        keep: Number of snapshots to keep
+        expire_after: Days a posting may go unseen before it counts as closed (live scrapes only;
+            only companies whose scrape finished, so a failed site doesn't close its postings)
+        dedup: Count near-duplicate postings once in the totals
+        scrapers: CompanyScrapers for a live refresh (default: every registered one)
+        cache_path: Fetch cache of live refreshes
+
+    Returns:
+        Path of the new snapshot folder
+    """
+    from src.scraper import iter_job_data
+
+    store = JobStore(store_path)
+    try:
+        completed = set()
+        store.ingest(iter_job_data(use_test_data=not live, cache_path=cache_path if live else None,
+                                   scrapers=scrapers, completed=completed))
+        if live:
+            closed = store.expire_postings(expire_after, companies=completed)
+            print(f"Closed {closed} postings no longer listed"
+                  f" (scraped: {', '.join(sorted(completed)) or 'none'})")
+        return write_snapshot(store, snapshot_dir, keep=keep, dedup=dedup)
+    finally:
+        store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape, extract skills and write a dashboard snapshot.")
+    parser.add_argument('--live', action='store_true', help="Scrape the real sites (default: test data)")
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH, help="JobStore database to update")
+    parser.add_argument('--snapshot-dir', default=DEFAULT_SNAPSHOT_DIR, help="Where snapshots are written")
+    parser.add_argument('--keep', type=int, default=3, help="Number of snapshots to keep")
+    parser.add_argument('--expire-after', type=float, default=7,
+                        help="Days a posting may go unseen before it counts as closed (live scrapes only)")
+    parser.add_argument('--keep-duplicates', action='store_true',
+                        help="Count reposted near-duplicate postings separately in the totals")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    path = build_snapshot(args.store, args.snapshot_dir, live=args.live, keep=args.keep,
+                          expire_after=args.expire_after, dedup=not args.keep_duplicates)
+    print(f"Wrote snapshot {path} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
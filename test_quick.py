@@ -11,4 +11,561 @@ print(f"Found {len(jobs)} jobs")
 print(f"First job: {jobs[0]['title']}")
 
 skills = extract_skills(jobs[0]['description'])
-print(f"Found {len(skills)} skills: {list(skills.keys())}")
\ No newline at end of file
+print(f"Found {len(skills)} skills: {list(skills.keys())}")
+
+# The single-pass SkillMatcher must give the same counts as the old per-skill regex loop
+import re
+from collections import Counter
+from src.nlp_processor import TECHNICAL_SKILLS
+
+def old_extract_skills(text):
+    found = Counter()
+    for skill in TECHNICAL_SKILLS:
+        matches = re.findall(r'\b' + re.escape(skill) + r'\b', text.lower())
+        if matches:
+            found[skill] = len(matches)
+    return found
+
+tricky = "C++, c#, Node.js and CI/CD; Java/JavaScript, GitHub, r&d, c++x, machine learning."
+for text in [job['description'] for job in jobs] + [tricky, ""]:
+    assert extract_skills(text) == old_extract_skills(text), text
+print("SkillMatcher matches the old extractor!")
+
+# Batch extraction gives the same numbers as extracting one job at a time
+from src.nlp_processor import extract_skills_batch
+
+matrix = extract_skills_batch([job['description'] for job in jobs])
+assert matrix.shape == (len(jobs), len(TECHNICAL_SKILLS))
+expected_totals = Counter()
+for i, job in enumerate(jobs):
+    assert matrix.row(i) == extract_skills(job['description'])
+    expected_totals.update(extract_skills(job['description']))
+assert get_skill_counts(jobs) == dict(expected_totals)
+companies, company_counts = matrix.group_totals([job['company'] for job in jobs])
+google = Counter()
+for job in jobs:
+    if job['company'] == 'Google':
+        google.update(extract_skills(job['description']))
+assert dict(matrix.top_n(company_counts[companies.index('Google')])) == dict(google)
+print("Batch extraction matches!")
+
+# Scraping engine against a local stand-in server (no internet needed)
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from src.fetcher import PoliteFetcher
+from src.scraper import scrape_google_jobs
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    flaky_hits = 0
+
+    def do_GET(self):
+        # /flaky/... fails once with 503 so the retry path gets exercised
+        if self.path.startswith('/busy/'):
+            self.send_response(429)
+            self.send_header('Retry-After', '86400')
+            self.end_headers()
+            return
+        if self.path.startswith('/flaky/'):
+            FixtureHandler.flaky_hits += 1
+            if FixtureHandler.flaky_hits == 1:
+                self.send_error(503)
+                return
+            self.path = self.path[len('/flaky'):]
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), partial(FixtureHandler, directory='fixtures'))
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+with PoliteFetcher(per_host_delay=0.05, backoff=0.01) as fetcher:
+    local_jobs = scrape_google_jobs(fetcher=fetcher, url=f"{base_url}/google_jobs.html")
+    assert [job['title'] for job in local_jobs] == ['Software Engineer Intern', 'Data Scientist', 'Frontend Engineer',
+                                                    'Hardware Engineer', 'Site Reliability Engineer']
+    assert local_jobs[2]['url'] == 'N/A'
+    assert len(scrape_google_jobs(max_jobs=4, fetcher=fetcher, url=f"{base_url}/flaky/google_jobs.html")) == 4
+    assert FixtureHandler.flaky_hits == 3  # 503, page 1, page 2
+
+# A Retry-After longer than max_backoff fails right away instead of sleeping for a day
+import time
+import requests
+with PoliteFetcher(per_host_delay=0, max_backoff=5) as fetcher:
+    start = time.perf_counter()
+    try:
+        fetcher.get(f"{base_url}/busy/google_jobs.html")
+        raise AssertionError("a day-long Retry-After was accepted")
+    except requests.HTTPError as e:
+        assert '86400' in str(e) and e.response.status_code == 429
+    assert time.perf_counter() - start < 5
+
+# Second refresh: the server answers 304 for unchanged pages, so nothing is re-parsed
+from src.fetch_cache import FetchCache
+from src.scraper import GoogleScraper
+
+cache = FetchCache(path=None)
+with PoliteFetcher(per_host_delay=0) as fetcher:
+    first = GoogleScraper(f"{base_url}/google_jobs.html").scrape(fetcher, cache)
+    second = GoogleScraper(f"{base_url}/google_jobs.html").scrape(fetcher, cache)
+assert (first['pages_fetched'], len(first['changed_jobs'])) == (2, 5)
+assert (second['pages_unchanged'], second['changed_jobs']) == (2, [])
+assert second['jobs'] == first['jobs']
+
+# A live refresh only closes postings of companies whose scrape finished
+import os
+import shutil
+import tempfile
+from src.job_store import JobStore
+from src.snapshot import build_snapshot
+
+expiry_dir = tempfile.mkdtemp()
+expiry_store_path = os.path.join(expiry_dir, 'jobs.sqlite')
+seeded = JobStore(expiry_store_path)
+seeded.ingest(jobs, now=time.time() - 10 * 24 * 60 * 60)
+seeded.close()
+
+
+def closed_companies():
+    expiry_store = JobStore(expiry_store_path)
+    try:
+        return {company for _, company, _, _, removed in expiry_store.skill_days() if removed}
+    finally:
+        expiry_store.close()
+
+
+# The site is unreachable (429 with a day-long Retry-After): nothing is closed
+build_snapshot(expiry_store_path, os.path.join(expiry_dir, 'snapshots'), live=True, cache_path=None,
+               scrapers=[GoogleScraper(f"{base_url}/busy/google_jobs.html")])
+assert closed_companies() == set()
+# Google's scrape finishes without the old Google postings: only those are closed
+build_snapshot(expiry_store_path, os.path.join(expiry_dir, 'snapshots'), live=True, cache_path=None,
+               scrapers=[GoogleScraper(f"{base_url}/google_jobs.html")])
+assert closed_companies() == {'Google'}
+shutil.rmtree(expiry_dir)
+server.shutdown()
+print("Scraper works against the local fixture server!")
+
+# Persistent job store: duplicates are skipped, aggregates match get_skill_counts
+from src.job_store import JobStore
+
+store = JobStore(':memory:')
+assert store.ingest(jobs) == {'new': 5, 'seen': 0}
+assert store.ingest(jobs + [dict(jobs[0])]) == {'new': 0, 'seen': 5}
+assert list(store.skill_counts().items()) == list(get_skill_counts(jobs).items())
+assert store.company_skill_counts()['Google'] == dict(google)
+stored_jobs, stored_matrix = store.skill_matrix()
+assert all(stored_matrix.row(i) == extract_skills(job['description']) for i, job in enumerate(stored_jobs))
+# Aggregates of just the current postings; the version only moves when the aggregates can change
+version = store.version
+store.ingest(jobs)
+assert store.version == version
+assert store.skill_counts(postings=jobs[2:]) == get_skill_counts(jobs[2:])
+assert store.company_skill_counts(postings=jobs[:2]) == {'Google': get_skill_counts(jobs[:2])}
+
+# Another session storing the same new postings while this one extracts skills (between lookup and insert)
+import threading
+from src.nlp_processor import get_default_matcher
+
+
+class RacingMatcher(type(get_default_matcher())):
+    def find_batch(self, texts):
+        other_session = threading.Thread(target=raced_store.ingest,
+                                         args=(jobs[:2], [extract_skills(job['description']) for job in jobs[:2]]))
+        other_session.start()
+        other_session.join()
+        return super().find_batch(texts)
+
+
+raced_store = JobStore(':memory:')
+raced_store.matcher = RacingMatcher(get_default_matcher().skills, get_default_matcher().aliases)
+assert raced_store.ingest(jobs) == {'new': 3, 'seen': 2}
+assert list(raced_store.skill_counts().items()) == list(get_skill_counts(jobs).items())
+raced_store.close()
+print("Job store works!")
+
+# PDF pages are read lazily, with a page cap and an early stop
+import io
+import os
+import tempfile
+from benchmarks.make_pdf import make_pdf
+from src.nlp_processor import read_pdf_text, iter_pdf_pages
+
+pdf_bytes = make_pdf([["Page one: Python and SQL"], ["Page two: Docker"], ["Page three: AWS"]])
+with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+    f.write(pdf_bytes)
+for source in [pdf_bytes, memoryview(pdf_bytes), bytearray(pdf_bytes), io.BytesIO(pdf_bytes), f.name]:
+    assert read_pdf_text(source) == "Page one: Python and SQL\n\nPage two: Docker\n\nPage three: AWS", source
+assert list(iter_pdf_pages(pdf_bytes, max_pages=2)) == ["Page one: Python and SQL\n", "Page two: Docker\n"]
+assert len(list(iter_pdf_pages(f.name, min_chars=10))) == 1
+assert read_pdf_text(b"not a pdf") == ""
+os.remove(f.name)
+print("PDF parsing works!")
+
+# Ranking every job for a resume gives the same scores as compare_skills job by job
+from src.nlp_processor import compare_skills
+from src.job_index import JobIndex
+
+resume = "Python, SQL, TensorFlow, Java and React developer. Machine learning and Agile."
+ranked = JobIndex(jobs).rank(resume, top_k=3)
+expected = sorted(
+    ((compare_skills(resume, job['description']), i) for i, job in enumerate(jobs)),
+    key=lambda pair: (-pair[0]['score'], -len(pair[0]['skills_you_have']), pair[1]))
+assert [r['job_id'] for r in ranked] == [i for _, i in expected[:3]]
+for r in ranked:
+    assert {k: r[k] for k in expected[0][0]} == compare_skills(resume, r['job']['description'])
+print("Job ranking works!")
+
+# Bitset profiles score whole catalogs at once, same numbers as compare_skills
+from src.skill_profiles import SkillProfiles, match_scores, score_matrix
+from src.nlp_processor import get_default_matcher
+
+job_profiles = SkillProfiles.from_texts(job['description'] for job in jobs)
+resume_profiles = SkillProfiles.from_texts([resume, jobs[1]['description']])
+scores = score_matrix(resume_profiles, job_profiles)
+for i, job in enumerate(jobs):
+    assert scores[0, i] == compare_skills(resume, job['description'])['score']
+    assert job_profiles.skills(i) == sorted(extract_skills(job['description']))
+assert list(match_scores(get_default_matcher().to_mask(extract_skills(resume)), job_profiles)) == list(scores[0])
+assert scores[1, 1] == 100.0
+print("Skill profiles work!")
+
+# Instrumentation records spans only while enabled
+from src import instrumentation
+
+extract_skills_batch([job['description'] for job in jobs])
+assert instrumentation.snapshot()['timings'] == []
+instrumentation.enable()
+extract_skills_batch([job['description'] for job in jobs])
+read_pdf_text(pdf_bytes)
+instrumentation.disable()
+recorded = {t['name']: t['count'] for t in instrumentation.snapshot()['timings']}
+assert recorded == {'skill_extraction_batch': 1, 'pdf_page_parse': 3}, recorded
+assert 'careercompass_documents_extracted_total 5' in instrumentation.prometheus_text()
+instrumentation.reset()
+print("Instrumentation works!")
+
+# Streaming pipeline: scrape -> extract -> running aggregate gives the batch results
+from src.scraper import iter_job_data
+from src.nlp_processor import iter_extracted, SkillAggregator
+
+aggregator = SkillAggregator()
+updates = [agg.jobs_seen for agg in aggregator.consume(iter_extracted(iter_job_data(use_test_data=True)), every=2)]
+assert updates == [2, 4, 5]
+assert list(aggregator.skill_counts().items()) == list(get_skill_counts(jobs).items())
+assert aggregator.company_skill_counts()['Google'] == dict(google)
+
+# Live scrapers stream through a bounded buffer, and stopping early stops them
+server = ThreadingHTTPServer(('127.0.0.1', 0), partial(FixtureHandler, directory='fixtures'))
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base_url = f"http://127.0.0.1:{server.server_address[1]}"
+with PoliteFetcher(per_host_delay=0) as fetcher:
+    scrapers = [GoogleScraper(f"{base_url}/google_jobs.html"), GoogleScraper(f"{base_url}/google_jobs_page2.html")]
+    streamed = list(fetcher.iter_all([s.iter_jobs for s in scrapers], buffer_size=1))
+    assert sorted(job['title'] for job in streamed) == sorted(
+        ['Software Engineer Intern', 'Data Scientist', 'Frontend Engineer', 'Hardware Engineer',
+         'Site Reliability Engineer', 'Hardware Engineer', 'Site Reliability Engineer'])
+    first = next(iter(fetcher.iter_all([scrapers[0].iter_jobs], buffer_size=1)))
+    assert first['company'] == 'Google'
+server.shutdown()
+print("Streaming pipeline works!")
+
+# Every installed HTML backend parses the fixture pages the same way
+from src.page_parser import available_backends, _strainer
+
+for page in ['google_jobs.html', 'google_jobs_page2.html']:
+    with open(f'fixtures/{page}', 'rb') as f:
+        html = f.read()
+    results = [GoogleScraper(html_backend=backend).parse_page(html, 'http://example.com/jobs/')
+               for backend in available_backends()]
+    assert all(result == results[0] for result in results), page
+assert results[0][1] is None and len(results[0][0]) == 2
+assert _strainer(['div.job-card', 'a.next-page']) is not None
+assert _strainer(['div.job-list > div.job-card']) is None  # can't strain, parse everything
+print(f"HTML parsing works ({', '.join(available_backends())})!")
+
+# Heavy libraries are only imported when they are used
+import subprocess
+import sys
+
+check = ("import sys, src.scraper, src.nlp_processor; "
+         "print(sorted(m for m in ('PyPDF2', 'requests', 'bs4', 'spacy') if m in sys.modules))")
+assert subprocess.run([sys.executable, '-c', check], capture_output=True, text=True).stdout.strip() == '[]'
+print("Lazy imports work!")
+
+# Columnar JobCollection works anywhere a list of job dictionaries does
+from src.job_collection import JobCollection
+from src.job_store import posting_hash
+
+collection = JobCollection.from_records(jobs)
+assert len(collection) == len(jobs) and collection.to_records() == jobs
+assert collection[1] == jobs[1] and posting_hash(collection[1]) == posting_hash(jobs[1])
+assert collection[1:3].to_records() == jobs[1:3]
+assert collection.companies() == list(dict.fromkeys(job['company'] for job in jobs))
+assert collection.for_company('Google').to_records() == [job for job in jobs if job['company'] == 'Google']
+assert list(get_skill_counts(collection).items()) == list(get_skill_counts(jobs).items())
+assert JobIndex(collection).rank(resume) == JobIndex(jobs).rank(resume)
+assert str(collection.to_pandas()['company'].dtype) == 'category'
+print("Job collection works!")
+
+# Resume and job analyses are cached (bounded LRU with a TTL)
+import time
+from src.analysis_cache import LRUCache, analyze_resume, match_resume
+from src.nlp_processor import compare_skills
+
+lru = LRUCache(max_entries=2, ttl_seconds=0.05)
+lru.put('a', 1)
+lru.put('b', 2)
+lru.get('a')
+lru.put('c', 3)  # evicts 'b', the least recently used
+assert (lru.get('a'), lru.get('b'), lru.get('c')) == (1, None, 3)
+time.sleep(0.06)
+assert lru.get('a') is None and lru.get('c') is None and len(lru) == 0
+
+resume_cache = LRUCache()
+first = analyze_resume(pdf_bytes, cache=resume_cache)
+assert analyze_resume(bytes(pdf_bytes), cache=resume_cache) is first  # same file: PDF not parsed again
+assert (resume_cache.hits, resume_cache.misses) == (1, 1)
+assert set(first['skills']) == {'python', 'sql', 'docker', 'aws'}
+for job in jobs:
+    assert match_resume(first, job) == compare_skills(first['text'], job['description'])
+print("Analysis caches work!")
+
+# Snapshots hold the same aggregates and job index as the store they were written from
+import shutil
+from src.snapshot import Snapshot, write_snapshot, load_latest_snapshot
+
+snapshot_dir = tempfile.mkdtemp()
+store = JobStore(':memory:')
+store.ingest(jobs)
+assert load_latest_snapshot(snapshot_dir) is None
+for _ in range(3):
+    write_snapshot(store, snapshot_dir, keep=2)
+assert len([name for name in os.listdir(snapshot_dir) if name != 'LATEST']) == 2
+snapshot = load_latest_snapshot(snapshot_dir)
+assert list(snapshot.skill_counts().items()) == list(store.skill_counts().items())
+assert snapshot.company_skill_counts() == store.company_skill_counts()
+assert snapshot.jobs.to_records() == jobs
+assert snapshot.job_index().rank(resume) == JobIndex(jobs).rank(resume)
+store.close()
+del snapshot  # release the memory-mapped files before deleting them
+shutil.rmtree(snapshot_dir)
+print("Snapshots work!")
+
+# Skill trends: day buckets updated with deltas, windows answered from running totals
+from src.job_store import DAY_SECONDS, day_number
+from src.skill_trends import SkillTrends
+
+store = JobStore(':memory:')
+today = day_number(time.time())
+store.ingest(jobs[:2], now=(today - 20) * DAY_SECONDS)  # seen 20 days ago, then gone
+store.ingest(jobs[2:], now=(today - 3) * DAY_SECONDS)   # still listed
+version = store.version
+assert store.expire_postings(max_age_days=7) == 2
+assert store.version > version and len(store) == len(jobs)  # same row count, new version
+# Closed postings leave the aggregates, the job list and the snapshots written from the store
+assert store.skill_counts() == get_skill_counts(jobs[2:])
+assert store.skill_counts(open_only=False) == get_skill_counts(jobs)
+assert store.jobs() == jobs[2:] and store.skill_matrix()[0] == jobs[2:]
+assert 'Google' not in store.company_skill_counts()
+snapshot_dir = tempfile.mkdtemp()
+snapshot = Snapshot(write_snapshot(store, snapshot_dir))
+assert snapshot.jobs.to_records() == jobs[2:] and snapshot.skill_counts() == get_skill_counts(jobs[2:])
+assert snapshot.job_index().rank(resume) == JobIndex(jobs[2:]).rank(resume)
+del snapshot
+shutil.rmtree(snapshot_dir)
+trends = SkillTrends.from_store(store)
+assert trends.window_counts(7) == dict(get_skill_counts(jobs[2:]))
+assert trends.window_counts(30) == dict(get_skill_counts(jobs))
+assert trends.new_counts(7) == dict(get_skill_counts(jobs[2:]))
+assert trends.window_counts(30, company='Google') == dict(google)
+assert trends.change(7)['python'] == get_skill_counts(jobs[2:])['python']
+dates, series = trends.series(['python'], period_days=7, periods=4)
+assert list(series['python']) == [0, get_skill_counts(jobs[:2])['python'], 0, get_skill_counts(jobs[2:])['python']]
+
+# The same deltas applied one by one give the same buckets
+incremental = SkillTrends(trends.vocabulary)
+for day, company, skill, added, removed in store.skill_days():
+    incremental.add(company, {skill: added}, day)
+    incremental.retract(company, {skill: removed}, day)
+assert incremental.window_counts(30) == trends.window_counts(30)
+
+# A posting that comes back is open again
+store.ingest(jobs[:1])
+assert SkillTrends.from_store(store).window_counts(1) == dict(get_skill_counts(jobs[:1] + jobs[2:]))
+assert store.skill_counts() == get_skill_counts(jobs[:1] + jobs[2:])
+store.close()
+print("Skill trends work!")
+
+# Batch matching: a folder of resumes against every job, same scores as compare_skills
+from src.batch_match import batch_match, find_resumes, read_resumes
+
+resume_dir = tempfile.mkdtemp()
+with open(os.path.join(resume_dir, 'ana.pdf'), 'wb') as f:
+    f.write(make_pdf([["Ana Lopez", "Python, SQL and TensorFlow for machine learning."]]))
+with open(os.path.join(resume_dir, 'luis.txt'), 'w', encoding='utf-8') as f:
+    f.write("Luis Garcia\nAutoCAD, MATLAB and SolidWorks.")
+resumes = read_resumes(find_resumes(resume_dir), workers=2)
+assert sorted(resumes) == ['ana', 'luis'] and 'TensorFlow' in resumes['ana']
+matches, gaps = batch_match(resumes, jobs, top_k=2)
+assert len(matches) == 4 and list(matches['rank']) == [1, 2, 1, 2]
+for row in matches.itertuples():
+    job = next(job for job in jobs if job['url'] == row.url)
+    expected = compare_skills(resumes[row.member], job['description'])
+    assert row.score == expected['score']
+    assert row.skills_you_are_missing == ', '.join(expected['skills_you_are_missing'])
+assert 'solidworks' not in set(gaps[gaps['member'] == 'luis']['skill'])
+assert set(gaps[gaps['member'] == 'ana']['skill']) >= {'solidworks', 'autocad'}
+
+# Job skills extracted with another vocabulary (an older snapshot) are extracted again
+from src.nlp_processor import SkillMatcher, extract_skills_batch
+fewer_skills = extract_skills_batch([job['description'] for job in jobs], SkillMatcher(TECHNICAL_SKILLS - {'agile'}))
+other_skills = extract_skills_batch([job['description'] for job in jobs],
+                                    SkillMatcher(TECHNICAL_SKILLS - {'agile'} | {'fortran'}))
+assert len(other_skills.skills) == len(TECHNICAL_SKILLS)
+for stale in (fewer_skills, other_skills):
+    stale_matches, stale_gaps = batch_match(resumes, jobs, top_k=2, job_matrix=stale)
+    assert stale_matches.equals(matches) and stale_gaps.equals(gaps)
+
+# Two files for one member are an error, not a silently dropped resume
+with open(os.path.join(resume_dir, 'ana.txt'), 'w', encoding='utf-8') as f:
+    f.write("Ana Lopez\nJava")
+try:
+    read_resumes(find_resumes(resume_dir), workers=1)
+    raise AssertionError("duplicate resume names were not detected")
+except ValueError as e:
+    assert 'ana.pdf' in str(e) and 'ana.txt' in str(e)
+shutil.rmtree(resume_dir)
+print("Batch matching works!")
+
+# Skill taxonomy: aliases count as their skill in the same single pass, categories roll up the counts
+from src.skill_taxonomy import SkillTaxonomy, get_default_taxonomy
+from src.nlp_processor import SkillMatcher
+
+taxonomy = get_default_taxonomy()
+assert set(taxonomy.skills) == TECHNICAL_SKILLS
+assert taxonomy.canonical('K8s') == 'kubernetes' and taxonomy.canonical('Postgres') == 'postgresql'
+text = "JS, ReactJS and React.js on Node.js; Postgres, k8s, sklearn and ML; Microsoft Excel."
+assert extract_skills(text) == Counter({'react': 2, 'javascript': 1, 'node.js': 1, 'postgresql': 1,
+                                        'kubernetes': 1, 'scikit-learn': 1, 'machine learning': 1, 'excel': 1})
+assert SkillMatcher(TECHNICAL_SKILLS).find(text) == Counter({'react': 1, 'node.js': 1, 'excel': 1})
+
+by_category = get_skill_counts(jobs, by_category=True)
+assert sum(by_category.values()) == sum(get_skill_counts(jobs).values())
+assert by_category['Programming Languages'] == sum(
+    count for skill, count in get_skill_counts(jobs).items() if taxonomy.category_of[skill] == 'Programming Languages')
+try:
+    SkillTaxonomy({'Languages': {'matlab': []}, 'Tools': {'matlab': []}})
+    assert False, "duplicate skill accepted"
+except ValueError:
+    pass
+print("Skill taxonomy works!")
+
+# Token backend: one tokenization + hash lookups, same counts as the regex backend
+from src.nlp_processor import TokenMatcher, set_extraction_backend, get_default_matcher
+
+aliases = get_default_taxonomy().aliases
+regex_matcher = SkillMatcher(TECHNICAL_SKILLS, aliases)
+token_matcher = TokenMatcher(TECHNICAL_SKILLS, aliases)
+samples = [job['description'] for job in jobs] + [tricky, text, "", "c++x c#d node.jsx", "machine  learning",
+                                                  "Google Cloud Platform / google cloud, object-oriented programming"]
+for sample in samples:
+    assert token_matcher.find(sample) == regex_matcher.find(sample), sample
+assert SkillMatcher([]).find("abc python") == TokenMatcher([]).find("abc python") == Counter()
+
+regex_counts = get_skill_counts(jobs)
+set_extraction_backend('tokens')
+assert isinstance(get_default_matcher(), TokenMatcher)
+assert get_skill_counts(jobs) == get_skill_counts(jobs, workers=2) == regex_counts
+set_extraction_backend('regex')
+assert type(get_default_matcher()) is SkillMatcher
+print("Token extraction backend works!")
+
+# spaCy backend: blank pipeline + PhraseMatcher, texts batched through nlp.pipe
+from src.nlp_processor import SpacyMatcher
+
+spacy_matcher = SpacyMatcher(TECHNICAL_SKILLS, aliases, batch_size=2)
+assert spacy_matcher._nlp.pipe_names == []  # tokenizer only
+# Whole tokens: 'C++,' counts (the regex needs a word character after '+'), 'r' inside 'r&d' doesn't
+for sample in [job['description'] for job in jobs] + [text]:
+    found, expected = spacy_matcher.find(sample), regex_matcher.find(sample)
+    assert {skill for skill in set(found) | set(expected) if found[skill] != expected[skill]} <= {'c++', 'c#'}, sample
+assert spacy_matcher.find("C++, C#, R and r&d") == Counter({'c++': 1, 'c#': 1, 'r': 1})
+assert list(spacy_matcher.find_batch(samples)) == [spacy_matcher.find(sample) for sample in samples]
+assert spacy_matcher.key != regex_matcher.key and token_matcher.key == regex_matcher.key
+spacy_counts = Counter()
+for job in jobs:
+    spacy_counts.update(spacy_matcher.find(job['description']))
+set_extraction_backend('spacy')
+assert get_skill_counts(jobs) == dict(spacy_counts)
+set_extraction_backend('regex')
+print("spaCy extraction backend works!")
+
+# Background refresher: rebuilds snapshots on its own thread and swaps in each finished one
+from src.refresher import SnapshotRefresher
+from src.snapshot import build_snapshot
+
+refresh_dir = tempfile.mkdtemp()
+refresh_store = os.path.join(refresh_dir, 'jobs.sqlite')
+snapshot_dir = os.path.join(refresh_dir, 'snapshots')
+refresher = SnapshotRefresher(interval_seconds=3600, jitter=0.1, snapshot_dir=snapshot_dir,
+                              build=lambda: build_snapshot(refresh_store, snapshot_dir, keep=5))
+assert refresher.snapshot is None
+assert all(3240 <= refresher.next_delay() <= 3960 for _ in range(100))
+refresher.start()
+deadline = time.time() + 30
+while refresher.snapshot is None and time.time() < deadline:
+    time.sleep(0.05)
+first = refresher.snapshot
+assert first is not None and refresher.refreshes == 1 and refresher.last_error is None
+assert len(first.jobs) == len(jobs)
+
+refresher.request_refresh()  # the caller doesn't wait; the thread builds a new snapshot
+while refresher.snapshot is first and time.time() < deadline:
+    time.sleep(0.05)
+assert refresher.snapshot is not first and refresher.refreshes == 2
+assert first.skill_counts() == refresher.snapshot.skill_counts()  # the old one is still readable
+refresher.stop(timeout=10)
+
+# A new enough snapshot on disk is adopted instead of scraping again
+again = SnapshotRefresher(interval_seconds=3600, snapshot_dir=snapshot_dir, build=lambda: 1 / 0)
+assert again.refresh().path == refresher.snapshot.path and again.refreshes == 0
+del first, again, refresher
+shutil.rmtree(refresh_dir)
+print("Background refresher works!")
+
+# Near-duplicate detection: reposts of one role count once, each distinct posting still counts
+from src.dedup import dedupe_jobs, find_duplicate_clusters
+from src.job_store import JobStore
+from src.snapshot import Snapshot, write_snapshot
+
+reposts = [dict(job, description=job['description'] + ' Location: Austin, TX.', url=job['url'] + '?austin')
+           for job in jobs[:2]]
+with_reposts = jobs + reposts
+clusters = find_duplicate_clusters([job['description'] for job in with_reposts] + [''])
+assert len(clusters) == len(jobs) + 1 and clusters.duplicates == 2
+assert list(clusters.labels[len(jobs):]) == [0, 1, len(with_reposts)]
+assert clusters.members() == {0: [0, len(jobs)], 1: [1, len(jobs) + 1]}
+assert list(clusters.weights('posting')[:2]) == [2, 2] and clusters.weights().sum() == len(clusters)
+unique_jobs, _ = dedupe_jobs(with_reposts)
+assert unique_jobs == jobs
+assert get_skill_counts(with_reposts, dedup=True) == get_skill_counts(jobs)
+assert get_skill_counts(with_reposts, dedup=True, workers=2) == get_skill_counts(jobs)
+
+dedup_dir = tempfile.mkdtemp()
+dedup_store = JobStore(os.path.join(dedup_dir, 'jobs.sqlite'))
+dedup_store.ingest(with_reposts)
+snapshot = Snapshot(write_snapshot(dedup_store, os.path.join(dedup_dir, 'snapshots')))
+assert snapshot.duplicates == 2 and len(snapshot.jobs) == len(with_reposts)  # every posting stays listed
+assert snapshot.skill_counts() == get_skill_counts(jobs)
+original_store = JobStore(':memory:')
+original_store.ingest(jobs)
+assert snapshot.company_skill_counts() == original_store.company_skill_counts()
+original_store.close()
+kept = Snapshot(write_snapshot(dedup_store, os.path.join(dedup_dir, 'snapshots'), dedup=False))
+assert kept.skill_counts() == dedup_store.skill_counts() == get_skill_counts(with_reposts)
+dedup_store.close()
+del snapshot, kept
+shutil.rmtree(dedup_dir)
+print("Near-duplicate detection works!")